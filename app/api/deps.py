@@ -1,32 +1,68 @@
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional, Union
 
-from fastapi import Depends, Header
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Depends, Header, Request
 from sqlalchemy import select
 
 from app.core.security import verify_access_token
 from app.core.exceptions import UnauthorizedException, NotFoundException
-from app.db.session import get_db
+from app.core.user_cache import get_cached_user, get_shared_user, share_user
+from app.db.session import AsyncSessionLocal
 from app.db.models import User
 
 
+async def _authenticate(
+    request: Request,
+    authorization: Optional[str] = Header(None, description="Bearer token"),
+) -> Union[User, Exception, None]:
+    # Shared by get_current_user and get_optional_user through FastAPI's
+    # dependency cache. The outcome (user or auth error) is also memoized on
+    # the request so direct re-entry skips token checks and the DB.
+    if not authorization:
+        return None
+
+    result = getattr(request.state, "auth_result", None)
+    if result is None:
+        try:
+            result = await _resolve_user(authorization)
+        except (UnauthorizedException, NotFoundException) as exc:
+            result = exc
+        request.state.auth_result = result
+
+    return result
+
+
 async def get_current_user(
-    authorization: str = Header(..., description="Bearer token"),
-    db: AsyncSession = Depends(get_db),
+    auth_result: Union[User, Exception, None] = Depends(_authenticate),
 ) -> User:
+    if auth_result is None:
+        raise UnauthorizedException("Token tidak ditemukan")
+    if isinstance(auth_result, Exception):
+        raise auth_result
+    return auth_result
+
+
+async def _resolve_user(authorization: str) -> User:
     if not authorization.startswith("Bearer "):
         raise UnauthorizedException("Format token tidak valid")
 
-    token = authorization.replace("Bearer ", "")
+    token = authorization[7:]
     user_id = verify_access_token(token)
 
+    user = get_cached_user(user_id) or await get_shared_user(user_id)
+    if user is not None:
+        return user
+
+    # Only open a session on a cache miss; anonymous requests and cached
+    # users never touch the pool.
     query = select(User).where(User.id == user_id, User.deleted_at.is_(None))
-    result = await db.execute(query)
-    user = result.scalar_one_or_none()
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(query)
+        user = result.scalar_one_or_none()
 
     if not user:
         raise NotFoundException("Pengguna tidak ditemukan")
 
+    await share_user(user)
     return user
 
 
@@ -39,13 +75,8 @@ async def get_current_active_user(
 
 
 async def get_optional_user(
-    authorization: str = Header(None, description="Bearer token (optional)"),
-    db: AsyncSession = Depends(get_db),
+    auth_result: Union[User, Exception, None] = Depends(_authenticate),
 ) -> User | None:
-    if not authorization:
-        return None
-
-    try:
-        return await get_current_user(authorization, db)
-    except (UnauthorizedException, NotFoundException):
+    if isinstance(auth_result, Exception):
         return None
+    return auth_result
@@ -1,18 +1,27 @@
-from fastapi import APIRouter, Depends, status
+import asyncio
+
+from fastapi import APIRouter, Depends, Response, status
 
 from app.api.deps import get_current_user
 from app.api.v1.ai.schemas import (
+    AIBatchRequest,
+    AIBatchResponse,
+    AITaskResponse,
+    AITaskStatusResponse,
+    EnhanceStoryBatchItem,
     EnhanceStoryRequest,
     EnhanceStoryResponse,
     FollowUpQuestionsResponse,
+    GenerateFollowUpBatchItem,
     GenerateFollowUpRequest,
     GetPromptsRequest,
     PromptsResponse,
     SuggestTitleRequest,
     SuggestTitleResponse,
 )
+from app.core.exceptions import NotFoundException
 from app.db.models import User
-from app.services.ai_service import AIService
+from app.services.ai_service import AIService, get_ai_service
 
 router = APIRouter()
 
@@ -26,17 +35,20 @@ router = APIRouter()
 )
 async def get_prompts(
     request: GetPromptsRequest,
+    response: Response,
     current_user: User = Depends(get_current_user),
+    ai_service: AIService = Depends(get_ai_service),
 ) -> PromptsResponse:
-    ai_service = AIService()
-    
     prompts = ai_service.get_circle_prompts(
         circle_type=request.circle_type,
         category=request.category,
         count=request.count,
         randomize=request.randomize,
     )
-    
+
+    if not request.randomize:
+        response.headers["Cache-Control"] = "public, max-age=300"
+
     return PromptsResponse(
         prompts=prompts,
         circle_type=request.circle_type,
@@ -54,15 +66,14 @@ async def get_prompts(
 async def enhance_story(
     request: EnhanceStoryRequest,
     current_user: User = Depends(get_current_user),
+    ai_service: AIService = Depends(get_ai_service),
 ) -> EnhanceStoryResponse:
-    ai_service = AIService()
-    
     result = await ai_service.enhance_story_transcript(
         transcript=request.transcript,
         circle_type=request.circle_type,
         context=request.context,
     )
-    
+
     return EnhanceStoryResponse(
         enhanced_text=result["enhanced_text"],
         improvements=result.get("improvements", []),
@@ -82,15 +93,14 @@ async def enhance_story(
 async def generate_follow_up_questions(
     request: GenerateFollowUpRequest,
     current_user: User = Depends(get_current_user),
+    ai_service: AIService = Depends(get_ai_service),
 ) -> FollowUpQuestionsResponse:
-    ai_service = AIService()
-    
     questions = await ai_service.generate_follow_up_questions(
         transcript=request.transcript,
         circle_type=request.circle_type,
         count=request.count,
     )
-    
+
     return FollowUpQuestionsResponse(
         questions=questions,
         circle_type=request.circle_type,
@@ -107,12 +117,139 @@ async def generate_follow_up_questions(
 async def suggest_title(
     request: SuggestTitleRequest,
     current_user: User = Depends(get_current_user),
+    ai_service: AIService = Depends(get_ai_service),
 ) -> SuggestTitleResponse:
-    ai_service = AIService()
-    
     title = await ai_service.suggest_story_title(
         transcript=request.transcript,
         max_length=request.max_length,
     )
-    
+
     return SuggestTitleResponse(title=title)
+
+
+@router.post(
+    "/batch",
+    response_model=AIBatchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Jalankan beberapa permintaan AI sekaligus",
+    description="Menjalankan beberapa permintaan enhance, follow-up, dan suggest-title secara bersamaan. "
+    "Hasil dikembalikan sesuai urutan permintaan.",
+)
+async def batch(
+    request: AIBatchRequest,
+    current_user: User = Depends(get_current_user),
+    ai_service: AIService = Depends(get_ai_service),
+) -> AIBatchResponse:
+    async def dispatch(item):
+        if isinstance(item, EnhanceStoryBatchItem):
+            return await enhance_story(item, current_user, ai_service)
+        if isinstance(item, GenerateFollowUpBatchItem):
+            return await generate_follow_up_questions(item, current_user, ai_service)
+        return await suggest_title(item, current_user, ai_service)
+
+    results = await asyncio.gather(*(dispatch(item) for item in request.requests))
+
+    return AIBatchResponse(results=list(results))
+
+
+def _task_response(task_id: str) -> AITaskResponse:
+    return AITaskResponse(task_id=task_id, status_url=f"/api/v1/ai/tasks/{task_id}")
+
+
+@router.post(
+    "/enhance/async",
+    response_model=AITaskResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Sempurnakan transkrip cerita di latar belakang",
+    description="Sama seperti /enhance, tetapi langsung mengembalikan ID tugas. "
+    "Hasil diambil melalui /ai/tasks/{task_id}.",
+)
+async def enhance_story_async(
+    request: EnhanceStoryRequest,
+    current_user: User = Depends(get_current_user),
+) -> AITaskResponse:
+    from app.tasks.ai import enhance_story_task
+
+    task = enhance_story_task.delay(
+        current_user.id, request.transcript, request.circle_type, request.context
+    )
+    return _task_response(task.id)
+
+
+@router.post(
+    "/follow-up/async",
+    response_model=AITaskResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Generate pertanyaan lanjutan di latar belakang",
+    description="Sama seperti /follow-up, tetapi langsung mengembalikan ID tugas. "
+    "Hasil diambil melalui /ai/tasks/{task_id}.",
+)
+async def generate_follow_up_questions_async(
+    request: GenerateFollowUpRequest,
+    current_user: User = Depends(get_current_user),
+) -> AITaskResponse:
+    from app.tasks.ai import generate_follow_up_task
+
+    task = generate_follow_up_task.delay(
+        current_user.id, request.transcript, request.circle_type, request.count
+    )
+    return _task_response(task.id)
+
+
+@router.post(
+    "/suggest-title/async",
+    response_model=AITaskResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Sarankan judul cerita di latar belakang",
+    description="Sama seperti /suggest-title, tetapi langsung mengembalikan ID tugas. "
+    "Hasil diambil melalui /ai/tasks/{task_id}.",
+)
+async def suggest_title_async(
+    request: SuggestTitleRequest,
+    current_user: User = Depends(get_current_user),
+) -> AITaskResponse:
+    from app.tasks.ai import suggest_title_task
+
+    task = suggest_title_task.delay(
+        current_user.id, request.transcript, request.max_length
+    )
+    return _task_response(task.id)
+
+
+@router.get(
+    "/tasks/{task_id}",
+    response_model=AITaskStatusResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Status tugas AI",
+    description="Mendapatkan status dan hasil tugas AI yang berjalan di latar belakang.",
+)
+async def get_ai_task(
+    task_id: str,
+    current_user: User = Depends(get_current_user),
+) -> AITaskStatusResponse:
+    from app.tasks.celery_app import celery_app
+
+    task = celery_app.AsyncResult(task_id)
+
+    if task.state == "SUCCESS":
+        outcome = task.result
+        if outcome.get("user_id") != current_user.id:
+            raise NotFoundException("Tugas tidak ditemukan")
+        return AITaskStatusResponse(
+            task_id=task_id,
+            status=outcome["status"],
+            result=outcome.get("result"),
+            error=outcome.get("error"),
+        )
+
+    if task.state == "FAILURE":
+        return AITaskStatusResponse(
+            task_id=task_id,
+            status="failed",
+            error={"code": "AI_TASK_FAILED", "message": "Tugas AI gagal. Silakan coba lagi."},
+        )
+
+    return AITaskStatusResponse(
+        task_id=task_id,
+        status="processing" if task.state == "STARTED" else "pending",
+    )
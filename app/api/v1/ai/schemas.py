@@ -1,9 +1,11 @@
-from typing import List, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class GetPromptsRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
+
     circle_type: str = Field(..., description="Tipe lingkaran (keluarga, pasangan, sahabat, dll)")
     category: Optional[str] = Field(None, description="Kategori prompts (opsional)")
     count: int = Field(3, ge=1, le=10, description="Jumlah prompts yang diinginkan")
@@ -17,6 +19,8 @@ class PromptsResponse(BaseModel):
 
 
 class EnhanceStoryRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
+
     transcript: str = Field(..., min_length=10, description="Transkrip cerita yang akan disempurnakan")
     circle_type: str = Field(..., description="Tipe lingkaran untuk konteks")
     context: Optional[str] = Field(None, max_length=500, description="Konteks tambahan (opsional)")
@@ -31,6 +35,8 @@ class EnhanceStoryResponse(BaseModel):
 
 
 class GenerateFollowUpRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
+
     transcript: str = Field(..., min_length=10, description="Transkrip cerita")
     circle_type: str = Field(..., description="Tipe lingkaran untuk konteks")
     count: int = Field(3, ge=1, le=5, description="Jumlah pertanyaan lanjutan")
@@ -42,9 +48,53 @@ class FollowUpQuestionsResponse(BaseModel):
 
 
 class SuggestTitleRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
+
     transcript: str = Field(..., min_length=10, description="Transkrip cerita")
     max_length: int = Field(60, ge=20, le=100, description="Panjang maksimal judul")
 
 
 class SuggestTitleResponse(BaseModel):
     title: str = Field(..., description="Judul yang disarankan")
+
+
+class EnhanceStoryBatchItem(EnhanceStoryRequest):
+    kind: Literal["enhance"]
+
+
+class GenerateFollowUpBatchItem(GenerateFollowUpRequest):
+    kind: Literal["follow_up"]
+
+
+class SuggestTitleBatchItem(SuggestTitleRequest):
+    kind: Literal["suggest_title"]
+
+
+AIBatchItem = Annotated[
+    Union[EnhanceStoryBatchItem, GenerateFollowUpBatchItem, SuggestTitleBatchItem],
+    Field(discriminator="kind"),
+]
+
+
+class AIBatchRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
+
+    requests: List[AIBatchItem] = Field(..., min_length=1, max_length=10, description="Daftar permintaan AI")
+
+
+class AIBatchResponse(BaseModel):
+    results: List[Union[EnhanceStoryResponse, FollowUpQuestionsResponse, SuggestTitleResponse]] = Field(
+        ..., description="Hasil sesuai urutan permintaan"
+    )
+
+
+class AITaskResponse(BaseModel):
+    task_id: str = Field(..., description="ID tugas AI")
+    status_url: str = Field(..., description="URL untuk memeriksa status tugas")
+
+
+class AITaskStatusResponse(BaseModel):
+    task_id: str = Field(..., description="ID tugas AI")
+    status: Literal["pending", "processing", "success", "failed"] = Field(..., description="Status tugas")
+    result: Optional[Dict[str, Any]] = Field(None, description="Hasil jika tugas berhasil")
+    error: Optional[Dict[str, Any]] = Field(None, description="Detail kesalahan jika tugas gagal")
@@ -1,7 +1,6 @@
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db
 from app.api.v1.auth.schemas import (
     LogoutResponse,
     RefreshTokenRequest,
@@ -14,6 +13,7 @@ from app.api.v1.auth.schemas import (
 from app.core.config import settings
 from app.core.exceptions import UnauthorizedException
 from app.core.security import verify_refresh_token
+from app.db.session import get_db
 from app.services.auth_service import AuthService
 from app.services.otp_service import OTPService
 
@@ -1,10 +1,29 @@
 import re
 from typing import Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+_PHONE_RE = re.compile(r"^\+62[0-9]{8,13}$")
+_PHONE_STRIP = str.maketrans("", "", " -")
+
+
+def _normalize_phone(v: str) -> str:
+    v = v.strip().translate(_PHONE_STRIP)
+    if v.startswith("0"):
+        v = "+62" + v[1:]
+    elif v.startswith("62"):
+        v = "+" + v
+    elif not v.startswith("+"):
+        v = "+62" + v
+
+    if not _PHONE_RE.match(v):
+        raise ValueError("Nomor telepon tidak valid. Gunakan format Indonesia (+62xxx)")
+    return v
 
 
 class RequestOTPRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
+
     phone_number: str = Field(
         ...,
         min_length=10,
@@ -15,20 +34,7 @@ class RequestOTPRequest(BaseModel):
     @field_validator("phone_number")
     @classmethod
     def validate_phone_number(cls, v: str) -> str:
-        v = v.strip().replace(" ", "").replace("-", "")
-        if v.startswith("0"):
-            v = "+62" + v[1:]
-        elif v.startswith("62"):
-            v = "+" + v
-        elif not v.startswith("+"):
-            v = "+62" + v
-
-        pattern = r"^\+62[0-9]{8,13}$"
-        if not re.match(pattern, v):
-            raise ValueError(
-                "Nomor telepon tidak valid. Gunakan format Indonesia (+62xxx)"
-            )
-        return v
+        return _normalize_phone(v)
 
 
 class RequestOTPResponse(BaseModel):
@@ -38,6 +44,8 @@ class RequestOTPResponse(BaseModel):
 
 
 class VerifyOTPRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
+
     phone_number: str = Field(
         ...,
         min_length=10,
@@ -55,20 +63,7 @@ class VerifyOTPRequest(BaseModel):
     @field_validator("phone_number")
     @classmethod
     def validate_phone_number(cls, v: str) -> str:
-        v = v.strip().replace(" ", "").replace("-", "")
-        if v.startswith("0"):
-            v = "+62" + v[1:]
-        elif v.startswith("62"):
-            v = "+" + v
-        elif not v.startswith("+"):
-            v = "+62" + v
-
-        pattern = r"^\+62[0-9]{8,13}$"
-        if not re.match(pattern, v):
-            raise ValueError(
-                "Nomor telepon tidak valid. Gunakan format Indonesia (+62xxx)"
-            )
-        return v
+        return _normalize_phone(v)
 
 
 class TokenResponse(BaseModel):
@@ -80,6 +75,8 @@ class TokenResponse(BaseModel):
 
 
 class RefreshTokenRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
+
     refresh_token: str
 
 
@@ -97,6 +94,8 @@ class UserResponse(BaseModel):
 
 
 class LogoutRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
+
     refresh_token: Optional[str] = None
 
 
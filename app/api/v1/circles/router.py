@@ -1,7 +1,12 @@
+import asyncio
+from typing import AsyncIterator
+
+import orjson
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user
 from app.api.v1.circles.schemas import (
     AddMemberRequest,
     CircleDetailResponse,
@@ -22,6 +27,7 @@ from app.api.v1.circles.schemas import (
 )
 from app.core.config import settings
 from app.db.models import User
+from app.db.session import get_db, run_in_session
 from app.services.circle_service import CircleService
 from app.services.invite_service import InviteService
 
@@ -30,7 +36,8 @@ router = APIRouter()
 
 @router.post(
     "",
-    response_model=CircleResponse,
+    response_model=None,
+    responses={status.HTTP_201_CREATED: {"model": CircleResponse}},
     status_code=status.HTTP_201_CREATED,
     summary="Buat lingkaran baru",
     description="Membuat lingkaran baru. User yang membuat otomatis menjadi admin.",
@@ -44,29 +51,15 @@ async def create_circle(
     circle = await circle_service.create_circle(
         user_id=current_user.id,
         name=request.name,
-        circle_type=request.type.value,
+        circle_type=request.type,
         description=request.description,
         cover_photo_url=request.cover_photo_url,
-        privacy=request.privacy.value,
+        privacy=request.privacy,
     )
 
     stats = await circle_service.get_circle_stats(circle.id)
 
-    return CircleResponse(
-        id=circle.id,
-        name=circle.name,
-        type=circle.type,
-        description=circle.description,
-        cover_photo_url=circle.cover_photo_url,
-        privacy=circle.privacy,
-        member_count=stats["member_count"],
-        story_count=stats["story_count"],
-        photo_count=stats["photo_count"],
-        current_user_role="admin",
-        created_by=circle.created_by,
-        created_at=circle.created_at,
-        updated_at=circle.updated_at,
-    )
+    return CircleResponse.from_circle(circle, stats, "admin")
 
 
 @router.get(
@@ -79,38 +72,31 @@ async def create_circle(
 async def get_my_circles(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> CircleListResponse:
+) -> StreamingResponse:
     circle_service = CircleService(db)
     circles = await circle_service.get_user_circles(current_user.id)
+    stats_by_circle = await circle_service.get_circle_stats_bulk(
+        [circle.id for circle in circles]
+    )
 
-    circle_responses = []
-    for circle in circles:
-        stats = await circle_service.get_circle_stats(circle.id)
-        
-        user_membership = next(
-            (m for m in circle.memberships if m.user_id == current_user.id),
-            None
-        )
-        
-        circle_responses.append(
-            CircleResponse(
-                id=circle.id,
-                name=circle.name,
-                type=circle.type,
-                description=circle.description,
-                cover_photo_url=circle.cover_photo_url,
-                privacy=circle.privacy,
-                member_count=stats["member_count"],
-                story_count=stats["story_count"],
-                photo_count=stats["photo_count"],
-                current_user_role=user_membership.role if user_membership else None,
-                created_by=circle.created_by,
-                created_at=circle.created_at,
-                updated_at=circle.updated_at,
+    async def stream_circles() -> AsyncIterator[bytes]:
+        yield b'{"circles":['
+        for index, circle in enumerate(circles):
+            user_membership = next(
+                (m for m in circle.memberships if m.user_id == current_user.id),
+                None
             )
-        )
+            circle_response = CircleResponse.from_circle(
+                circle,
+                stats_by_circle[circle.id],
+                user_membership.role if user_membership else None,
+            )
+            if index:
+                yield b","
+            yield orjson.dumps(circle_response.model_dump(), option=orjson.OPT_UTC_Z)
+        yield b'],"total":%d}' % len(circles)
 
-    return CircleListResponse(circles=circle_responses, total=len(circle_responses))
+    return StreamingResponse(stream_circles(), media_type="application/json")
 
 
 @router.get(
@@ -126,11 +112,14 @@ async def get_circle_detail(
     db: AsyncSession = Depends(get_db),
 ) -> CircleDetailResponse:
     circle_service = CircleService(db)
-    circle = await circle_service.get_circle_by_id(circle_id, current_user.id)
-    stats = await circle_service.get_circle_stats(circle_id)
-
-    memberships, circle_members = await circle_service.get_circle_members(
-        circle_id, current_user.id
+    circle, stats, (memberships, circle_members) = await asyncio.gather(
+        circle_service.get_circle_by_id(circle_id, current_user.id),
+        run_in_session(lambda session: CircleService(session).get_circle_stats(circle_id)),
+        run_in_session(
+            lambda session: CircleService(session).get_circle_members(
+                circle_id, current_user.id
+            )
+        ),
     )
 
     member_responses = []
@@ -189,7 +178,8 @@ async def get_circle_detail(
 
 @router.patch(
     "/{circle_id}",
-    response_model=CircleResponse,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": CircleResponse}},
     status_code=status.HTTP_200_OK,
     summary="Perbarui lingkaran",
     description="Memperbarui informasi lingkaran. Hanya admin yang bisa.",
@@ -207,7 +197,7 @@ async def update_circle(
         name=request.name,
         description=request.description,
         cover_photo_url=request.cover_photo_url,
-        privacy=request.privacy.value if request.privacy else None,
+        privacy=request.privacy,
     )
 
     stats = await circle_service.get_circle_stats(circle_id)
@@ -217,20 +207,8 @@ async def update_circle(
         None
     )
 
-    return CircleResponse(
-        id=circle.id,
-        name=circle.name,
-        type=circle.type,
-        description=circle.description,
-        cover_photo_url=circle.cover_photo_url,
-        privacy=circle.privacy,
-        member_count=stats["member_count"],
-        story_count=stats["story_count"],
-        photo_count=stats["photo_count"],
-        current_user_role=user_membership.role if user_membership else None,
-        created_by=circle.created_by,
-        created_at=circle.created_at,
-        updated_at=circle.updated_at,
+    return CircleResponse.from_circle(
+        circle, stats, user_membership.role if user_membership else None
     )
 
 
@@ -321,7 +299,7 @@ async def add_member(
         admin_user_id=current_user.id,
         user_id=request.user_id,
         name=request.name,
-        role=request.role.value,
+        role=request.role,
         custom_label=request.custom_label,
     )
 
@@ -370,7 +348,7 @@ async def update_member_role(
         circle_id=circle_id,
         membership_id=membership_id,
         admin_user_id=current_user.id,
-        role=request.role.value if request.role else None,
+        role=request.role,
         custom_label=request.custom_label,
     )
 
@@ -423,7 +401,7 @@ async def create_invite(
     invite = await invite_service.create_invite(
         circle_id=circle_id,
         invited_by=current_user.id,
-        role=request.role.value,
+        role=request.role,
         custom_label=request.custom_label,
         max_uses=request.max_uses,
     )
@@ -456,29 +434,12 @@ async def join_circle(
     db: AsyncSession = Depends(get_db),
 ) -> JoinCircleResponse:
     invite_service = InviteService(db)
-    circle = await invite_service.join_circle_via_invite(
+    circle, stats = await invite_service.join_circle_via_invite(
         request.invite_code, current_user.id
     )
 
-    circle_service = CircleService(db)
-    stats = await circle_service.get_circle_stats(circle.id)
-
     return JoinCircleResponse(
-        circle=CircleResponse(
-            id=circle.id,
-            name=circle.name,
-            type=circle.type,
-            description=circle.description,
-            cover_photo_url=circle.cover_photo_url,
-            privacy=circle.privacy,
-            member_count=stats["member_count"],
-            story_count=stats["story_count"],
-            photo_count=stats["photo_count"],
-            current_user_role="contributor",
-            created_by=circle.created_by,
-            created_at=circle.created_at,
-            updated_at=circle.updated_at,
-        )
+        circle=CircleResponse.from_circle(circle, stats, "contributor")
     )
 
 
@@ -1,62 +1,56 @@
 from datetime import datetime
-from enum import Enum
-from typing import List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+CircleType = Literal[
+    "keluarga",
+    "pasangan",
+    "sahabat",
+    "rekan_kerja",
+    "komunitas",
+    "mentor",
+    "pribadi",
+]
 
-class CircleTypeEnum(str, Enum):
-    KELUARGA = "keluarga"
-    PASANGAN = "pasangan"
-    SAHABAT = "sahabat"
-    REKAN_KERJA = "rekan_kerja"
-    KOMUNITAS = "komunitas"
-    MENTOR = "mentor"
-    PRIBADI = "pribadi"
+CirclePrivacy = Literal["private", "members_only", "link_access"]
 
+MemberRoleType = Literal["admin", "contributor", "viewer"]
 
-class CirclePrivacyEnum(str, Enum):
-    PRIVATE = "private"
-    MEMBERS_ONLY = "members_only"
-    LINK_ACCESS = "link_access"
+
+def _strip_name(v: Optional[str], message: str) -> Optional[str]:
+    if v is not None:
+        v = v.strip()
+        if not v:
+            raise ValueError(message)
+    return v
 
 
-class MemberRoleEnum(str, Enum):
-    ADMIN = "admin"
-    CONTRIBUTOR = "contributor"
-    VIEWER = "viewer"
+def _strip_circle_name(v: Optional[str]) -> Optional[str]:
+    return _strip_name(v, "Nama lingkaran tidak boleh kosong")
+
+
+def _strip_member_name(v: Optional[str]) -> Optional[str]:
+    return _strip_name(v, "Nama tidak boleh kosong")
 
 
 class CreateCircleRequest(BaseModel):
     name: str = Field(..., min_length=1, max_length=100)
-    type: CircleTypeEnum
+    type: CircleType
     description: Optional[str] = Field(None, max_length=500)
     cover_photo_url: Optional[str] = Field(None, max_length=500)
-    privacy: CirclePrivacyEnum = CirclePrivacyEnum.MEMBERS_ONLY
+    privacy: CirclePrivacy = "members_only"
 
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        v = v.strip()
-        if not v:
-            raise ValueError("Nama lingkaran tidak boleh kosong")
-        return v
+    validate_name = field_validator("name")(_strip_circle_name)
 
 
 class UpdateCircleRequest(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     description: Optional[str] = Field(None, max_length=500)
     cover_photo_url: Optional[str] = Field(None, max_length=500)
-    privacy: Optional[CirclePrivacyEnum] = None
+    privacy: Optional[CirclePrivacy] = None
 
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None:
-            v = v.strip()
-            if not v:
-                raise ValueError("Nama lingkaran tidak boleh kosong")
-        return v
+    validate_name = field_validator("name")(_strip_circle_name)
 
 
 class CircleMemberResponse(BaseModel):
@@ -91,6 +85,27 @@ class CircleResponse(BaseModel):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_circle(
+        cls, circle: Any, stats: Dict[str, int], current_user_role: Optional[str]
+    ) -> "CircleResponse":
+        # Values come straight from typed DB columns, so skip validation.
+        return cls.model_construct(
+            id=circle.id,
+            name=circle.name,
+            type=circle.type,
+            description=circle.description,
+            cover_photo_url=circle.cover_photo_url,
+            privacy=circle.privacy,
+            member_count=stats["member_count"],
+            story_count=stats["story_count"],
+            photo_count=stats["photo_count"],
+            current_user_role=current_user_role,
+            created_by=circle.created_by,
+            created_at=circle.created_at,
+            updated_at=circle.updated_at,
+        )
+
 
 class CircleDetailResponse(CircleResponse):
     members: List[CircleMemberResponse] = []
@@ -106,21 +121,14 @@ class CircleListResponse(BaseModel):
 class AddMemberRequest(BaseModel):
     user_id: Optional[str] = None
     name: Optional[str] = Field(None, min_length=1, max_length=100)
-    role: MemberRoleEnum = MemberRoleEnum.CONTRIBUTOR
+    role: MemberRoleType = "contributor"
     custom_label: Optional[str] = Field(None, max_length=50)
 
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None:
-            v = v.strip()
-            if not v:
-                raise ValueError("Nama tidak boleh kosong")
-        return v
+    validate_name = field_validator("name")(_strip_member_name)
 
 
 class UpdateMemberRequest(BaseModel):
-    role: Optional[MemberRoleEnum] = None
+    role: Optional[MemberRoleType] = None
     custom_label: Optional[str] = Field(None, max_length=50)
 
 
@@ -145,7 +153,7 @@ class MemberListResponse(BaseModel):
 
 
 class CreateInviteRequest(BaseModel):
-    role: MemberRoleEnum = MemberRoleEnum.CONTRIBUTOR
+    role: MemberRoleType = "contributor"
     custom_label: Optional[str] = Field(None, max_length=50)
     max_uses: int = Field(default=1, ge=1, le=100)
 
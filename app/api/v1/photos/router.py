@@ -1,9 +1,8 @@
-from datetime import datetime
-
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, Response, status
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user
 from app.api.v1.photos.schemas import (
     ConfirmPhotoUploadRequest,
     PhotoListResponse,
@@ -15,14 +14,32 @@ from app.api.v1.photos.schemas import (
     UploadPhotoResponse,
 )
 from app.core.exceptions import BusinessException, NotFoundException
+from app.core.responses import ORJSONResponse, is_not_modified, weak_etag
 from app.db.models import Photo, User
+from app.db.session import get_db
 from app.services.circle_service import CircleService
-from app.services.storage_service import StorageService
+from app.services.storage_service import StorageService, download_url_bucket
 from app.utils.file_utils import FileValidator
-from sqlalchemy import select
 
 router = APIRouter()
 
+_storage = StorageService()
+
+_PHOTOS_IN_CIRCLE = (
+    Photo.circle_id == bindparam("circle_id"),
+    Photo.deleted_at.is_(None),
+)
+
+_PHOTOS_BY_CIRCLE = (
+    select(Photo)
+    .where(*_PHOTOS_IN_CIRCLE)
+    .order_by(Photo.taken_at.desc().nulls_last(), Photo.created_at.desc())
+)
+
+_PHOTOS_SUMMARY = select(func.count(Photo.id), func.max(Photo.updated_at)).where(
+    *_PHOTOS_IN_CIRCLE
+)
+
 
 @router.post(
     "/upload-url",
@@ -47,18 +64,16 @@ async def get_photo_upload_url(
             message="Format file tidak didukung. Gunakan JPG, PNG, HEIC, atau WebP.",
         )
 
-    storage_service = StorageService()
-    
-    allowed_types = storage_service.get_allowed_image_types()
-    if not storage_service.validate_content_type(request.content_type, allowed_types):
+    allowed_types = _storage.get_allowed_image_types()
+    if not _storage.validate_content_type(request.content_type, allowed_types):
         raise BusinessException(
             code="INVALID_CONTENT_TYPE",
             message="Content type tidak valid untuk foto.",
         )
 
     folder = f"photos/{request.circle_id}"
-    
-    upload_data = await storage_service.generate_upload_url(
+
+    upload_data = await _storage.generate_upload_url(
         file_name=request.filename,
         content_type=request.content_type,
         folder=folder,
@@ -70,7 +85,8 @@ async def get_photo_upload_url(
 
 @router.post(
     "/confirm",
-    response_model=PhotoResponse,
+    response_model=None,
+    responses={status.HTTP_201_CREATED: {"model": PhotoResponse}},
     status_code=status.HTTP_201_CREATED,
     summary="Konfirmasi upload foto",
     description="Mengkonfirmasi bahwa foto sudah berhasil diupload ke S3 dan membuat record di database.",
@@ -85,13 +101,11 @@ async def confirm_photo_upload(
         request.circle_id, current_user.id, required_role="contributor"
     )
 
-    storage_service = StorageService()
-    
-    file_exists = await storage_service.verify_file_exists(request.storage_key)
+    file_exists = await _storage.verify_file_exists(request.storage_key)
     if not file_exists:
         raise NotFoundException("File tidak ditemukan di storage. Upload mungkin gagal.")
 
-    metadata = await storage_service.get_file_metadata(request.storage_key)
+    metadata = await _storage.get_file_metadata(request.storage_key)
 
     photo = Photo(
         circle_id=request.circle_id,
@@ -107,86 +121,66 @@ async def confirm_photo_upload(
     await db.commit()
     await db.refresh(photo)
 
-    download_url = await storage_service.generate_download_url(request.storage_key)
-
-    return PhotoResponse(
-        id=photo.id,
-        circle_id=photo.circle_id,
-        storage_key=photo.storage_key,
-        thumbnail_key=photo.thumbnail_key,
-        url=download_url,
-        thumbnail_url=None,
-        original_filename=photo.original_filename,
-        file_size_bytes=photo.file_size_bytes,
-        mime_type=photo.mime_type,
-        width=photo.width,
-        height=photo.height,
-        taken_at=photo.taken_at,
-        caption=photo.caption,
-        uploaded_by=photo.uploaded_by,
-        created_at=photo.created_at,
-    )
+    download_url = await _storage.generate_download_url_fast(request.storage_key)
+
+    return PhotoResponse.from_orm_fast(photo, download_url, None)
 
 
 @router.get(
     "",
-    response_model=PhotoListResponse,
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={
+        status.HTTP_200_OK: {"model": PhotoListResponse},
+        status.HTTP_304_NOT_MODIFIED: {"description": "Daftar foto tidak berubah"},
+    },
     status_code=status.HTTP_200_OK,
     summary="Dapatkan daftar foto dalam lingkaran",
 )
 async def get_photos(
     circle_id: str,
+    http_request: Request,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> PhotoListResponse:
+) -> Response:
     circle_service = CircleService(db)
     await circle_service._check_access(circle_id, current_user.id)
 
-    query = (
-        select(Photo)
-        .where(Photo.circle_id == circle_id, Photo.deleted_at.is_(None))
-        .order_by(Photo.taken_at.desc().nulls_last(), Photo.created_at.desc())
-    )
-    result = await db.execute(query)
-    photos = list(result.scalars().all())
-
-    storage_service = StorageService()
-    photo_responses = []
-
-    for photo in photos:
-        url = await storage_service.generate_download_url(photo.storage_key)
-        thumbnail_url = (
-            await storage_service.generate_download_url(photo.thumbnail_key)
-            if photo.thumbnail_key
-            else None
+    params = {"circle_id": circle_id}
+
+    # Signed URLs in the body rotate with the signing bucket, so it is part
+    # of the tag alongside the row count and latest change.
+    summary = await db.execute(_PHOTOS_SUMMARY, params)
+    count, last_updated = summary.one()
+    etag = weak_etag(circle_id, count, last_updated, download_url_bucket())
+    if is_not_modified(http_request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
         )
 
-        photo_responses.append(
-            PhotoResponse(
-                id=photo.id,
-                circle_id=photo.circle_id,
-                storage_key=photo.storage_key,
-                thumbnail_key=photo.thumbnail_key,
-                url=url,
-                thumbnail_url=thumbnail_url,
-                original_filename=photo.original_filename,
-                file_size_bytes=photo.file_size_bytes,
-                mime_type=photo.mime_type,
-                width=photo.width,
-                height=photo.height,
-                taken_at=photo.taken_at,
-                caption=photo.caption,
-                uploaded_by=photo.uploaded_by,
-                created_at=photo.created_at,
-            )
+    result = await db.execute(_PHOTOS_BY_CIRCLE, params)
+    photos = result.scalars().all()
+
+    signed_urls = await _storage.generate_download_urls(
+        key for photo in photos for key in (photo.storage_key, photo.thumbnail_key)
+    )
+
+    items = [
+        PhotoResponse.fields_from_orm(
+            photo, signed_urls[photo.storage_key], signed_urls.get(photo.thumbnail_key)
         )
+        for photo in photos
+    ]
 
-    return PhotoListResponse(photos=photo_responses, total=len(photo_responses))
+    return ORJSONResponse(
+        {"photos": items, "total": len(items)}, headers={"ETag": etag}
+    )
 
 
 @router.get(
     "/{photo_id}",
-    response_model=PhotoResponse,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": PhotoResponse}},
     status_code=status.HTTP_200_OK,
     summary="Dapatkan detail foto",
 )
@@ -195,46 +189,23 @@ async def get_photo(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> PhotoResponse:
-    query = select(Photo).where(Photo.id == photo_id, Photo.deleted_at.is_(None))
-    result = await db.execute(query)
-    photo = result.scalar_one_or_none()
-
-    if not photo:
-        raise NotFoundException("Foto tidak ditemukan")
-
     circle_service = CircleService(db)
-    await circle_service._check_access(photo.circle_id, current_user.id)
+    photo = await circle_service.get_photo_with_access(photo_id, current_user.id)
 
-    storage_service = StorageService()
-    url = await storage_service.generate_download_url(photo.storage_key)
+    url = await _storage.generate_download_url_fast(photo.storage_key)
     thumbnail_url = (
-        await storage_service.generate_download_url(photo.thumbnail_key)
+        await _storage.generate_download_url_fast(photo.thumbnail_key)
         if photo.thumbnail_key
         else None
     )
 
-    return PhotoResponse(
-        id=photo.id,
-        circle_id=photo.circle_id,
-        storage_key=photo.storage_key,
-        thumbnail_key=photo.thumbnail_key,
-        url=url,
-        thumbnail_url=thumbnail_url,
-        original_filename=photo.original_filename,
-        file_size_bytes=photo.file_size_bytes,
-        mime_type=photo.mime_type,
-        width=photo.width,
-        height=photo.height,
-        taken_at=photo.taken_at,
-        caption=photo.caption,
-        uploaded_by=photo.uploaded_by,
-        created_at=photo.created_at,
-    )
+    return PhotoResponse.from_orm_fast(photo, url, thumbnail_url)
 
 
 @router.patch(
     "/{photo_id}",
-    response_model=PhotoResponse,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": PhotoResponse}},
     status_code=status.HTTP_200_OK,
     summary="Update metadata foto",
 )
@@ -244,16 +215,9 @@ async def update_photo(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> PhotoResponse:
-    query = select(Photo).where(Photo.id == photo_id, Photo.deleted_at.is_(None))
-    result = await db.execute(query)
-    photo = result.scalar_one_or_none()
-
-    if not photo:
-        raise NotFoundException("Foto tidak ditemukan")
-
     circle_service = CircleService(db)
-    await circle_service._check_access(
-        photo.circle_id, current_user.id, required_role="contributor"
+    photo = await circle_service.get_photo_with_access(
+        photo_id, current_user.id, required_role="contributor"
     )
 
     if request.caption is not None:
@@ -261,35 +225,17 @@ async def update_photo(
     if request.taken_at is not None:
         photo.taken_at = request.taken_at
 
-    photo.updated_at = datetime.utcnow()
     await db.commit()
     await db.refresh(photo)
 
-    storage_service = StorageService()
-    url = await storage_service.generate_download_url(photo.storage_key)
+    url = await _storage.generate_download_url_fast(photo.storage_key)
     thumbnail_url = (
-        await storage_service.generate_download_url(photo.thumbnail_key)
+        await _storage.generate_download_url_fast(photo.thumbnail_key)
         if photo.thumbnail_key
         else None
     )
 
-    return PhotoResponse(
-        id=photo.id,
-        circle_id=photo.circle_id,
-        storage_key=photo.storage_key,
-        thumbnail_key=photo.thumbnail_key,
-        url=url,
-        thumbnail_url=thumbnail_url,
-        original_filename=photo.original_filename,
-        file_size_bytes=photo.file_size_bytes,
-        mime_type=photo.mime_type,
-        width=photo.width,
-        height=photo.height,
-        taken_at=photo.taken_at,
-        caption=photo.caption,
-        uploaded_by=photo.uploaded_by,
-        created_at=photo.created_at,
-    )
+    return PhotoResponse.from_orm_fast(photo, url, thumbnail_url)
 
 
 @router.delete(
@@ -302,20 +248,8 @@ async def delete_photo(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> None:
-    query = select(Photo).where(Photo.id == photo_id, Photo.deleted_at.is_(None))
-    result = await db.execute(query)
-    photo = result.scalar_one_or_none()
-
-    if not photo:
-        raise NotFoundException("Foto tidak ditemukan")
-
     circle_service = CircleService(db)
-    await circle_service._check_access(
-        photo.circle_id, current_user.id, required_role="contributor"
-    )
-
-    photo.deleted_at = datetime.utcnow()
-    await db.commit()
+    await circle_service.soft_delete_photo(photo_id, current_user.id)
 
 
 @router.post(
@@ -341,18 +275,16 @@ async def get_audio_upload_url(
             message="Format audio tidak didukung. Gunakan MP3, WAV, AAC, M4A, atau OGG.",
         )
 
-    storage_service = StorageService()
-    
-    allowed_types = storage_service.get_allowed_audio_types()
-    if not storage_service.validate_content_type(request.content_type, allowed_types):
+    allowed_types = _storage.get_allowed_audio_types()
+    if not _storage.validate_content_type(request.content_type, allowed_types):
         raise BusinessException(
             code="INVALID_CONTENT_TYPE",
             message="Content type tidak valid untuk audio.",
         )
 
     folder = f"audio/{request.circle_id}"
-    
-    upload_data = await storage_service.generate_upload_url(
+
+    upload_data = await _storage.generate_upload_url(
         file_name=request.filename,
         content_type=request.content_type,
         folder=folder,
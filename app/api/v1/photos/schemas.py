@@ -1,14 +1,21 @@
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class UploadPhotoRequest(BaseModel):
     filename: str = Field(..., min_length=1, max_length=255)
-    content_type: str = Field(..., pattern=r"^image/")
+    content_type: str
     circle_id: str
 
+    @field_validator("content_type")
+    @classmethod
+    def validate_content_type(cls, v: str) -> str:
+        if not v.startswith("image/"):
+            raise ValueError("Content type tidak valid untuk foto")
+        return v
+
 
 class UploadPhotoResponse(BaseModel):
     upload_url: str
@@ -44,6 +51,35 @@ class PhotoResponse(BaseModel):
     class Config:
         from_attributes = True
 
+    @staticmethod
+    def fields_from_orm(
+        photo: Any, url: str, thumbnail_url: Optional[str]
+    ) -> Dict[str, Any]:
+        return {
+            "id": photo.id,
+            "circle_id": photo.circle_id,
+            "storage_key": photo.storage_key,
+            "thumbnail_key": photo.thumbnail_key,
+            "url": url,
+            "thumbnail_url": thumbnail_url,
+            "original_filename": photo.original_filename,
+            "file_size_bytes": photo.file_size_bytes,
+            "mime_type": photo.mime_type,
+            "width": photo.width,
+            "height": photo.height,
+            "taken_at": photo.taken_at,
+            "caption": photo.caption,
+            "uploaded_by": photo.uploaded_by,
+            "created_at": photo.created_at,
+        }
+
+    @classmethod
+    def from_orm_fast(
+        cls, photo: Any, url: str, thumbnail_url: Optional[str]
+    ) -> "PhotoResponse":
+        # Values come straight from typed DB columns, so skip validation.
+        return cls.model_construct(**cls.fields_from_orm(photo, url, thumbnail_url))
+
 
 class PhotoListResponse(BaseModel):
     photos: list[PhotoResponse]
@@ -57,10 +93,17 @@ class UpdatePhotoRequest(BaseModel):
 
 class UploadAudioRequest(BaseModel):
     filename: str = Field(..., min_length=1, max_length=255)
-    content_type: str = Field(..., pattern=r"^audio/")
+    content_type: str
     circle_id: str
     photo_id: Optional[str] = None
 
+    @field_validator("content_type")
+    @classmethod
+    def validate_content_type(cls, v: str) -> str:
+        if not v.startswith("audio/"):
+            raise ValueError("Content type tidak valid untuk audio")
+        return v
+
 
 class UploadAudioResponse(BaseModel):
     upload_url: str
@@ -1,69 +1,72 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user
 from app.api.v1.stories.schemas import (
     CreateStoryRequest,
-    PhotoInfo,
-    RecorderInfo,
     StoryListResponse,
     StoryResponse,
     TranscriptionStatusResponse,
     UpdateTranscriptRequest,
 )
-from app.db.models import User
+from app.core.responses import ORJSONResponse, is_not_modified, weak_etag
+from app.db.models import TranscriptionStatus, User
+from app.db.session import get_db
 from app.services.story_service import StoryService
-from app.services.storage_service import StorageService
-from app.tasks.transcription import transcribe_story_task
+from app.services.storage_service import StorageService, download_url_bucket
 
 router = APIRouter()
 
+_storage = StorageService()
+_STATUS_PENDING = TranscriptionStatus.PENDING.value
+_STATUS_FAILED = TranscriptionStatus.FAILED.value
 
-def _build_story_response(story, audio_url: str) -> StoryResponse:
-    recorder_info = None
-    if story.recorder:
-        recorder_info = RecorderInfo(
-            id=story.recorder.id,
-            name=story.recorder.name,
-            avatar_url=story.recorder.avatar_url,
-        )
 
-    photo_info = None
-    if story.photo:
-        photo_info = PhotoInfo(
-            id=story.photo.id,
-            storage_key=story.photo.storage_key,
-            thumbnail_key=story.photo.thumbnail_key,
-            caption=story.photo.caption,
-        )
+def _story_dict(story, audio_url: str) -> dict:
+    recorded_by = story.recorded_by
+    photo = story.photo
 
-    return StoryResponse(
-        id=story.id,
-        circle_id=story.circle_id,
-        photo_id=story.photo_id,
-        recorded_by=story.recorded_by,
-        audio_url=audio_url,
-        audio_storage_key=story.audio_storage_key,
-        audio_duration_seconds=story.audio_duration_seconds,
-        transcript_original=story.transcript_original,
-        transcript_edited=story.transcript_edited,
-        transcription_status=story.transcription_status,
-        transcription_error=story.transcription_error,
-        prompt_used=story.prompt_used,
-        language=story.language,
-        is_published=story.is_published,
-        created_at=story.created_at,
-        updated_at=story.updated_at,
-        recorder=recorder_info,
-        photo=photo_info,
-    )
+    return {
+        "id": story.id,
+        "circle_id": story.circle_id,
+        "photo_id": story.photo_id,
+        "recorded_by": recorded_by,
+        "audio_url": audio_url,
+        "audio_storage_key": story.audio_storage_key,
+        "audio_duration_seconds": story.audio_duration_seconds,
+        "transcript_original": story.transcript_original,
+        "transcript_edited": story.transcript_edited,
+        "transcription_status": story.transcription_status,
+        "transcription_error": story.transcription_error,
+        "prompt_used": story.prompt_used,
+        "language": story.language,
+        "is_published": story.is_published,
+        "created_at": story.created_at,
+        "updated_at": story.updated_at,
+        "recorder": {
+            "id": recorded_by,
+            "name": story.recorded_by_display_name,
+            "avatar_url": story.recorded_by_avatar_url,
+        }
+        if recorded_by
+        else None,
+        "photo": {
+            "id": photo.id,
+            "storage_key": photo.storage_key,
+            "thumbnail_key": photo.thumbnail_key,
+            "caption": photo.caption,
+        }
+        if photo
+        else None,
+    }
 
 
 @router.post(
     "/stories",
-    response_model=StoryResponse,
+    response_model=None,
+    responses={status.HTTP_201_CREATED: {"model": StoryResponse}},
     status_code=status.HTTP_201_CREATED,
     summary="Buat cerita baru",
     description="Membuat cerita baru dengan audio yang sudah diupload dan memulai proses transkripsi.",
@@ -85,55 +88,86 @@ async def create_story(
         language=request.language,
     )
 
-    transcribe_story_task.delay(story.id)
+    from app.tasks.transcription import transcribe_story_task
 
-    audio_url = await story_service.get_audio_download_url(story)
+    transcribe_story_task.delay(story.id)
 
-    return _build_story_response(story, audio_url)
+    # create_story has just signed this key and stored it on the row.
+    return StoryResponse.from_orm_fast(story, story.audio_url)
 
 
 @router.get(
     "/stories",
-    response_model=StoryListResponse,
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={
+        status.HTTP_200_OK: {"model": StoryListResponse},
+        status.HTTP_304_NOT_MODIFIED: {"description": "Daftar cerita tidak berubah"},
+    },
     status_code=status.HTTP_200_OK,
     summary="Daftar cerita dalam lingkaran",
     description="Mengambil daftar cerita dalam lingkaran dengan pagination.",
 )
 async def list_stories(
+    request: Request,
     circle_id: str = Query(..., description="ID lingkaran"),
     photo_id: Optional[str] = Query(None, description="Filter berdasarkan foto"),
     skip: int = Query(0, ge=0, description="Jumlah data yang dilewati"),
     limit: int = Query(50, ge=1, le=100, description="Jumlah data maksimal"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> StoryListResponse:
+) -> Response:
     story_service = StoryService(db)
-    storage_service = StorageService()
 
-    stories, total = await story_service.list_stories(
+    total, stories_updated, photos_updated = await story_service.summarize_stories(
         circle_id=circle_id,
         user_id=current_user.id,
-        skip=skip,
-        limit=limit,
         photo_id=photo_id,
     )
+    # Recorder details are denormalized onto the story row, so they are
+    # covered by stories_updated. The signing bucket is included since the
+    # audio URLs in the body rotate with it.
+    etag = weak_etag(
+        circle_id,
+        photo_id,
+        skip,
+        limit,
+        total,
+        stories_updated,
+        photos_updated,
+        download_url_bucket(),
+    )
+    if is_not_modified(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
 
-    story_responses = []
-    for story in stories:
-        audio_url = await storage_service.generate_download_url(story.audio_storage_key)
-        story_responses.append(_build_story_response(story, audio_url))
-
-    return StoryListResponse(
-        stories=story_responses,
-        total=total,
+    stories = await story_service.list_story_page(
+        circle_id=circle_id,
+        user_id=current_user.id,
         skip=skip,
         limit=limit,
+        photo_id=photo_id,
+    )
+
+    audio_urls = await _storage.generate_download_urls(
+        story.audio_storage_key for story in stories
+    )
+    items = [
+        _story_dict(story, audio_urls.get(story.audio_storage_key))
+        for story in stories
+    ]
+
+    return ORJSONResponse(
+        {"stories": items, "total": total, "skip": skip, "limit": limit},
+        headers={"ETag": etag},
     )
 
 
 @router.get(
     "/stories/{story_id}",
-    response_model=StoryResponse,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": StoryResponse}},
     status_code=status.HTTP_200_OK,
     summary="Detail cerita",
     description="Mengambil detail cerita berdasarkan ID.",
@@ -148,7 +182,7 @@ async def get_story(
     story = await story_service.get_story_by_id(story_id, current_user.id)
     audio_url = await story_service.get_audio_download_url(story)
 
-    return _build_story_response(story, audio_url)
+    return StoryResponse.from_orm_fast(story, audio_url)
 
 
 @router.get(
@@ -176,7 +210,8 @@ async def get_transcription_status(
 
 @router.patch(
     "/stories/{story_id}",
-    response_model=StoryResponse,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": StoryResponse}},
     status_code=status.HTTP_200_OK,
     summary="Update transkrip cerita",
     description="Memperbarui transkrip cerita yang sudah diedit.",
@@ -197,7 +232,7 @@ async def update_story_transcript(
 
     audio_url = await story_service.get_audio_download_url(story)
 
-    return _build_story_response(story, audio_url)
+    return StoryResponse.from_orm_fast(story, audio_url)
 
 
 @router.delete(
@@ -231,17 +266,17 @@ async def retry_transcription(
 
     status_info = await story_service.get_transcription_status(story_id, current_user.id)
 
-    if status_info["status"] != "failed":
+    if status_info["status"] != _STATUS_FAILED:
         return {
             "success": False,
             "message": "Hanya cerita dengan status gagal yang bisa diulangi transkripsinya.",
         }
 
-    from app.db.models import TranscriptionStatus
+    from app.tasks.transcription import transcribe_story_task
 
     await story_service.update_transcription_status(
         story_id=story_id,
-        status=TranscriptionStatus.PENDING.value,
+        status=_STATUS_PENDING,
         error=None,
     )
 
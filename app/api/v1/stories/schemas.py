@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
@@ -59,6 +59,48 @@ class StoryResponse(BaseModel):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_orm_fast(cls, story: Any, audio_url: str) -> "StoryResponse":
+        # Values come straight from typed DB columns, so skip validation.
+        # story.photo must already be loaded; recorder details are copied
+        # onto the story row.
+        recorded_by = story.recorded_by
+        photo = story.photo
+
+        return cls.model_construct(
+            id=story.id,
+            circle_id=story.circle_id,
+            photo_id=story.photo_id,
+            recorded_by=story.recorded_by,
+            audio_url=audio_url,
+            audio_storage_key=story.audio_storage_key,
+            audio_duration_seconds=story.audio_duration_seconds,
+            transcript_original=story.transcript_original,
+            transcript_edited=story.transcript_edited,
+            transcription_status=story.transcription_status,
+            transcription_error=story.transcription_error,
+            prompt_used=story.prompt_used,
+            language=story.language,
+            is_published=story.is_published,
+            created_at=story.created_at,
+            updated_at=story.updated_at,
+            recorder=RecorderInfo.model_construct(
+                id=recorded_by,
+                name=story.recorded_by_display_name,
+                avatar_url=story.recorded_by_avatar_url,
+            )
+            if recorded_by
+            else None,
+            photo=PhotoInfo.model_construct(
+                id=photo.id,
+                storage_key=photo.storage_key,
+                thumbnail_key=photo.thumbnail_key,
+                caption=photo.caption,
+            )
+            if photo
+            else None,
+        )
+
 
 class StoryListResponse(BaseModel):
     stories: list[StoryResponse]
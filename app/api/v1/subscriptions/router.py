@@ -2,12 +2,16 @@
 API router for subscription and payment endpoints.
 """
 
-from typing import List
+import hashlib
+from typing import List, Tuple
 
-from fastapi import APIRouter, Depends, Request, status
+import structlog
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user
 from app.api.v1.subscriptions.schemas import (
     CancelSubscriptionRequest,
     CheckoutRequest,
@@ -20,46 +24,84 @@ from app.api.v1.subscriptions.schemas import (
     WebhookResponse,
 )
 from app.core.exceptions import BusinessException, NotFoundException
+from app.core.payment_history_cache import (
+    cache_history,
+    get_cached_history,
+    invalidate_history,
+)
+from app.core.responses import is_not_modified
+from app.data.subscription_plans import (
+    PRICE_TO_PLAN_ID,
+    SubscriptionPlan,
+    get_all_plans,
+    get_plan_price,
+    get_purchasable_plans,
+)
 from app.db.models import User
 from app.db.models.subscription import Payment, PaymentProvider, PaymentStatus
-from app.services.payment_service import PaymentService
+from app.db.session import get_db, run_in_session
+from app.services.payment_service import PaymentService, get_payment_service
 from app.services.subscription_service import SubscriptionService
-import structlog
 
 router = APIRouter()
 logger = structlog.get_logger(__name__)
 
 
+def _plan_response(plan: SubscriptionPlan) -> PlanResponse:
+    return PlanResponse(
+        plan_id=plan.plan_id,
+        name_id=plan.name_id,
+        name_en=plan.name_en,
+        description_id=plan.description_id,
+        price_idr=plan.price_idr,
+        billing_cycle=plan.billing_cycle,
+        features=plan.features,
+        limits=PlanLimits(**plan.limits),
+        is_popular=plan.is_popular,
+        recommended_for=plan.recommended_for,
+    )
+
+
+def _render_plans(plans: List[SubscriptionPlan]) -> Tuple[bytes, str]:
+    body = _PLAN_LIST_ADAPTER.dump_json([_plan_response(plan) for plan in plans])
+    return body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+# Plan data is static, so both variants of /plans are serialized once at import.
+_PLAN_LIST_ADAPTER = TypeAdapter(List[PlanResponse])
+_PLANS_JSON = {
+    True: _render_plans(get_all_plans()),
+    False: _render_plans(get_purchasable_plans()),
+}
+_PLANS_CACHE_CONTROL = "public, max-age=300"
+
+_PAYMENT_LIST_ADAPTER = TypeAdapter(List[PaymentResponse])
+_WEBHOOK_ADAPTER = TypeAdapter(MidtransWebhookPayload)
+
+
 @router.get(
     "/plans",
-    response_model=List[PlanResponse],
+    response_model=None,
+    responses={
+        status.HTTP_200_OK: {"model": List[PlanResponse]},
+        status.HTTP_304_NOT_MODIFIED: {"description": "Daftar paket tidak berubah"},
+    },
     status_code=status.HTTP_200_OK,
     summary="Daftar paket subscription",
     description="Mendapatkan daftar semua paket subscription yang tersedia dengan harga dan fitur.",
 )
 async def get_subscription_plans(
+    request: Request,
     include_free: bool = False,
-) -> List[PlanResponse]:
+) -> Response:
     """Get list of available subscription plans"""
-    # Note: We don't need db here as plans are static data
-    subscription_service = SubscriptionService(db=None)  # type: ignore
-    plans = await subscription_service.get_available_plans(include_free=include_free)
-
-    return [
-        PlanResponse(
-            plan_id=plan.plan_id,
-            name_id=plan.name_id,
-            name_en=plan.name_en,
-            description_id=plan.description_id,
-            price_idr=plan.price_idr,
-            billing_cycle=plan.billing_cycle,
-            features=plan.features,
-            limits=PlanLimits(**plan.limits),
-            is_popular=plan.is_popular,
-            recommended_for=plan.recommended_for,
-        )
-        for plan in plans
-    ]
+    body, etag = _PLANS_JSON[include_free]
+    headers = {"ETag": etag, "Cache-Control": _PLANS_CACHE_CONTROL}
+
+    if is_not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.post(
@@ -74,27 +116,25 @@ async def create_checkout(
     request: CheckoutRequest,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    payment_service: PaymentService = Depends(get_payment_service),
 ) -> CheckoutResponse:
     """Create Midtrans checkout session"""
-    payment_service = PaymentService()
-
     # Create checkout session
     checkout_data = await payment_service.create_checkout_session(
         user_id=current_user.id,
         user_phone=current_user.phone_number,
-        user_name=current_user.display_name or current_user.name or "Pengguna Kenang",
+        user_name=current_user.display_name or "Pengguna Kenang",
         plan_id=request.plan_id,
         payment_method=request.payment_method,
     )
 
     # Create pending payment record
-    from app.data.subscription_plans import get_plan_price
-
     amount_idr = get_plan_price(request.plan_id)
 
     payment = Payment(
         user_id=current_user.id,
         subscription_id=None,  # Will be linked after successful payment
+        plan_id=request.plan_id,
         amount_idr=amount_idr,
         payment_method=request.payment_method,
         payment_provider=PaymentProvider.MIDTRANS.value,
@@ -104,6 +144,7 @@ async def create_checkout(
 
     db.add(payment)
     await db.commit()
+    await invalidate_history(current_user.id)
 
     logger.info(
         "checkout_created",
@@ -140,17 +181,7 @@ async def get_current_subscription(
             "Subscription tidak ditemukan. Kamu sedang menggunakan paket gratis."
         )
 
-    return SubscriptionResponse(
-        id=subscription.id,
-        user_id=subscription.user_id,
-        plan_id=subscription.plan_id,
-        status=subscription.status,
-        payment_provider=subscription.payment_provider,
-        current_period_start=subscription.current_period_start,
-        current_period_end=subscription.current_period_end,
-        cancelled_at=subscription.cancelled_at,
-        created_at=subscription.created_at,
-    )
+    return SubscriptionResponse.model_validate(subscription)
 
 
 @router.post(
@@ -181,22 +212,13 @@ async def cancel_subscription(
         immediate=request.immediate,
     )
 
-    return SubscriptionResponse(
-        id=cancelled_subscription.id,
-        user_id=cancelled_subscription.user_id,
-        plan_id=cancelled_subscription.plan_id,
-        status=cancelled_subscription.status,
-        payment_provider=cancelled_subscription.payment_provider,
-        current_period_start=cancelled_subscription.current_period_start,
-        current_period_end=cancelled_subscription.current_period_end,
-        cancelled_at=cancelled_subscription.cancelled_at,
-        created_at=cancelled_subscription.created_at,
-    )
+    return SubscriptionResponse.model_validate(cancelled_subscription)
 
 
 @router.get(
     "/history",
-    response_model=List[PaymentResponse],
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": List[PaymentResponse]}},
     status_code=status.HTTP_200_OK,
     summary="Riwayat pembayaran",
     description="Mendapatkan riwayat pembayaran pengguna.",
@@ -206,31 +228,59 @@ async def get_payment_history(
     offset: int = 0,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> List[PaymentResponse]:
+) -> Response:
     """Get user's payment history"""
-    subscription_service = SubscriptionService(db)
+    # Cache-aside: pages are dropped whenever one of the user's payments is
+    # written, so the TTL only bounds memory, not staleness.
+    body = await get_cached_history(current_user.id, limit, offset)
+    if body is None:
+        subscription_service = SubscriptionService(db)
+
+        payments = await subscription_service.get_payment_history(
+            user_id=current_user.id,
+            limit=limit,
+            offset=offset,
+        )
 
-    payments = await subscription_service.get_payment_history(
-        user_id=current_user.id,
-        limit=limit,
-        offset=offset,
-    )
+        body = _PAYMENT_LIST_ADAPTER.dump_json(
+            _PAYMENT_LIST_ADAPTER.validate_python(payments, from_attributes=True)
+        )
+        await cache_history(current_user.id, limit, offset, body)
+
+    return Response(content=body, media_type="application/json")
 
-    return [
-        PaymentResponse(
-            id=payment.id,
-            user_id=payment.user_id,
-            subscription_id=payment.subscription_id,
-            amount_idr=payment.amount_idr,
-            payment_method=payment.payment_method,
-            payment_provider=payment.payment_provider,
-            payment_provider_transaction_id=payment.payment_provider_transaction_id,
-            status=payment.status,
-            completed_at=payment.completed_at,
-            created_at=payment.created_at,
+
+def _resolve_plan_id(payment, order_id: str) -> str:
+    # Payments created before plan_id was stored fall back to a reverse
+    # lookup by amount.
+    plan_id = payment.plan_id or PRICE_TO_PLAN_ID.get(payment.amount_idr)
+
+    if not plan_id:
+        logger.error(
+            "webhook_plan_not_found",
+            order_id=order_id,
+            amount=payment.amount_idr,
+        )
+        raise BusinessException(
+            code="PLAN_NOT_FOUND",
+            message="Tidak bisa menentukan paket dari jumlah pembayaran",
+        )
+
+    return plan_id
+
+
+async def _activate_subscription(payment_id: str, plan_id: str) -> None:
+    # Background tasks outlive the request session, so this opens its own.
+    try:
+        await run_in_session(
+            lambda db: SubscriptionService(db).activate_from_payment(
+                payment_id, plan_id
+            )
+        )
+    except Exception as e:
+        logger.error(
+            "subscription_activation_failed", payment_id=payment_id, error=str(e)
         )
-        for payment in payments
-    ]
 
 
 @router.post(
@@ -242,135 +292,122 @@ async def get_payment_history(
 )
 async def midtrans_webhook(
     request: Request,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
+    payment_service: PaymentService = Depends(get_payment_service),
 ) -> WebhookResponse:
     """
     Handle payment notification webhook from Midtrans.
     This endpoint is called by Midtrans when payment status changes.
     """
-    try:
-        # Parse request body
-        payload = await request.json()
-
-        logger.info("webhook_received", payload=payload)
+    # Filled in once the payload validates, so the error path can report it
+    # without parsing the body again.
+    order_id = "unknown"
 
-        payment_service = PaymentService()
+    try:
+        # Validate the raw body straight into the schema; a malformed or
+        # incomplete notification fails here instead of on a missing key.
+        notification = _WEBHOOK_ADAPTER.validate_json(await request.body())
+        order_id = notification.order_id
 
-        # Parse notification
-        notification = payment_service.parse_payment_notification(payload)
+        logger.debug(
+            "webhook_received",
+            order_id=order_id,
+            transaction_status=notification.transaction_status,
+        )
 
         # Verify signature
         is_valid = payment_service.verify_signature(
-            order_id=notification["order_id"],
-            status_code=notification["status_code"],
-            gross_amount=notification["gross_amount"],
-            signature_key=notification["signature_key"],
+            order_id=order_id,
+            status_code=notification.status_code,
+            gross_amount=notification.gross_amount,
+            signature_key=notification.signature_key,
         )
 
         if not is_valid:
-            logger.error("webhook_invalid_signature", order_id=notification["order_id"])
+            logger.error("webhook_invalid_signature", order_id=order_id)
             raise BusinessException(
                 code="INVALID_SIGNATURE",
                 message="Signature tidak valid",
             )
 
-        order_id = notification["order_id"]
-        payment_status = notification["payment_status"]
-        transaction_id = notification["transaction_id"]
-        payment_type = notification["payment_type"]
+        payment_status = payment_service.map_transaction_status(
+            notification.transaction_status, notification.fraud_status
+        )
+        payment_type = notification.payment_type
 
-        # Find payment by order_id (stored in payment_provider_transaction_id)
-        from sqlalchemy import select
+        # Update the payment by order_id (stored in
+        # payment_provider_transaction_id) in one statement. A success
+        # notification only matches payments not already successful, so two
+        # concurrent deliveries cannot both activate a subscription.
+        values = {"status": payment_status}
+        conditions = [Payment.payment_provider_transaction_id == order_id]
 
-        query = select(Payment).where(
-            Payment.payment_provider_transaction_id == order_id
+        if payment_status == "success":
+            values["completed_at"] = func.now()
+            values["payment_method"] = payment_service.map_midtrans_payment_type(
+                payment_type
+            )
+            conditions.append(Payment.status != PaymentStatus.SUCCESS.value)
+
+        query = (
+            update(Payment)
+            .where(*conditions)
+            .values(**values)
+            .returning(Payment)
+            .execution_options(synchronize_session=False)
         )
         result = await db.execute(query)
         payment = result.scalar_one_or_none()
 
         if not payment:
-            logger.error("webhook_payment_not_found", order_id=order_id)
-            raise NotFoundException(
-                f"Pembayaran dengan order_id {order_id} tidak ditemukan"
-            )
+            existing = (
+                await db.execute(
+                    select(
+                        Payment.id,
+                        Payment.plan_id,
+                        Payment.amount_idr,
+                        Payment.subscription_id,
+                    ).where(Payment.payment_provider_transaction_id == order_id)
+                )
+            ).one_or_none()
+            if existing is None:
+                logger.error("webhook_payment_not_found", order_id=order_id)
+                raise NotFoundException(
+                    f"Pembayaran dengan order_id {order_id} tidak ditemukan"
+                )
 
-        # Check for duplicate notification (idempotency)
-        if (
-            payment.status == PaymentStatus.SUCCESS.value
-            and payment_status == "success"
-        ):
+            # Duplicate success notification (idempotency). If the earlier
+            # activation never linked a subscription, it is queued again;
+            # activate_from_payment is a no-op once the link exists.
             logger.info("webhook_duplicate_success", order_id=order_id)
+            if existing.subscription_id is None:
+                plan_id = _resolve_plan_id(existing, order_id)
+                background_tasks.add_task(_activate_subscription, existing.id, plan_id)
             return WebhookResponse(
                 status="ok",
                 message="Pembayaran sudah diproses sebelumnya",
                 order_id=order_id,
             )
 
-        # Update payment status
-        old_status = payment.status
-        payment.status = payment_status
-
+        # The subscription is activated after the response is sent, so
+        # Midtrans gets its ACK as soon as the payment row is updated. The plan
+        # is still resolved here so an unknown amount rolls the update back.
+        plan_id = None
         if payment_status == "success":
-            from datetime import datetime
-
-            payment.completed_at = datetime.utcnow()
-            payment.payment_method = payment_service.map_midtrans_payment_type(
-                payment_type
-            )
-
-        await db.flush()
-
-        # If payment successful, create/activate subscription
-        if payment_status == "success" and old_status != PaymentStatus.SUCCESS.value:
-            subscription_service = SubscriptionService(db)
-
-            # Extract plan_id from order_id format: SUB-{user_id}-{timestamp}-{random}
-            # But we need to get it from payment record. For now, we'll need to store it.
-            # Let's check if there's a pending subscription or create new one
-
-            # Get plan_id from the payment amount (reverse lookup)
-            from app.data.subscription_plans import get_all_plans
-
-            plan_id = None
-            for plan in get_all_plans():
-                if plan.price_idr == payment.amount_idr:
-                    plan_id = plan.plan_id
-                    break
-
-            if not plan_id:
-                logger.error(
-                    "webhook_plan_not_found",
-                    order_id=order_id,
-                    amount=payment.amount_idr,
-                )
-                raise BusinessException(
-                    code="PLAN_NOT_FOUND",
-                    message="Tidak bisa menentukan paket dari jumlah pembayaran",
-                )
-
-            # Create subscription
-            subscription = await subscription_service.create_subscription(
-                user_id=payment.user_id,
-                plan_id=plan_id,
-                payment_id=payment.id,
-            )
-
-            # Link payment to subscription
-            payment.subscription_id = subscription.id
-
-            logger.info(
-                "subscription_activated",
-                order_id=order_id,
-                subscription_id=subscription.id,
-                plan_id=plan_id,
-            )
+            plan_id = _resolve_plan_id(payment, order_id)
 
         await db.commit()
+        await invalidate_history(payment.user_id)
+
+        # Queued only after the commit, so activation never reads the
+        # payment before it is marked successful.
+        if plan_id is not None:
+            background_tasks.add_task(_activate_subscription, payment.id, plan_id)
 
         logger.info(
             "webhook_processed",
             order_id=order_id,
-            old_status=old_status,
             new_status=payment_status,
         )
 
@@ -381,15 +418,9 @@ async def midtrans_webhook(
         )
 
     except Exception as e:
-        logger.error("webhook_processing_error", error=str(e))
+        logger.error("webhook_processing_error", order_id=order_id, error=str(e))
         # Always return 200 to Midtrans to prevent retries on our errors
         # But log the error for debugging
-        try:
-            body = await request.json()
-            order_id = body.get("order_id", "unknown")
-        except:
-            order_id = "unknown"
-
         return WebhookResponse(
             status="error",
             message=str(e),
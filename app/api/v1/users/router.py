@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user
 from app.api.v1.users.schemas import (
     DeleteAccountRequest,
     DeleteAccountResponse,
@@ -11,6 +11,7 @@ from app.api.v1.users.schemas import (
     UserStatsResponse,
 )
 from app.db.models import User
+from app.db.session import get_db
 from app.services.user_service import UserService
 
 router = APIRouter()
@@ -18,7 +19,8 @@ router = APIRouter()
 
 @router.get(
     "/me",
-    response_model=UserProfileResponse,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": UserProfileResponse}},
     status_code=status.HTTP_200_OK,
     summary="Dapatkan profil pengguna saat ini",
     description="Mengembalikan informasi profil lengkap pengguna yang sedang login.",
@@ -26,7 +28,7 @@ router = APIRouter()
 async def get_my_profile(
     current_user: User = Depends(get_current_user),
 ) -> UserProfileResponse:
-    return UserProfileResponse.from_orm(current_user)
+    return UserProfileResponse.from_orm_fast(current_user)
 
 
 @router.patch(
@@ -52,7 +54,7 @@ async def update_my_profile(
     )
 
     return UpdateProfileResponse(
-        user=UserProfileResponse.from_orm(updated_user),
+        user=UserProfileResponse.from_orm_fast(updated_user),
     )
 
 
@@ -76,7 +78,8 @@ async def delete_my_account(
 
 @router.get(
     "/me/stats",
-    response_model=UserStatsResponse,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": UserStatsResponse}},
     status_code=status.HTTP_200_OK,
     summary="Dapatkan statistik pengguna",
     description="Mengembalikan statistik penggunaan: jumlah lingkaran, foto, cerita, dan sisa kuota.",
@@ -86,6 +89,8 @@ async def get_my_stats(
     db: AsyncSession = Depends(get_db),
 ) -> UserStatsResponse:
     user_service = UserService(db)
-    stats = await user_service.get_user_stats(current_user.id)
+    stats = await user_service.get_user_stats(
+        current_user.id, current_user.subscription_tier
+    )
 
-    return UserStatsResponse(**stats)
+    return UserStatsResponse.model_construct(**stats)
@@ -1,8 +1,16 @@
 from datetime import datetime
-from typing import Optional
+from typing import Any, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+Language = Literal["id", "en", "jv", "su"]
+
+_VALID_TIMEZONES = ("Asia/Jakarta", "Asia/Makassar", "Asia/Jayapura", "UTC")
+_VALID_TIMEZONE_SET = frozenset(_VALID_TIMEZONES)
+_INVALID_TIMEZONE_MESSAGE = (
+    f"Zona waktu tidak valid. Pilih: {', '.join(_VALID_TIMEZONES)}"
+)
+
 
 class UserProfileResponse(BaseModel):
     id: str
@@ -19,11 +27,27 @@ class UserProfileResponse(BaseModel):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_orm_fast(cls, user: Any) -> "UserProfileResponse":
+        # Values come straight from typed DB columns, so skip validation.
+        return cls.model_construct(
+            id=user.id,
+            phone_number=user.phone_number,
+            display_name=user.display_name,
+            avatar_url=user.avatar_url,
+            language=user.language,
+            timezone=user.timezone,
+            subscription_tier=user.subscription_tier,
+            subscription_expires_at=user.subscription_expires_at,
+            created_at=user.created_at,
+            last_active_at=user.last_active_at,
+        )
+
 
 class UpdateProfileRequest(BaseModel):
     display_name: Optional[str] = Field(None, min_length=1, max_length=100)
     avatar_url: Optional[str] = Field(None, max_length=500)
-    language: Optional[str] = Field(None, pattern=r"^(id|en|jv|su)$")
+    language: Optional[Language] = None
     timezone: Optional[str] = Field(None, max_length=50)
 
     @field_validator("display_name")
@@ -38,17 +62,8 @@ class UpdateProfileRequest(BaseModel):
     @field_validator("timezone")
     @classmethod
     def validate_timezone(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None:
-            valid_timezones = [
-                "Asia/Jakarta",
-                "Asia/Makassar",
-                "Asia/Jayapura",
-                "UTC",
-            ]
-            if v not in valid_timezones:
-                raise ValueError(
-                    f"Zona waktu tidak valid. Pilih: {', '.join(valid_timezones)}"
-                )
+        if v is not None and v not in _VALID_TIMEZONE_SET:
+            raise ValueError(_INVALID_TIMEZONE_MESSAGE)
         return v
 
 
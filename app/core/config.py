@@ -1,3 +1,4 @@
+from dataclasses import dataclass, fields
 from functools import lru_cache
 from typing import Optional
 
@@ -19,9 +20,22 @@ class Settings(BaseSettings):
 
     DATABASE_URL: str
     DATABASE_ECHO: bool = False
+    DATABASE_POOL_SIZE: int = 20
+    DATABASE_MAX_OVERFLOW: int = 40
+    DATABASE_POOL_RECYCLE_SECONDS: int = 300
+    DATABASE_POOL_TIMEOUT_SECONDS: int = 5
+    DATABASE_POOL_WARMUP: int = 5
+    DATABASE_STATEMENT_CACHE_SIZE: int = 1024
+    DATABASE_PREPARED_STATEMENT_CACHE_SIZE: int = 256
 
     REDIS_URL: str = "redis://localhost:6379/0"
 
+    USER_CACHE_TTL_SECONDS: int = 30
+    USER_CACHE_MAX_SIZE: int = 10000
+    USER_CACHE_REDIS_TTL_SECONDS: int = 300
+    PAYMENT_HISTORY_CACHE_TTL_SECONDS: int = 60
+    USER_STATS_CACHE_TTL_SECONDS: int = 30
+
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
@@ -80,3 +94,24 @@ def get_settings() -> Settings:
 
 
 settings = get_settings()
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimeConfig:
+    # Immutable snapshot of the settings read on per-request paths (token
+    # checks, URL signing, webhook verification).
+    JWT_SECRET_KEY: str
+    JWT_ALGORITHM: str
+    JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int
+    JWT_REFRESH_TOKEN_EXPIRE_DAYS: int
+    AWS_ACCESS_KEY_ID: Optional[str]
+    AWS_SECRET_ACCESS_KEY: Optional[str]
+    AWS_REGION: str
+    S3_BUCKET_NAME: str
+    MIDTRANS_SERVER_KEY: Optional[str]
+    REDIS_URL: str
+
+
+runtime_config = RuntimeConfig(
+    **{field.name: getattr(settings, field.name) for field in fields(RuntimeConfig)}
+)
@@ -1,6 +1,21 @@
 from typing import Any, Dict, Optional
 
-from fastapi import HTTPException, status
+from fastapi import HTTPException, Request, Response, status
+from fastapi.utils import is_body_allowed_for_status_code
+from sqlalchemy.exc import DBAPIError
+from starlette.exceptions import HTTPException as StarletteHTTPException
+
+from app.core.responses import ORJSONResponse
+
+# Shared by every 401; never mutated.
+_BEARER_CHALLENGE = {"WWW-Authenticate": "Bearer"}
+
+
+def _detail(code: str, message: str, default: Dict[str, Any]) -> Dict[str, Any]:
+    # Raises that keep the default message reuse one prebuilt dict.
+    if message == default["message"]:
+        return default
+    return {"code": code, "message": message}
 
 
 class BusinessException(HTTPException):
@@ -21,35 +36,52 @@ class BusinessException(HTTPException):
 
 
 class NotFoundException(HTTPException):
-    def __init__(self, message: str = "Data tidak ditemukan"):
+    _default_detail = {"code": "NOT_FOUND", "message": "Data tidak ditemukan"}
+
+    def __init__(self, message: str = _default_detail["message"]):
         super().__init__(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail={"code": "NOT_FOUND", "message": message},
+            detail=_detail("NOT_FOUND", message, self._default_detail),
         )
 
 
 class ForbiddenException(HTTPException):
-    def __init__(self, message: str = "Kamu tidak punya izin untuk aksi ini"):
+    _default_detail = {
+        "code": "FORBIDDEN",
+        "message": "Kamu tidak punya izin untuk aksi ini",
+    }
+
+    def __init__(self, message: str = _default_detail["message"]):
         super().__init__(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail={"code": "FORBIDDEN", "message": message},
+            detail=_detail("FORBIDDEN", message, self._default_detail),
         )
 
 
 class UnauthorizedException(HTTPException):
-    def __init__(self, message: str = "Silakan login terlebih dahulu"):
+    _default_detail = {
+        "code": "UNAUTHORIZED",
+        "message": "Silakan login terlebih dahulu",
+    }
+
+    def __init__(self, message: str = _default_detail["message"]):
         super().__init__(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail={"code": "UNAUTHORIZED", "message": message},
-            headers={"WWW-Authenticate": "Bearer"},
+            detail=_detail("UNAUTHORIZED", message, self._default_detail),
+            headers=_BEARER_CHALLENGE,
         )
 
 
 class RateLimitException(HTTPException):
-    def __init__(self, message: str = "Terlalu banyak permintaan. Coba lagi nanti."):
+    _default_detail = {
+        "code": "RATE_LIMIT_EXCEEDED",
+        "message": "Terlalu banyak permintaan. Coba lagi nanti.",
+    }
+
+    def __init__(self, message: str = _default_detail["message"]):
         super().__init__(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail={"code": "RATE_LIMIT_EXCEEDED", "message": message},
+            detail=_detail("RATE_LIMIT_EXCEEDED", message, self._default_detail),
         )
 
 
@@ -69,3 +101,35 @@ class ValidationException(HTTPException):
                 "details": details,
             },
         )
+
+
+async def http_exception_handler(
+    request: Request, exc: StarletteHTTPException
+) -> Response:
+    # Same behaviour as FastAPI's default handler, encoded with orjson.
+    headers = getattr(exc, "headers", None)
+    if not is_body_allowed_for_status_code(exc.status_code):
+        return Response(status_code=exc.status_code, headers=headers)
+    return ORJSONResponse(
+        {"detail": exc.detail}, status_code=exc.status_code, headers=headers
+    )
+
+
+def _is_invalid_uuid(exc: DBAPIError) -> bool:
+    # asyncpg rejects a malformed uuid argument client-side while encoding it;
+    # literals that reach the server fail with invalid_text_representation.
+    if getattr(exc.orig, "sqlstate", None) == "22P02":
+        return True
+    message = str(exc.orig)
+    return "invalid input for query argument" in message and "UUID" in message
+
+
+async def invalid_id_handler(request: Request, exc: DBAPIError) -> Response:
+    # Ids are native uuid columns, so a malformed id in a path or body fails
+    # in the driver; to the client that is simply a record that doesn't exist.
+    if not _is_invalid_uuid(exc):
+        raise exc
+    return ORJSONResponse(
+        {"detail": NotFoundException._default_detail},
+        status_code=status.HTTP_404_NOT_FOUND,
+    )
@@ -0,0 +1,28 @@
+from typing import Optional
+
+import httpx
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def init_http_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=200),
+            timeout=httpx.Timeout(10.0, connect=2.0),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_http_client() -> Optional[httpx.AsyncClient]:
+    # None outside the API process (e.g. Celery workers), where callers fall
+    # back to their own short-lived clients.
+    return _client
@@ -1,58 +1,103 @@
 import logging
+import re
 import sys
+from functools import lru_cache
 from typing import Any, Dict
 
+import orjson
 import structlog
 
 from app.core.config import settings
 
+_MIN_LEVEL = logging.DEBUG if settings.APP_DEBUG else logging.INFO
+
+# Production renders straight to bytes with orjson and writes them without
+# going through print(); development keeps the console renderer.
+if settings.is_production:
+    _RENDERER = structlog.processors.JSONRenderer(serializer=orjson.dumps)
+    _LOGGER_FACTORY = structlog.BytesLoggerFactory()
+else:
+    _RENDERER = structlog.dev.ConsoleRenderer()
+    _LOGGER_FACTORY = structlog.WriteLoggerFactory()
+
+# Keys whose values never belong in a log line. "phone" is left out because
+# call sites already pass mask_phone() output, and "code" is used for error
+# codes.
+_LOG_REDACTED_KEYS = frozenset(
+    {"phone_number", "otp", "token", "access_token", "refresh_token", "password"}
+)
+_JWT_RE = re.compile(r"eyJ[\w-]+\.[\w-]+\.[\w-]+")
+
+
+def _mask_log_fields(
+    logger: Any, method_name: str, event_dict: Dict[str, Any]
+) -> Dict[str, Any]:
+    for key, value in event_dict.items():
+        if key in _LOG_REDACTED_KEYS:
+            event_dict[key] = _mask_value(value)
+        elif isinstance(value, str) and "eyJ" in value:
+            # Tokens that end up inside error messages or URLs.
+            event_dict[key] = _JWT_RE.sub("****", value)
+    return event_dict
+
+
+_PROCESSORS = [
+    structlog.contextvars.merge_contextvars,
+    structlog.processors.add_log_level,
+    structlog.processors.StackInfoRenderer(),
+    structlog.dev.set_exc_info,
+    structlog.processors.TimeStamper(fmt="iso"),
+    _mask_log_fields,
+    _RENDERER,
+]
+
 
 def setup_logging() -> None:
     structlog.configure(
-        processors=[
-            structlog.contextvars.merge_contextvars,
-            structlog.processors.add_log_level,
-            structlog.processors.StackInfoRenderer(),
-            structlog.dev.set_exc_info,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.JSONRenderer()
-            if settings.is_production
-            else structlog.dev.ConsoleRenderer(),
-        ],
-        wrapper_class=structlog.make_filtering_bound_logger(
-            logging.DEBUG if settings.APP_DEBUG else logging.INFO
-        ),
+        processors=_PROCESSORS,
+        wrapper_class=structlog.make_filtering_bound_logger(_MIN_LEVEL),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=_LOGGER_FACTORY,
         cache_logger_on_first_use=True,
     )
 
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=logging.DEBUG if settings.APP_DEBUG else logging.INFO,
-    )
+    # structlog no longer goes through stdlib logging; the root handler is
+    # only for third-party libraries.
+    root = logging.getLogger()
+    root.handlers = [logging.StreamHandler(sys.stdout)]
+    root.setLevel(_MIN_LEVEL)
 
 
+@lru_cache(maxsize=256)
 def get_logger(name: str) -> structlog.BoundLogger:
-    return structlog.get_logger(name)
+    # Returns a finalized logger rather than a lazy proxy, so it is bound to
+    # the configuration at call time: only use it after setup_logging().
+    # Module-level loggers created at import should keep using
+    # structlog.get_logger(__name__).
+    return structlog.get_logger().bind(logger=name)
 
 
 def mask_phone(phone: str) -> str:
     if len(phone) < 8:
         return "****"
-    return f"{phone[:4]}****{phone[-4:]}"
+    return phone[:4] + "****" + phone[-4:]
+
+
+_SENSITIVE_KEYS = frozenset(
+    {"phone_number", "phone", "otp", "code", "token", "password"}
+)
+
+
+def _mask_value(value: Any) -> str:
+    if isinstance(value, str) and len(value) >= 8:
+        return f"{value[:2]}****{value[-2:]}"
+    return "****"
 
 
 def mask_sensitive_data(data: Dict[str, Any]) -> Dict[str, Any]:
-    sensitive_keys = {"phone_number", "phone", "otp", "code", "token", "password"}
-    masked = {}
-    for key, value in data.items():
-        if key.lower() in sensitive_keys:
-            if isinstance(value, str):
-                masked[key] = "****" if len(value) < 8 else f"{value[:2]}****{value[-2:]}"
-            else:
-                masked[key] = "****"
-        else:
-            masked[key] = value
-    return masked
+    # Keys are matched as-is; payload keys in this app are all lowercase.
+    sensitive_keys = _SENSITIVE_KEYS
+    return {
+        key: _mask_value(value) if key in sensitive_keys else value
+        for key, value in data.items()
+    }
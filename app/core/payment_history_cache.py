@@ -0,0 +1,59 @@
+from typing import Optional
+
+import structlog
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.redis import get_redis
+
+logger = structlog.get_logger(__name__)
+
+# Serialized /subscriptions/history pages. All pages of one user live in a
+# single hash, field "{limit}:{offset}", so any payment write for that user
+# drops them with one DEL.
+
+
+def _redis_key(user_id: str) -> str:
+    return f"pay:hist:{user_id}"
+
+
+def _page_field(limit: int, offset: int) -> str:
+    return f"{limit}:{offset}"
+
+
+async def get_cached_history(user_id: str, limit: int, offset: int) -> Optional[bytes]:
+    client = get_redis()
+    if client is None:
+        return None
+
+    try:
+        return await client.hget(_redis_key(user_id), _page_field(limit, offset))
+    except RedisError as exc:
+        logger.warning("payment_history_cache_redis_error", error=str(exc))
+        return None
+
+
+async def cache_history(user_id: str, limit: int, offset: int, body: bytes) -> None:
+    client = get_redis()
+    if client is None:
+        return
+
+    key = _redis_key(user_id)
+    try:
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.hset(key, _page_field(limit, offset), body)
+            pipe.expire(key, settings.PAYMENT_HISTORY_CACHE_TTL_SECONDS)
+            await pipe.execute()
+    except RedisError as exc:
+        logger.warning("payment_history_cache_redis_error", error=str(exc))
+
+
+async def invalidate_history(user_id: str) -> None:
+    client = get_redis()
+    if client is None:
+        return
+
+    try:
+        await client.delete(_redis_key(user_id))
+    except RedisError as exc:
+        logger.warning("payment_history_cache_redis_error", error=str(exc))
@@ -0,0 +1,32 @@
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+
+_client: Optional[Redis] = None
+
+
+def init_redis() -> Redis:
+    global _client
+    if _client is None:
+        _client = Redis.from_url(
+            settings.REDIS_URL,
+            max_connections=100,
+            socket_connect_timeout=1.0,
+            socket_timeout=0.5,
+        )
+    return _client
+
+
+async def close_redis() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_redis() -> Optional[Redis]:
+    # None outside the API process. Redis is only ever used as a cache here,
+    # so callers treat a missing client like a miss.
+    return _client
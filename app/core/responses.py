@@ -0,0 +1,28 @@
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request
+from fastapi.responses import ORJSONResponse as _ORJSONResponse
+
+
+class ORJSONResponse(_ORJSONResponse):
+    # Render UTC datetimes with a trailing "Z", matching what Pydantic emits
+    # for response models, so dict-built responses serialize identically.
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+        )
+
+
+def weak_etag(*parts: Any) -> str:
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=12)
+    return f'W/"{digest.hexdigest()}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return header.strip() == "*" or etag in (tag.strip() for tag in header.split(","))
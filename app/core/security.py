@@ -1,29 +1,51 @@
-from datetime import datetime, timedelta
+import hashlib
+import time
+from datetime import timedelta
 from typing import Any, Dict, Optional
 
-from jose import JWTError, jwt
+import jwt
+from jwt.algorithms import get_default_algorithms
 
-from app.core.config import settings
+from app.core.cache import TTLCache
+from app.core.config import runtime_config
 from app.core.exceptions import UnauthorizedException
 
+# Verified token payloads, keyed by SHA-256 of the token. Lets repeat
+# requests skip signature verification; entries are shared, so callers must
+# not mutate the returned payload.
+_token_cache: TTLCache[Dict[str, Any]] = TTLCache(maxsize=10000, ttl=300)
+
+# Parsed once, so RS*/ES* keys aren't re-read from PEM on every encode and
+# decode. For HS* this is just the secret as bytes; for asymmetric keys
+# verification uses the public half.
+_JWT_KEY = get_default_algorithms()[runtime_config.JWT_ALGORITHM].prepare_key(
+    runtime_config.JWT_SECRET_KEY
+)
+_JWT_VERIFY_KEY = (
+    _JWT_KEY.public_key() if hasattr(_JWT_KEY, "public_key") else _JWT_KEY
+)
+
+# Tokens carry exp as an integer timestamp computed from these offsets.
+_ACCESS_EXPIRE_SECONDS = runtime_config.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_REFRESH_EXPIRE_SECONDS = runtime_config.JWT_REFRESH_TOKEN_EXPIRE_DAYS * 86400
+
 
 def create_access_token(
     user_id: str,
     expires_delta: Optional[timedelta] = None,
 ) -> str:
-    expire = datetime.utcnow() + (
-        expires_delta
-        or timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
+    expires_in = (
+        int(expires_delta.total_seconds()) if expires_delta else _ACCESS_EXPIRE_SECONDS
     )
     to_encode = {
         "sub": user_id,
-        "exp": expire,
+        "exp": int(time.time()) + expires_in,
         "type": "access",
     }
     return jwt.encode(
         to_encode,
-        settings.JWT_SECRET_KEY,
-        algorithm=settings.JWT_ALGORITHM,
+        _JWT_KEY,
+        algorithm=runtime_config.JWT_ALGORITHM,
     )
 
 
@@ -31,33 +53,41 @@ def create_refresh_token(
     user_id: str,
     expires_delta: Optional[timedelta] = None,
 ) -> str:
-    expire = datetime.utcnow() + (
-        expires_delta
-        or timedelta(days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS)
+    expires_in = (
+        int(expires_delta.total_seconds()) if expires_delta else _REFRESH_EXPIRE_SECONDS
     )
     to_encode = {
         "sub": user_id,
-        "exp": expire,
+        "exp": int(time.time()) + expires_in,
         "type": "refresh",
     }
     return jwt.encode(
         to_encode,
-        settings.JWT_SECRET_KEY,
-        algorithm=settings.JWT_ALGORITHM,
+        _JWT_KEY,
+        algorithm=runtime_config.JWT_ALGORITHM,
     )
 
 
 def decode_token(token: str) -> Dict[str, Any]:
+    key = hashlib.sha256(token.encode()).digest()
+    payload = _token_cache.get(key)
+    # A cached token is still rejected once it is about to expire.
+    if payload is not None and time.time() < payload["exp"] - 5:
+        return payload
+
     try:
         payload = jwt.decode(
             token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM],
+            _JWT_VERIFY_KEY,
+            algorithms=[runtime_config.JWT_ALGORITHM],
         )
-        return payload
-    except JWTError:
+    except jwt.InvalidTokenError:
         raise UnauthorizedException("Token tidak valid atau sudah kadaluarsa")
 
+    if "exp" in payload:
+        _token_cache.set(key, payload)
+    return payload
+
 
 def verify_access_token(token: str) -> str:
     payload = decode_token(token)
@@ -0,0 +1,115 @@
+from datetime import datetime
+from typing import Iterable, Optional
+
+import orjson
+import structlog
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import DateTime
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.db.models import User
+
+logger = structlog.get_logger(__name__)
+
+# Authenticated users resolved by get_current_user, keyed by user id. Entries
+# are detached ORM instances and must be treated as read-only snapshots.
+_user_cache: TTLCache[User] = TTLCache(
+    maxsize=settings.USER_CACHE_MAX_SIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+)
+
+# Redis sits behind the per-process cache so a user loaded by one worker is
+# reused by the others. Only column values are stored.
+_USER_COLUMNS = tuple(column.key for column in User.__table__.columns)
+_DATETIME_COLUMNS = frozenset(
+    column.key for column in User.__table__.columns if isinstance(column.type, DateTime)
+)
+
+
+def _redis_key(user_id: str) -> str:
+    return f"user:v1:{user_id}"
+
+
+def _dump_user(user: User) -> bytes:
+    return orjson.dumps({key: getattr(user, key) for key in _USER_COLUMNS})
+
+
+def _load_user(raw: bytes) -> User:
+    data = orjson.loads(raw)
+    for key in _DATETIME_COLUMNS:
+        if data.get(key) is not None:
+            data[key] = datetime.fromisoformat(data[key])
+    return User(**data)
+
+
+def get_cached_user(user_id: str) -> Optional[User]:
+    return _user_cache.get(user_id)
+
+
+def cache_user(user: User) -> None:
+    _user_cache.set(user.id, user)
+
+
+async def get_shared_user(user_id: str) -> Optional[User]:
+    client = get_redis()
+    if client is None:
+        return None
+
+    try:
+        raw = await client.get(_redis_key(user_id))
+    except RedisError as exc:
+        logger.warning("user_cache_redis_error", error=str(exc))
+        return None
+
+    if raw is None:
+        return None
+
+    user = _load_user(raw)
+    cache_user(user)
+    return user
+
+
+async def share_user(user: User) -> None:
+    cache_user(user)
+
+    client = get_redis()
+    if client is None:
+        return
+
+    try:
+        await client.set(
+            _redis_key(user.id),
+            _dump_user(user),
+            ex=settings.USER_CACHE_REDIS_TTL_SECONDS,
+        )
+    except RedisError as exc:
+        logger.warning("user_cache_redis_error", error=str(exc))
+
+
+async def invalidate_user(user_id: str) -> None:
+    await invalidate_users((user_id,))
+
+
+async def invalidate_users(user_ids: Iterable[str]) -> None:
+    keys = []
+    for user_id in user_ids:
+        _user_cache.delete(user_id)
+        keys.append(_redis_key(user_id))
+
+    if not keys:
+        return
+
+    # Celery workers have no shared client, but their writes (e.g. expiring
+    # subscriptions) still have to evict the API's shared entries.
+    try:
+        client = get_redis()
+        if client is not None:
+            await client.delete(*keys)
+        else:
+            async with Redis.from_url(settings.REDIS_URL) as client:
+                await client.delete(*keys)
+    except RedisError as exc:
+        logger.warning("user_cache_redis_error", error=str(exc))
@@ -0,0 +1,51 @@
+from typing import Optional, Tuple
+
+import orjson
+import structlog
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.redis import get_redis
+
+logger = structlog.get_logger(__name__)
+
+# (circles, photos, stories) counts behind /users/me/stats. Photo and story
+# counts span every circle the user belongs to, so they change on other
+# members' writes too; entries are left to expire rather than invalidated.
+Counts = Tuple[int, int, int]
+
+
+def _redis_key(user_id: str) -> str:
+    return f"stats:v1:{user_id}"
+
+
+async def get_cached_counts(user_id: str) -> Optional[Counts]:
+    client = get_redis()
+    if client is None:
+        return None
+
+    try:
+        raw = await client.get(_redis_key(user_id))
+    except RedisError as exc:
+        logger.warning("user_stats_cache_redis_error", error=str(exc))
+        return None
+
+    if raw is None:
+        return None
+    circles, photos, stories = orjson.loads(raw)
+    return circles, photos, stories
+
+
+async def cache_counts(user_id: str, counts: Counts) -> None:
+    client = get_redis()
+    if client is None:
+        return
+
+    try:
+        await client.set(
+            _redis_key(user_id),
+            orjson.dumps(counts),
+            ex=settings.USER_STATS_CACHE_TTL_SECONDS,
+        )
+    except RedisError as exc:
+        logger.warning("user_stats_cache_redis_error", error=str(exc))
@@ -1,4 +1,5 @@
-from typing import Dict, List
+import random
+from typing import Dict, List, Tuple
 
 AI_PROMPTS: Dict[str, Dict[str, List[str]]] = {
     "keluarga": {
@@ -142,13 +143,23 @@ def get_prompts_by_circle_type(circle_type: str) -> Dict[str, List[str]]:
     return AI_PROMPTS.get(circle_type, AI_PROMPTS["pribadi"])
 
 
+def get_prompt_pool(circle_type: str) -> Tuple[str, ...]:
+    return _FLAT_PROMPTS.get(circle_type, _FLAT_PROMPTS["pribadi"])
+
+
 def get_all_prompts_flat(circle_type: str) -> List[str]:
-    prompts = get_prompts_by_circle_type(circle_type)
-    return [prompt for category_prompts in prompts.values() for prompt in category_prompts]
+    return list(get_prompt_pool(circle_type))
 
 
 def get_random_prompts(circle_type: str, count: int = 3) -> List[str]:
-    import random
-    
-    all_prompts = get_all_prompts_flat(circle_type)
+    all_prompts = get_prompt_pool(circle_type)
     return random.sample(all_prompts, min(count, len(all_prompts)))
+
+
+# Prompts per circle type flattened across categories, built once.
+_FLAT_PROMPTS: Dict[str, Tuple[str, ...]] = {
+    circle_type: tuple(
+        prompt for category_prompts in prompts.values() for prompt in category_prompts
+    )
+    for circle_type, prompts in AI_PROMPTS.items()
+}
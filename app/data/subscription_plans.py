@@ -3,51 +3,38 @@ Subscription plan definitions for Kenang.
 Contains pricing, features, and limits for each subscription tier.
 """
 
+from dataclasses import dataclass, field, fields
 from typing import Dict, List, Optional
 
 from app.db.models.subscription import PlanId
 
 
+@dataclass(frozen=True, slots=True)
 class SubscriptionPlan:
     """Subscription plan data structure"""
 
-    def __init__(
-        self,
-        plan_id: str,
-        name_id: str,
-        name_en: str,
-        description_id: str,
-        price_idr: int,
-        billing_cycle: str,
-        features: List[str],
-        limits: Dict[str, Optional[int]],
-        is_popular: bool = False,
-        recommended_for: Optional[List[str]] = None,
-    ):
-        self.plan_id = plan_id
-        self.name_id = name_id
-        self.name_en = name_en
-        self.description_id = description_id
-        self.price_idr = price_idr
-        self.billing_cycle = billing_cycle
-        self.features = features
-        self.limits = limits
-        self.is_popular = is_popular
-        self.recommended_for = recommended_for or []
+    plan_id: str
+    name_id: str
+    name_en: str
+    description_id: str
+    price_idr: int
+    billing_cycle: str
+    features: List[str]
+    limits: Dict[str, Optional[int]]
+    is_popular: bool = False
+    recommended_for: List[str] = field(default_factory=list)
+    _dict: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Plan data is static, so the dict form is built once.
+        object.__setattr__(
+            self,
+            "_dict",
+            {f.name: getattr(self, f.name) for f in fields(self) if f.init},
+        )
 
     def to_dict(self) -> dict:
-        return {
-            "plan_id": self.plan_id,
-            "name_id": self.name_id,
-            "name_en": self.name_en,
-            "description_id": self.description_id,
-            "price_idr": self.price_idr,
-            "billing_cycle": self.billing_cycle,
-            "features": self.features,
-            "limits": self.limits,
-            "is_popular": self.is_popular,
-            "recommended_for": self.recommended_for,
-        }
+        return dict(self._dict)
 
 
 # Subscription plan definitions
@@ -251,6 +238,20 @@ SUBSCRIPTION_PLANS: Dict[str, SubscriptionPlan] = {
     ),
 }
 
+# Reverse lookup used by the payment webhook. Prices must stay unique for it
+# to be unambiguous, which is checked here at import rather than at runtime.
+PRICE_TO_PLAN_ID: Dict[int, str] = {
+    plan.price_idr: plan.plan_id for plan in SUBSCRIPTION_PLANS.values()
+}
+if len(PRICE_TO_PLAN_ID) != len(SUBSCRIPTION_PLANS):
+    raise RuntimeError("Duplicate plan prices: PRICE_TO_PLAN_ID would be ambiguous")
+
+# Plans never change after import, so the listings are built once.
+_ALL_PLANS = tuple(SUBSCRIPTION_PLANS.values())
+_PURCHASABLE_PLANS = tuple(
+    plan for plan in _ALL_PLANS if plan.plan_id != PlanId.FREE.value
+)
+
 
 def get_plan(plan_id: str) -> Optional[SubscriptionPlan]:
     """Get subscription plan by ID"""
@@ -259,16 +260,12 @@ def get_plan(plan_id: str) -> Optional[SubscriptionPlan]:
 
 def get_all_plans() -> List[SubscriptionPlan]:
     """Get all available subscription plans"""
-    return list(SUBSCRIPTION_PLANS.values())
+    return list(_ALL_PLANS)
 
 
 def get_purchasable_plans() -> List[SubscriptionPlan]:
     """Get plans that can be purchased (exclude FREE)"""
-    return [
-        plan
-        for plan in SUBSCRIPTION_PLANS.values()
-        if plan.plan_id != PlanId.FREE.value
-    ]
+    return list(_PURCHASABLE_PLANS)
 
 
 def get_plan_price(plan_id: str) -> int:
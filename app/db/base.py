@@ -1,7 +1,34 @@
-from sqlalchemy import Column, DateTime, String
-from sqlalchemy.orm import DeclarativeBase, declared_attr
-from sqlalchemy.sql import func
 import uuid
+from typing import Any, Optional
+
+from sqlalchemy import Column, DateTime
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.engine import Dialect
+from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr
+from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
+
+
+class UUIDType(TypeDecorator):
+    # Native 16-byte uuid columns that still read and write Python str, so ids
+    # compare and serialize as before. Values are bound as uuid.UUID: with
+    # as_uuid=False, multi-row INSERT ... RETURNING could not match the str
+    # parameters to the uuids asyncpg returns ("Can't match sentinel values").
+    impl = UUID(as_uuid=True)
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        try:
+            return uuid.UUID(value)
+        except ValueError:
+            # Let asyncpg reject it, so malformed ids still surface as the
+            # DBAPIError that invalid_id_handler turns into a 404.
+            return value
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Optional[str]:
+        return None if value is None else str(value)
 
 
 class Base(DeclarativeBase):
@@ -32,9 +59,9 @@ class SoftDeleteMixin:
 
 class UUIDMixin:
     @declared_attr
-    def id(cls) -> Column:
+    def id(cls) -> Mapped[str]:
         return Column(
-            String(36),
+            UUIDType,
             primary_key=True,
             default=lambda: str(uuid.uuid4()),
         )
@@ -1,4 +1,7 @@
 from app.db.models.circle import (
+    ADMIN_ROLE,
+    CONTRIBUTOR_ROLE,
+    WRITER_ROLES,
     Circle,
     CircleMember,
     CircleMembership,
@@ -27,7 +30,7 @@ from app.db.models.subscription import (
 from app.db.models.time_capsule import RecipientType, TimeCapsule, TimeCapsuleStatus
 from app.db.models.user import OTPCode, SubscriptionTier, User
 
-__all__ = [
+__all__ = (
     "User",
     "OTPCode",
     "SubscriptionTier",
@@ -37,6 +40,9 @@ __all__ = [
     "CircleType",
     "CirclePrivacy",
     "MemberRole",
+    "ADMIN_ROLE",
+    "CONTRIBUTOR_ROLE",
+    "WRITER_ROLES",
     "Photo",
     "PhotoTag",
     "Story",
@@ -56,4 +62,4 @@ __all__ = [
     "TimeCapsule",
     "RecipientType",
     "TimeCapsuleStatus",
-]
+)
@@ -4,7 +4,7 @@ from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, String, Tex
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
-from app.db.base import Base, SoftDeleteMixin, TimestampMixin, UUIDMixin
+from app.db.base import Base, SoftDeleteMixin, TimestampMixin, UUIDMixin, UUIDType
 
 
 class CircleType(str, Enum):
@@ -29,6 +29,13 @@ class MemberRole(str, Enum):
     VIEWER = "viewer"
 
 
+# Plain strings for per-request role checks, which would otherwise go through
+# the enum's attribute lookup and .value each time.
+ADMIN_ROLE = MemberRole.ADMIN.value
+CONTRIBUTOR_ROLE = MemberRole.CONTRIBUTOR.value
+WRITER_ROLES = frozenset({ADMIN_ROLE, CONTRIBUTOR_ROLE})
+
+
 class Circle(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
     __tablename__ = "circles"
 
@@ -43,7 +50,7 @@ class Circle(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
     invite_code_expires_at = Column(DateTime(timezone=True), nullable=True)
     settings = Column(JSONB, default=dict, nullable=False)
     created_by = Column(
-        String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+        UUIDType, ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
 
     creator = relationship(
@@ -68,28 +75,25 @@ class Circle(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
         "TimeCapsule", back_populates="circle", cascade="all, delete-orphan"
     )
 
-    __table_args__ = (
-        Index("idx_circles_type", "type"),
-        Index("idx_circles_invite_code", "invite_code"),
-        Index("idx_circles_created_by", "created_by"),
-    )
+    # type and invite_code are indexed through index=True on the columns.
+    __table_args__ = (Index("idx_circles_created_by", "created_by"),)
 
 
 class CircleMembership(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "circle_memberships"
 
     circle_id = Column(
-        String(36), ForeignKey("circles.id", ondelete="CASCADE"), nullable=False
+        UUIDType, ForeignKey("circles.id", ondelete="CASCADE"), nullable=False
     )
     user_id = Column(
-        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        UUIDType, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     role = Column(String(20), default=MemberRole.CONTRIBUTOR.value, nullable=False)
     custom_label = Column(String(50), nullable=True)
     notifications_enabled = Column(Boolean, default=True, nullable=False)
     joined_at = Column(DateTime(timezone=True), nullable=True)
     invited_by = Column(
-        String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+        UUIDType, ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
 
     circle = relationship("Circle", back_populates="memberships")
@@ -97,8 +101,8 @@ class CircleMembership(Base, UUIDMixin, TimestampMixin):
     inviter = relationship("User", foreign_keys=[invited_by])
 
     __table_args__ = (
+        # Lookups by circle_id use the leading column of the unique index.
         Index("idx_circle_memberships_user_id", "user_id"),
-        Index("idx_circle_memberships_circle_id", "circle_id"),
         Index(
             "uq_circle_memberships_circle_user",
             "circle_id",
@@ -112,16 +116,16 @@ class CircleMember(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "circle_members"
 
     circle_id = Column(
-        String(36), ForeignKey("circles.id", ondelete="CASCADE"), nullable=False
+        UUIDType, ForeignKey("circles.id", ondelete="CASCADE"), nullable=False
     )
     name = Column(String(100), nullable=False)
     custom_label = Column(String(50), nullable=True)
     avatar_url = Column(String(500), nullable=True)
     linked_user_id = Column(
-        String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+        UUIDType, ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
     created_by = Column(
-        String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+        UUIDType, ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
 
     circle = relationship("Circle", back_populates="members")
@@ -1,10 +1,20 @@
 from enum import Enum
 
-from sqlalchemy import Column, DateTime, ForeignKey, Index, String, Text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    text,
+    true,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
-from app.db.base import Base, TimestampMixin, UUIDMixin
+from app.db.base import Base, TimestampMixin, UUIDMixin, UUIDType
 
 
 class NotificationType(str, Enum):
@@ -30,7 +40,7 @@ class Notification(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "notifications"
 
     user_id = Column(
-        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        UUIDType, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     type = Column(String(50), nullable=False)
     title = Column(String(200), nullable=True)
@@ -41,9 +51,16 @@ class Notification(Base, UUIDMixin, TimestampMixin):
     user = relationship("User", back_populates="notifications")
 
     __table_args__ = (
-        Index("idx_notifications_user_id", "user_id"),
+        # A user's feed, newest first; also serves the user_id foreign key.
+        Index("idx_notifications_user_created", "user_id", text("created_at DESC")),
+        # Unread badge/list: only unread rows are indexed.
+        Index(
+            "idx_notifications_user_unread",
+            "user_id",
+            text("created_at DESC"),
+            postgresql_where=text("read_at IS NULL"),
+        ),
         Index("idx_notifications_type", "type"),
-        Index("idx_notifications_read_at", "read_at"),
         Index("idx_notifications_created_at", "created_at"),
     )
 
@@ -52,18 +69,24 @@ class DeviceToken(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "device_tokens"
 
     user_id = Column(
-        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        UUIDType, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     token = Column(String(500), nullable=False)
     platform = Column(String(20), nullable=False)
     device_id = Column(String(255), nullable=True)
-    is_active = Column(String(5), default="true", nullable=False)
+    is_active = Column(Boolean, default=True, server_default=true(), nullable=False)
     last_used_at = Column(DateTime(timezone=True), nullable=True)
 
     user = relationship("User", back_populates="device_tokens")
 
     __table_args__ = (
         Index("idx_device_tokens_user_id", "user_id"),
+        # Push dispatch only looks at a user's active tokens.
+        Index(
+            "idx_device_tokens_active",
+            "user_id",
+            postgresql_where=text("is_active"),
+        ),
         Index("idx_device_tokens_token", "token"),
         Index("idx_device_tokens_platform", "platform"),
     )
@@ -2,17 +2,17 @@ from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, Numeric, St
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
-from app.db.base import Base, SoftDeleteMixin, TimestampMixin, UUIDMixin
+from app.db.base import Base, SoftDeleteMixin, TimestampMixin, UUIDMixin, UUIDType
 
 
 class Photo(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
     __tablename__ = "photos"
 
     circle_id = Column(
-        String(36), ForeignKey("circles.id", ondelete="CASCADE"), nullable=False
+        UUIDType, ForeignKey("circles.id", ondelete="CASCADE"), nullable=False
     )
     uploaded_by = Column(
-        String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+        UUIDType, ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
     storage_key = Column(String(500), nullable=False)
     thumbnail_key = Column(String(500), nullable=True)
@@ -36,11 +36,12 @@ class Photo(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
         "PhotoTag", back_populates="photo", cascade="all, delete-orphan"
     )
 
+    # hash is indexed through index=True on the column. exif_data is not
+    # indexed: nothing filters on it yet.
     __table_args__ = (
         Index("idx_photos_circle_id", "circle_id"),
         Index("idx_photos_taken_at", "taken_at"),
         Index("idx_photos_uploaded_by", "uploaded_by"),
-        Index("idx_photos_hash", "hash"),
     )
 
 
@@ -48,18 +49,18 @@ class PhotoTag(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "photo_tags"
 
     photo_id = Column(
-        String(36), ForeignKey("photos.id", ondelete="CASCADE"), nullable=False
+        UUIDType, ForeignKey("photos.id", ondelete="CASCADE"), nullable=False
     )
     circle_member_id = Column(
-        String(36), ForeignKey("circle_members.id", ondelete="SET NULL"), nullable=True
+        UUIDType, ForeignKey("circle_members.id", ondelete="SET NULL"), nullable=True
     )
     user_id = Column(
-        String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+        UUIDType, ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
     x_position = Column(Numeric(5, 4), nullable=True)
     y_position = Column(Numeric(5, 4), nullable=True)
     created_by = Column(
-        String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+        UUIDType, ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
 
     photo = relationship("Photo", back_populates="tags")
@@ -3,7 +3,7 @@ from enum import Enum
 from sqlalchemy import Boolean, Column, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
-from app.db.base import Base, SoftDeleteMixin, TimestampMixin, UUIDMixin
+from app.db.base import Base, SoftDeleteMixin, TimestampMixin, UUIDMixin, UUIDType
 
 
 class TranscriptionStatus(str, Enum):
@@ -17,14 +17,18 @@ class Story(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
     __tablename__ = "stories"
 
     circle_id = Column(
-        String(36), ForeignKey("circles.id", ondelete="CASCADE"), nullable=False
+        UUIDType, ForeignKey("circles.id", ondelete="CASCADE"), nullable=False
     )
     photo_id = Column(
-        String(36), ForeignKey("photos.id", ondelete="SET NULL"), nullable=True
+        UUIDType, ForeignKey("photos.id", ondelete="SET NULL"), nullable=True
     )
     recorded_by = Column(
-        String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+        UUIDType, ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
+    # Copies of the recorder's profile so story feeds don't load users;
+    # kept in sync by UserService.update_profile.
+    recorded_by_display_name = Column(String(100), nullable=True)
+    recorded_by_avatar_url = Column(String(500), nullable=True)
     audio_url = Column(String(500), nullable=True)
     audio_storage_key = Column(String(500), nullable=True)
     audio_duration_seconds = Column(Integer, nullable=True)
@@ -1,9 +1,9 @@
 from enum import Enum
 
-from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Index, String
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Index, String, text
 from sqlalchemy.orm import relationship
 
-from app.db.base import Base, TimestampMixin, UUIDMixin
+from app.db.base import Base, TimestampMixin, UUIDMixin, UUIDType
 
 
 class PlanId(str, Enum):
@@ -53,7 +53,7 @@ class Subscription(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "subscriptions"
 
     user_id = Column(
-        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        UUIDType, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     plan_id = Column(String(50), nullable=False)
     status = Column(String(20), default=SubscriptionStatus.PENDING.value, nullable=False)
@@ -79,24 +79,42 @@ class Payment(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "payments"
 
     user_id = Column(
-        String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+        UUIDType, ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
     subscription_id = Column(
-        String(36), ForeignKey("subscriptions.id", ondelete="SET NULL"), nullable=True
+        UUIDType, ForeignKey("subscriptions.id", ondelete="SET NULL"), nullable=True
     )
+    plan_id = Column(String(50), nullable=True)
     amount_idr = Column(BigInteger, nullable=False)
     payment_method = Column(String(50), nullable=True)
     payment_provider = Column(String(20), nullable=True)
     payment_provider_transaction_id = Column(String(255), nullable=True)
     status = Column(String(20), default=PaymentStatus.PENDING.value, nullable=False)
     completed_at = Column(DateTime(timezone=True), nullable=True)
-    metadata = Column(String(1000), nullable=True)
+    # "metadata" is reserved on declarative classes; the column keeps its name.
+    payment_metadata = Column("metadata", String(1000), nullable=True)
 
     user = relationship("User", foreign_keys=[user_id])
     subscription = relationship("Subscription", back_populates="payments")
 
     __table_args__ = (
-        Index("idx_payments_user_id", "user_id"),
+        # Covers the payment history listing so it can be an index-only scan;
+        # also serves plain user_id lookups.
+        Index(
+            "idx_payments_user_created",
+            "user_id",
+            text("created_at DESC"),
+            postgresql_include=[
+                "id",
+                "subscription_id",
+                "amount_idr",
+                "payment_method",
+                "payment_provider",
+                "payment_provider_transaction_id",
+                "status",
+                "completed_at",
+            ],
+        ),
         Index("idx_payments_subscription_id", "subscription_id"),
         Index("idx_payments_status", "status"),
         Index("idx_payments_created_at", "created_at"),
@@ -1,10 +1,10 @@
 from enum import Enum
 
-from sqlalchemy import Column, DateTime, ForeignKey, Index, String, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import relationship
 
-from app.db.base import Base, TimestampMixin, UUIDMixin
+from app.db.base import Base, TimestampMixin, UUIDMixin, UUIDType
 
 
 class RecipientType(str, Enum):
@@ -22,28 +22,35 @@ class TimeCapsule(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "time_capsules"
 
     circle_id = Column(
-        String(36), ForeignKey("circles.id", ondelete="CASCADE"), nullable=False
+        UUIDType, ForeignKey("circles.id", ondelete="CASCADE"), nullable=False
     )
     created_by = Column(
-        String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+        UUIDType, ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
     title = Column(String(200), nullable=True)
     message = Column(Text, nullable=True)
-    attached_story_ids = Column(ARRAY(String(36)), nullable=True)
-    attached_photo_ids = Column(ARRAY(String(36)), nullable=True)
+    attached_story_ids = Column(ARRAY(UUIDType), nullable=True)
+    attached_photo_ids = Column(ARRAY(UUIDType), nullable=True)
     scheduled_delivery_at = Column(DateTime(timezone=True), nullable=False)
     recipient_type = Column(
         String(20), default=RecipientType.ALL_MEMBERS.value, nullable=False
     )
-    recipient_user_ids = Column(ARRAY(String(36)), nullable=True)
+    recipient_user_ids = Column(ARRAY(UUIDType), nullable=True)
     status = Column(String(20), default=TimeCapsuleStatus.SCHEDULED.value, nullable=False)
     delivered_at = Column(DateTime(timezone=True), nullable=True)
 
     circle = relationship("Circle", back_populates="time_capsules")
     creator = relationship("User", foreign_keys=[created_by])
 
+    # The attached/recipient id arrays are only read with the capsule itself,
+    # so they are not indexed. The delivery task only looks at capsules that
+    # are still scheduled.
     __table_args__ = (
         Index("idx_time_capsules_circle_id", "circle_id"),
         Index("idx_time_capsules_scheduled_delivery_at", "scheduled_delivery_at"),
-        Index("idx_time_capsules_status", "status"),
+        Index(
+            "idx_time_capsules_due",
+            "scheduled_delivery_at",
+            postgresql_where=text("status = 'scheduled'"),
+        ),
     )
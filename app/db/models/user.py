@@ -3,7 +3,7 @@ from enum import Enum
 from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, String
 from sqlalchemy.orm import relationship
 
-from app.db.base import Base, SoftDeleteMixin, TimestampMixin, UUIDMixin
+from app.db.base import Base, SoftDeleteMixin, TimestampMixin, UUIDMixin, UUIDType
 
 
 class SubscriptionTier(str, Enum):
@@ -29,7 +29,10 @@ class User(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
     last_active_at = Column(DateTime(timezone=True), nullable=True)
 
     circle_memberships = relationship(
-        "CircleMembership", back_populates="user", cascade="all, delete-orphan"
+        "CircleMembership",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        foreign_keys="CircleMembership.user_id",
     )
     created_circles = relationship(
         "Circle", back_populates="creator", foreign_keys="Circle.created_by"
@@ -58,7 +61,7 @@ class OTPCode(Base, UUIDMixin, TimestampMixin):
     expires_at = Column(DateTime(timezone=True), nullable=False)
     verified_at = Column(DateTime(timezone=True), nullable=True)
     attempts = Column(String(2), default="0", nullable=False)
-    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
+    user_id = Column(UUIDType, ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
 
     user = relationship("User", back_populates="otp_codes")
 
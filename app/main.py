@@ -3,16 +3,29 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.exc import DBAPIError
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.api.v1.router import api_router
 from app.core.config import settings
+from app.core.exceptions import http_exception_handler, invalid_id_handler
+from app.core.http_client import close_http_client, init_http_client
 from app.core.logging import setup_logging
+from app.core.redis import close_redis, init_redis
+from app.core.responses import ORJSONResponse
+from app.db.session import engine, warm_up_pool
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     setup_logging()
+    await warm_up_pool(settings.DATABASE_POOL_WARMUP)
+    init_http_client()
+    init_redis()
     yield
+    await close_redis()
+    await close_http_client()
+    await engine.dispose()
 
 
 app = FastAPI(
@@ -23,8 +36,12 @@ app = FastAPI(
     redoc_url="/redoc" if settings.APP_DEBUG else None,
     openapi_url="/openapi.json" if settings.APP_DEBUG else None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+app.add_exception_handler(StarletteHTTPException, http_exception_handler)
+app.add_exception_handler(DBAPIError, invalid_id_handler)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"] if settings.is_development else [settings.APP_URL],
@@ -1,18 +1,118 @@
-from typing import List, Optional
+import json
+import random
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
+import httpx
 import structlog
-from openai import AsyncOpenAI
+from openai import DEFAULT_TIMEOUT, AsyncOpenAI
 
 from app.core.config import settings
 from app.core.exceptions import BusinessException
-from app.data.ai_prompts import get_random_prompts, get_prompts_by_circle_type
+from app.core.http_client import get_http_client
+from app.data.ai_prompts import get_prompt_pool, get_prompts_by_circle_type
 
 logger = structlog.get_logger(__name__)
 
+# System prompts are fixed per circle type, so they are formatted once at
+# import instead of on every chat call.
+_CIRCLE_CONTEXTS = {
+    "keluarga": "Ini adalah cerita keluarga. Fokus pada ikatan keluarga, tradisi, dan warisan.",
+    "pasangan": "Ini adalah cerita pasangan/cinta. Fokus pada perjalanan hubungan, momen spesial, dan komitmen.",
+    "sahabat": "Ini adalah cerita persahabatan. Fokus pada petualangan bersama, dukungan, dan kenangan indah.",
+    "rekan_kerja": "Ini adalah cerita profesional. Fokus pada kolaborasi, pencapaian, dan pelajaran karir.",
+    "komunitas": "Ini adalah cerita komunitas. Fokus pada kebersamaan, dampak sosial, dan tujuan bersama.",
+    "mentor": "Ini adalah cerita mentorship. Fokus pada pembelajaran, bimbingan, dan perkembangan pribadi.",
+    "pribadi": "Ini adalah cerita personal/refleksi diri. Fokus pada pertumbuhan pribadi, perasaan, dan refleksi.",
+}
+_DEFAULT_CIRCLE_TYPE = "pribadi"
+
+
+def _enhance_system_prompt(circle_context: str) -> str:
+    return f"""Kamu adalah asisten AI yang membantu menyempurnakan cerita kenangan dalam Bahasa Indonesia.
+
+Konteks: {circle_context}
+
+Tugasmu:
+1. Perbaiki tata bahasa dan ejaan jika ada kesalahan
+2. Buat cerita lebih mengalir dan mudah dibaca
+3. Pertahankan gaya bicara dan emosi asli
+4. JANGAN menambah informasi yang tidak ada
+5. JANGAN mengubah makna cerita
+
+Kembalikan dalam format JSON:
+{{
+    "enhanced_text": "versi yang disempurnakan",
+    "improvements": ["daftar perbaikan yang dilakukan"],
+    "tone": "nada/emosi cerita (hangat/haru/lucu/dll)"
+}}"""
+
+
+_ENHANCE_SYSTEM_PROMPTS = {
+    circle_type: _enhance_system_prompt(circle_context)
+    for circle_type, circle_context in _CIRCLE_CONTEXTS.items()
+}
+
+
+@lru_cache(maxsize=128)
+def _follow_up_system_prompt(circle_type: str, count: int) -> str:
+    circle_context = _CIRCLE_CONTEXTS[circle_type]
+    return f"""Kamu adalah pewawancara yang empati dan penuh perhatian dalam Bahasa Indonesia.
+
+Konteks: {circle_context}
+
+Tugasmu:
+1. Baca cerita yang diceritakan pengguna
+2. Buat {count} pertanyaan lanjutan yang mendorong mereka bercerita lebih dalam
+3. Pertanyaan harus natural, hangat, dan sesuai konteks
+4. Hindari pertanyaan yang sudah terjawab
+5. Fokus pada emosi dan detail yang belum diungkap
+
+Format: Return array JSON dengan {count} pertanyaan."""
+
+
+_TITLE_SYSTEM_PROMPT = """Kamu membuat judul singkat dan menarik untuk cerita dalam Bahasa Indonesia.
+
+Aturan:
+1. Maksimal 60 karakter
+2. Tangkap inti cerita
+3. Emosional tapi tidak berlebihan
+4. Natural seperti judul buku harian
+
+Contoh bagus:
+- "Hari Pertama di Jakarta"
+- "Pernikahan Mama dan Papa"
+- "Liburan ke Bali Bersama Keluarga"
+
+Return JSON: {"title": "judul cerita"}"""
+
+
+@lru_cache(maxsize=1024)
+def _deterministic_prompts(
+    circle_type: str, category: Optional[str], count: int
+) -> Tuple[str, ...]:
+    prompts_dict = get_prompts_by_circle_type(circle_type)
+
+    if category and category in prompts_dict:
+        return tuple(prompts_dict[category][:count])
+
+    return get_prompt_pool(circle_type)[:count]
+
 
 class AIService:
-    def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY) if settings.OPENAI_API_KEY else None
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        http_client = http_client or get_http_client()
+        # The shared client's 10s timeout suits OTP and payment calls, not
+        # completions; without an explicit timeout the SDK would inherit it.
+        self.client = (
+            AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                http_client=http_client,
+                timeout=DEFAULT_TIMEOUT,
+            )
+            if settings.OPENAI_API_KEY
+            else None
+        )
 
     def get_circle_prompts(
         self,
@@ -22,18 +122,10 @@ class AIService:
         randomize: bool = True,
     ) -> List[str]:
         if randomize:
-            return get_random_prompts(circle_type, count)
-        
-        prompts_dict = get_prompts_by_circle_type(circle_type)
-        
-        if category and category in prompts_dict:
-            return prompts_dict[category][:count]
-        
-        all_prompts = []
-        for category_prompts in prompts_dict.values():
-            all_prompts.extend(category_prompts)
-        
-        return all_prompts[:count]
+            pool = get_prompt_pool(circle_type)
+            return random.sample(pool, min(count, len(pool)))
+
+        return list(_deterministic_prompts(circle_type, category, count))
 
     async def enhance_story_transcript(
         self,
@@ -48,28 +140,12 @@ class AIService:
             )
 
         try:
-            circle_context = self._get_circle_context(circle_type)
-            
-            system_prompt = f"""Kamu adalah asisten AI yang membantu menyempurnakan cerita kenangan dalam Bahasa Indonesia.
-
-Konteks: {circle_context}
-
-Tugasmu:
-1. Perbaiki tata bahasa dan ejaan jika ada kesalahan
-2. Buat cerita lebih mengalir dan mudah dibaca
-3. Pertahankan gaya bicara dan emosi asli
-4. JANGAN menambah informasi yang tidak ada
-5. JANGAN mengubah makna cerita
-
-Kembalikan dalam format JSON:
-{{
-    "enhanced_text": "versi yang disempurnakan",
-    "improvements": ["daftar perbaikan yang dilakukan"],
-    "tone": "nada/emosi cerita (hangat/haru/lucu/dll)"
-}}"""
+            system_prompt = _ENHANCE_SYSTEM_PROMPTS.get(
+                circle_type, _ENHANCE_SYSTEM_PROMPTS[_DEFAULT_CIRCLE_TYPE]
+            )
 
             user_prompt = f"Transkrip asli:\n\n{transcript}"
-            
+
             if context:
                 user_prompt += f"\n\nKonteks tambahan: {context}"
 
@@ -83,7 +159,6 @@ Kembalikan dalam format JSON:
                 temperature=0.3,
             )
 
-            import json
             result = json.loads(response.choices[0].message.content)
 
             logger.info(
@@ -119,20 +194,10 @@ Kembalikan dalam format JSON:
             )
 
         try:
-            circle_context = self._get_circle_context(circle_type)
-            
-            system_prompt = f"""Kamu adalah pewawancara yang empati dan penuh perhatian dalam Bahasa Indonesia.
-
-Konteks: {circle_context}
-
-Tugasmu:
-1. Baca cerita yang diceritakan pengguna
-2. Buat {count} pertanyaan lanjutan yang mendorong mereka bercerita lebih dalam
-3. Pertanyaan harus natural, hangat, dan sesuai konteks
-4. Hindari pertanyaan yang sudah terjawab
-5. Fokus pada emosi dan detail yang belum diungkap
-
-Format: Return array JSON dengan {count} pertanyaan."""
+            system_prompt = _follow_up_system_prompt(
+                circle_type if circle_type in _CIRCLE_CONTEXTS else _DEFAULT_CIRCLE_TYPE,
+                count,
+            )
 
             user_prompt = f"Cerita yang diceritakan:\n\n{transcript}\n\nBuatkan {count} pertanyaan lanjutan."
 
@@ -146,9 +211,8 @@ Format: Return array JSON dengan {count} pertanyaan."""
                 temperature=0.7,
             )
 
-            import json
             result = json.loads(response.choices[0].message.content)
-            
+
             questions = result.get("questions", [])
 
             logger.info(
@@ -170,18 +234,6 @@ Format: Return array JSON dengan {count} pertanyaan."""
                 message="Gagal membuat pertanyaan lanjutan. Silakan coba lagi.",
             )
 
-    def _get_circle_context(self, circle_type: str) -> str:
-        contexts = {
-            "keluarga": "Ini adalah cerita keluarga. Fokus pada ikatan keluarga, tradisi, dan warisan.",
-            "pasangan": "Ini adalah cerita pasangan/cinta. Fokus pada perjalanan hubungan, momen spesial, dan komitmen.",
-            "sahabat": "Ini adalah cerita persahabatan. Fokus pada petualangan bersama, dukungan, dan kenangan indah.",
-            "rekan_kerja": "Ini adalah cerita profesional. Fokus pada kolaborasi, pencapaian, dan pelajaran karir.",
-            "komunitas": "Ini adalah cerita komunitas. Fokus pada kebersamaan, dampak sosial, dan tujuan bersama.",
-            "mentor": "Ini adalah cerita mentorship. Fokus pada pembelajaran, bimbingan, dan perkembangan pribadi.",
-            "pribadi": "Ini adalah cerita personal/refleksi diri. Fokus pada pertumbuhan pribadi, perasaan, dan refleksi.",
-        }
-        return contexts.get(circle_type, contexts["pribadi"])
-
     async def suggest_story_title(
         self,
         transcript: str,
@@ -191,32 +243,16 @@ Format: Return array JSON dengan {count} pertanyaan."""
             return transcript[:max_length]
 
         try:
-            system_prompt = """Kamu membuat judul singkat dan menarik untuk cerita dalam Bahasa Indonesia.
-
-Aturan:
-1. Maksimal 60 karakter
-2. Tangkap inti cerita
-3. Emosional tapi tidak berlebihan
-4. Natural seperti judul buku harian
-
-Contoh bagus:
-- "Hari Pertama di Jakarta"
-- "Pernikahan Mama dan Papa"
-- "Liburan ke Bali Bersama Keluarga"
-
-Return JSON: {"title": "judul cerita"}"""
-
             response = await self.client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": _TITLE_SYSTEM_PROMPT},
                     {"role": "user", "content": f"Cerita:\n\n{transcript}"},
                 ],
                 response_format={"type": "json_object"},
                 temperature=0.5,
             )
 
-            import json
             result = json.loads(response.choices[0].message.content)
             title = result.get("title", transcript[:max_length])
 
@@ -225,3 +261,8 @@ Return JSON: {"title": "judul cerita"}"""
         except Exception as e:
             logger.error("title_suggestion_failed", error=str(e))
             return transcript[:max_length]
+
+
+@lru_cache
+def get_ai_service() -> AIService:
+    return AIService()
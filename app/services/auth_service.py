@@ -1,8 +1,9 @@
-from datetime import datetime
+from datetime import timedelta
 from typing import Optional, Tuple
 
 import structlog
-from sqlalchemy import select
+from sqlalchemy import bindparam, exists, func, literal_column, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
@@ -13,62 +14,83 @@ from app.core.security import (
     create_refresh_token,
     verify_refresh_token,
 )
+from app.core.user_cache import invalidate_user
 from app.db.models import User
 
 logger = structlog.get_logger(__name__)
 
+_LAST_ACTIVE_THROTTLE = timedelta(minutes=5)
+
+# Built once so each call only binds parameters.
+_USER_BY_PHONE_QUERY = select(User).where(
+    User.phone_number == bindparam("phone_number"),
+    User.deleted_at.is_(None),
+)
+_USER_BY_ID_QUERY = select(User).where(
+    User.id == bindparam("user_id"),
+    User.deleted_at.is_(None),
+)
+_USER_EXISTS_QUERY = select(
+    exists().where(User.id == bindparam("user_id"), User.deleted_at.is_(None))
+)
+
 
 class AuthService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
     async def get_user_by_phone(self, phone_number: str) -> Optional[User]:
-        query = select(User).where(
-            User.phone_number == phone_number,
-            User.deleted_at.is_(None),
+        result = await self.db.execute(
+            _USER_BY_PHONE_QUERY, {"phone_number": phone_number}
         )
-        result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
     async def get_user_by_id(self, user_id: str) -> Optional[User]:
-        query = select(User).where(
-            User.id == user_id,
-            User.deleted_at.is_(None),
-        )
-        result = await self.db.execute(query)
+        result = await self.db.execute(_USER_BY_ID_QUERY, {"user_id": user_id})
         return result.scalar_one_or_none()
 
     async def create_or_get_user(self, phone_number: str) -> Tuple[User, bool]:
-        existing_user = await self.get_user_by_phone(phone_number)
-
-        if existing_user:
-            existing_user.phone_verified = True
-            existing_user.last_active_at = datetime.utcnow()
-            await self.db.commit()
-            await self.db.refresh(existing_user)
-
-            logger.info(
-                "user_logged_in",
-                user_id=existing_user.id,
-                phone=mask_phone(phone_number),
-            )
-            return existing_user, False
-
-        new_user = User(
+        # One round-trip for both login and registration. xmax is 0 only on
+        # a freshly inserted row, which tells the two cases apart.
+        stmt = pg_insert(User).values(
             phone_number=phone_number,
             phone_verified=True,
-            last_active_at=datetime.utcnow(),
+            last_active_at=func.now(),
         )
-        self.db.add(new_user)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[User.phone_number],
+            set_={
+                "phone_verified": True,
+                "last_active_at": func.now(),
+                "updated_at": func.now(),
+            },
+            where=User.deleted_at.is_(None),
+        ).returning(User, literal_column("xmax = 0").label("inserted"))
+
+        result = await self.db.execute(
+            stmt, execution_options={"populate_existing": True}
+        )
+        row = result.one_or_none()
+        if row is None:
+            # The number belongs to a soft-deleted account.
+            raise UnauthorizedException("Pengguna tidak ditemukan")
         await self.db.commit()
-        await self.db.refresh(new_user)
 
-        logger.info(
-            "user_registered",
-            user_id=new_user.id,
-            phone=mask_phone(phone_number),
-        )
-        return new_user, True
+        user, is_new_user = row
+        if is_new_user:
+            logger.info(
+                "user_registered",
+                user_id=user.id,
+                phone=mask_phone(phone_number),
+            )
+        else:
+            await invalidate_user(user.id)
+            logger.info(
+                "user_logged_in",
+                user_id=user.id,
+                phone=mask_phone(phone_number),
+            )
+        return user, is_new_user
 
     def generate_tokens(self, user_id: str) -> Tuple[str, str, int]:
         access_token = create_access_token(user_id)
@@ -80,17 +102,33 @@ class AuthService:
     async def refresh_access_token(self, refresh_token: str) -> Tuple[str, str, int]:
         user_id = verify_refresh_token(refresh_token)
 
-        user = await self.get_user_by_id(user_id)
-        if not user:
-            raise UnauthorizedException("Pengguna tidak ditemukan")
-
-        user.last_active_at = datetime.utcnow()
-        await self.db.commit()
+        if not await self._touch_last_active(user_id):
+            user_exists = await self.db.scalar(_USER_EXISTS_QUERY, {"user_id": user_id})
+            if not user_exists:
+                raise UnauthorizedException("Pengguna tidak ditemukan")
 
         return self.generate_tokens(user_id)
 
-    async def update_last_active(self, user_id: str) -> None:
-        user = await self.get_user_by_id(user_id)
-        if user:
-            user.last_active_at = datetime.utcnow()
+    async def _touch_last_active(self, user_id: str) -> bool:
+        # Only writes when the stored value is older than the throttle
+        # window, so repeated calls within it cost no row version or WAL.
+        result = await self.db.execute(
+            update(User)
+            .where(
+                User.id == user_id,
+                User.deleted_at.is_(None),
+                or_(
+                    User.last_active_at.is_(None),
+                    User.last_active_at < func.now() - _LAST_ACTIVE_THROTTLE,
+                ),
+            )
+            .values(last_active_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount:
             await self.db.commit()
+            return True
+        return False
+
+    async def update_last_active(self, user_id: str) -> None:
+        await self._touch_last_active(user_id)
@@ -1,18 +1,20 @@
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import structlog
-from sqlalchemy import func, or_, select
+from sqlalchemy import func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.core.config import settings
 from app.core.exceptions import BusinessException, ForbiddenException, NotFoundException
 from app.db.models import (
+    ADMIN_ROLE,
+    CONTRIBUTOR_ROLE,
+    WRITER_ROLES,
     Circle,
     CircleMember,
     CircleMembership,
-    MemberRole,
     Photo,
     Story,
     SubscriptionTier,
@@ -84,7 +86,7 @@ class CircleService:
         membership = CircleMembership(
             circle_id=circle.id,
             user_id=user_id,
-            role=MemberRole.ADMIN.value,
+            role=ADMIN_ROLE,
             joined_at=datetime.utcnow(),
         )
         self.db.add(membership)
@@ -132,21 +134,74 @@ class CircleService:
         if not membership:
             raise ForbiddenException("Kamu bukan anggota lingkaran ini")
 
-        if required_role:
-            if required_role == MemberRole.ADMIN.value:
-                if membership.role != MemberRole.ADMIN.value:
-                    raise ForbiddenException("Hanya admin yang bisa melakukan aksi ini")
-            elif required_role == MemberRole.CONTRIBUTOR.value:
-                if membership.role not in [
-                    MemberRole.ADMIN.value,
-                    MemberRole.CONTRIBUTOR.value,
-                ]:
-                    raise ForbiddenException(
-                        "Kamu tidak punya izin untuk melakukan aksi ini"
-                    )
+        self._check_role(membership.role, required_role)
 
         return membership
 
+    @staticmethod
+    def _check_role(role: str, required_role: Optional[str]) -> None:
+        if required_role == ADMIN_ROLE:
+            if role != ADMIN_ROLE:
+                raise ForbiddenException("Hanya admin yang bisa melakukan aksi ini")
+        elif required_role == CONTRIBUTOR_ROLE:
+            if role not in WRITER_ROLES:
+                raise ForbiddenException(
+                    "Kamu tidak punya izin untuk melakukan aksi ini"
+                )
+
+    async def get_photo_with_access(
+        self, photo_id: str, user_id: str, required_role: Optional[str] = None
+    ) -> Photo:
+        # Fetch the photo and the caller's membership role in one round-trip
+        # instead of a photo lookup followed by _check_access.
+        query = (
+            select(Photo, CircleMembership.role)
+            .outerjoin(
+                CircleMembership,
+                (CircleMembership.circle_id == Photo.circle_id)
+                & (CircleMembership.user_id == user_id),
+            )
+            .where(Photo.id == photo_id, Photo.deleted_at.is_(None))
+        )
+        result = await self.db.execute(query)
+        row = result.one_or_none()
+
+        if not row:
+            raise NotFoundException("Foto tidak ditemukan")
+
+        photo, role = row
+        if role is None:
+            raise ForbiddenException("Kamu bukan anggota lingkaran ini")
+
+        self._check_role(role, required_role)
+
+        return photo
+
+    async def soft_delete_photo(self, photo_id: str, user_id: str) -> None:
+        contributor_circles = select(CircleMembership.circle_id).where(
+            CircleMembership.user_id == user_id,
+            CircleMembership.role.in_(WRITER_ROLES),
+        )
+        query = (
+            update(Photo)
+            .where(
+                Photo.id == photo_id,
+                Photo.deleted_at.is_(None),
+                Photo.circle_id.in_(contributor_circles),
+            )
+            .values(deleted_at=func.now())
+        )
+        result = await self.db.execute(query)
+
+        if result.rowcount == 0:
+            # Slow path only: work out whether it was a 404 or a 403.
+            await self.get_photo_with_access(
+                photo_id, user_id, required_role=CONTRIBUTOR_ROLE
+            )
+            raise NotFoundException("Foto tidak ditemukan")
+
+        await self.db.commit()
+
     async def get_user_circles(self, user_id: str) -> List[Circle]:
         query = (
             select(Circle)
@@ -155,6 +210,7 @@ class CircleService:
                 CircleMembership.user_id == user_id,
                 Circle.deleted_at.is_(None),
             )
+            .options(selectinload(Circle.memberships))
             .order_by(Circle.created_at.desc())
         )
         result = await self.db.execute(query)
@@ -169,7 +225,7 @@ class CircleService:
         cover_photo_url: Optional[str] = None,
         privacy: Optional[str] = None,
     ) -> Circle:
-        await self._check_access(circle_id, user_id, required_role=MemberRole.ADMIN.value)
+        await self._check_access(circle_id, user_id, required_role=ADMIN_ROLE)
 
         circle = await self.get_circle_by_id(circle_id)
 
@@ -191,7 +247,7 @@ class CircleService:
         return circle
 
     async def delete_circle(self, circle_id: str, user_id: str) -> None:
-        await self._check_access(circle_id, user_id, required_role=MemberRole.ADMIN.value)
+        await self._check_access(circle_id, user_id, required_role=ADMIN_ROLE)
 
         circle = await self.get_circle_by_id(circle_id)
         circle.deleted_at = datetime.utcnow()
@@ -205,10 +261,10 @@ class CircleService:
         admin_user_id: str,
         user_id: Optional[str] = None,
         name: Optional[str] = None,
-        role: str = MemberRole.CONTRIBUTOR.value,
+        role: str = CONTRIBUTOR_ROLE,
         custom_label: Optional[str] = None,
     ) -> Tuple[Optional[CircleMembership], Optional[CircleMember]]:
-        await self._check_access(circle_id, admin_user_id, required_role=MemberRole.ADMIN.value)
+        await self._check_access(circle_id, admin_user_id, required_role=ADMIN_ROLE)
 
         if user_id:
             existing_query = select(CircleMembership).where(
@@ -291,7 +347,7 @@ class CircleService:
         role: Optional[str] = None,
         custom_label: Optional[str] = None,
     ) -> CircleMembership:
-        await self._check_access(circle_id, admin_user_id, required_role=MemberRole.ADMIN.value)
+        await self._check_access(circle_id, admin_user_id, required_role=ADMIN_ROLE)
 
         query = select(CircleMembership).where(CircleMembership.id == membership_id)
         result = await self.db.execute(query)
@@ -320,7 +376,7 @@ class CircleService:
     async def remove_member(
         self, circle_id: str, membership_id: str, admin_user_id: str
     ) -> None:
-        await self._check_access(circle_id, admin_user_id, required_role=MemberRole.ADMIN.value)
+        await self._check_access(circle_id, admin_user_id, required_role=ADMIN_ROLE)
 
         query = select(CircleMembership).where(CircleMembership.id == membership_id)
         result = await self.db.execute(query)
@@ -329,10 +385,10 @@ class CircleService:
         if not membership or membership.circle_id != circle_id:
             raise NotFoundException("Anggota tidak ditemukan")
 
-        if membership.role == MemberRole.ADMIN.value:
+        if membership.role == ADMIN_ROLE:
             admin_count_query = select(func.count(CircleMembership.id)).where(
                 CircleMembership.circle_id == circle_id,
-                CircleMembership.role == MemberRole.ADMIN.value,
+                CircleMembership.role == ADMIN_ROLE,
             )
             admin_count_result = await self.db.execute(admin_count_query)
             admin_count = admin_count_result.scalar() or 0
@@ -355,10 +411,10 @@ class CircleService:
     async def leave_circle(self, circle_id: str, user_id: str) -> None:
         membership = await self._check_access(circle_id, user_id)
 
-        if membership.role == MemberRole.ADMIN.value:
+        if membership.role == ADMIN_ROLE:
             admin_count_query = select(func.count(CircleMembership.id)).where(
                 CircleMembership.circle_id == circle_id,
-                CircleMembership.role == MemberRole.ADMIN.value,
+                CircleMembership.role == ADMIN_ROLE,
             )
             admin_count_result = await self.db.execute(admin_count_query)
             admin_count = admin_count_result.scalar() or 0
@@ -400,3 +456,37 @@ class CircleService:
             "photo_count": photo_count,
             "story_count": story_count,
         }
+
+    async def get_circle_stats_bulk(self, circle_ids: List[str]) -> Dict[str, dict]:
+        stats = {
+            circle_id: {"member_count": 0, "photo_count": 0, "story_count": 0}
+            for circle_id in circle_ids
+        }
+        if not circle_ids:
+            return stats
+
+        member_count_query = (
+            select(CircleMembership.circle_id, func.count(CircleMembership.id))
+            .where(CircleMembership.circle_id.in_(circle_ids))
+            .group_by(CircleMembership.circle_id)
+        )
+        for circle_id, count in await self.db.execute(member_count_query):
+            stats[circle_id]["member_count"] = count
+
+        photo_count_query = (
+            select(Photo.circle_id, func.count(Photo.id))
+            .where(Photo.circle_id.in_(circle_ids), Photo.deleted_at.is_(None))
+            .group_by(Photo.circle_id)
+        )
+        for circle_id, count in await self.db.execute(photo_count_query):
+            stats[circle_id]["photo_count"] = count
+
+        story_count_query = (
+            select(Story.circle_id, func.count(Story.id))
+            .where(Story.circle_id.in_(circle_ids), Story.deleted_at.is_(None))
+            .group_by(Story.circle_id)
+        )
+        for circle_id, count in await self.db.execute(story_count_query):
+            stats[circle_id]["story_count"] = count
+
+        return stats
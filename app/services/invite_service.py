@@ -1,15 +1,16 @@
 import secrets
 import string
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import structlog
-from sqlalchemy import select
+from sqlalchemy import exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.exceptions import BusinessException, NotFoundException
 from app.db.models import Circle, CircleMembership, Invite, MemberRole
+from app.services.circle_service import CircleService
 
 logger = structlog.get_logger(__name__)
 
@@ -72,9 +73,9 @@ class InviteService:
         return invite
 
     async def _code_exists(self, code: str) -> bool:
-        query = select(Invite).where(Invite.invite_code == code)
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none() is not None
+        # Only touches the unique invite_code index; no row is loaded.
+        query = select(exists().where(Invite.invite_code == code))
+        return bool(await self.db.scalar(query))
 
     async def get_invite_by_code(self, invite_code: str) -> Invite:
         query = select(Invite).where(Invite.invite_code == invite_code)
@@ -118,7 +119,7 @@ class InviteService:
 
     async def join_circle_via_invite(
         self, invite_code: str, user_id: str
-    ) -> Circle:
+    ) -> Tuple[Circle, Dict[str, int]]:
         invite = await self.validate_invite(invite_code)
 
         existing_query = select(CircleMembership).where(
@@ -143,11 +144,16 @@ class InviteService:
         self.db.add(membership)
 
         invite.use_count += 1
-        await self.db.commit()
+        await self.db.flush()
 
+        # Read the circle and its stats inside the join transaction so the
+        # whole flow runs on a single connection checkout.
         circle_query = select(Circle).where(Circle.id == invite.circle_id)
         circle_result = await self.db.execute(circle_query)
         circle = circle_result.scalar_one()
+        stats = await CircleService(self.db).get_circle_stats(circle.id)
+
+        await self.db.commit()
 
         logger.info(
             "user_joined_via_invite",
@@ -156,7 +162,7 @@ class InviteService:
             invite_code=invite_code,
         )
 
-        return circle
+        return circle, stats
 
     async def get_circle_invites(self, circle_id: str) -> list[Invite]:
         query = select(Invite).where(
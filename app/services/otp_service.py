@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.exceptions import BusinessException, RateLimitException
+from app.core.http_client import get_http_client
 from app.core.logging import mask_phone
 from app.db.models import OTPCode
 
@@ -17,8 +18,9 @@ logger = structlog.get_logger(__name__)
 
 
 class OTPService:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, http_client: Optional[httpx.AsyncClient] = None):
         self.db = db
+        self.http_client = http_client or get_http_client()
 
     def _generate_otp_code(self) -> str:
         return "".join(
@@ -109,40 +111,49 @@ class OTPService:
             return False
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://api.fazpass.com/v1/otp/request",
-                    headers={
-                        "Authorization": f"Bearer {settings.FAZPASS_API_KEY}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "gateway_key": settings.FAZPASS_GATEWAY_KEY,
-                        "phone": phone_number,
-                        "otp": code,
-                        "message": f"Kode OTP Kenang Anda adalah: {code}. Berlaku 5 menit. Jangan bagikan ke siapapun.",
-                    },
-                )
+            if self.http_client is not None:
+                return await self._post_fazpass(self.http_client, phone_number, code)
 
-                if response.status_code == 200:
-                    logger.info(
-                        "otp_sms_sent",
-                        phone=mask_phone(phone_number),
-                        provider="fazpass",
-                    )
-                    return True
-                else:
-                    logger.error(
-                        "fazpass_send_failed",
-                        status_code=response.status_code,
-                        response=response.text,
-                    )
-                    return False
+            async with httpx.AsyncClient(timeout=30.0) as client:
+                return await self._post_fazpass(client, phone_number, code)
 
         except httpx.RequestError as e:
             logger.error("fazpass_request_error", error=str(e))
             return False
 
+    async def _post_fazpass(
+        self, client: httpx.AsyncClient, phone_number: str, code: str
+    ) -> bool:
+        response = await client.post(
+            "https://api.fazpass.com/v1/otp/request",
+            headers={
+                "Authorization": f"Bearer {settings.FAZPASS_API_KEY}",
+                "Content-Type": "application/json",
+            },
+            json={
+                "gateway_key": settings.FAZPASS_GATEWAY_KEY,
+                "phone": phone_number,
+                "otp": code,
+                "message": f"Kode OTP Kenang Anda adalah: {code}. Berlaku 5 menit. Jangan bagikan ke siapapun.",
+            },
+            timeout=30.0,
+        )
+
+        if response.status_code == 200:
+            logger.info(
+                "otp_sms_sent",
+                phone=mask_phone(phone_number),
+                provider="fazpass",
+            )
+            return True
+        else:
+            logger.error(
+                "fazpass_send_failed",
+                status_code=response.status_code,
+                response=response.text,
+            )
+            return False
+
     async def verify_otp(self, phone_number: str, code: str) -> OTPCode:
         otp = await self._get_active_otp(phone_number)
 
@@ -3,40 +3,75 @@ Payment service for handling Midtrans payment gateway integration.
 Supports Indonesian payment methods: GoPay, OVO, DANA, Bank Transfer, etc.
 """
 
+import base64
 import hashlib
+import hmac
 import secrets
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Dict, Optional
 
-import midtransclient
+import httpx
 import structlog
 
-from app.core.config import settings
+from app.core.config import runtime_config, settings
 from app.core.exceptions import BusinessException
+from app.core.http_client import get_http_client
 from app.data.subscription_plans import get_plan
 
 logger = structlog.get_logger(__name__)
 
+_UTC = timezone.utc
+
+_SNAP_URL_PRODUCTION = "https://app.midtrans.com/snap/v1/transactions"
+_SNAP_URL_SANDBOX = "https://app.sandbox.midtrans.com/snap/v1/transactions"
+
+# Midtrans transaction_status -> PaymentStatus; "capture" depends on the
+# fraud check and is handled in map_transaction_status.
+_TRANSACTION_STATUS_MAPPING = {
+    "settlement": "success",
+    "pending": "pending",
+    "deny": "failed",
+    "expire": "expired",
+    "cancel": "failed",
+    "refund": "refunded",
+    "partial_refund": "refunded",
+}
+
 
 class PaymentService:
     """Service for handling payments through Midtrans"""
 
-    def __init__(self):
-        if not settings.MIDTRANS_SERVER_KEY or not settings.MIDTRANS_CLIENT_KEY:
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        self._server_key_bytes = (settings.MIDTRANS_SERVER_KEY or "").encode()
+        # Resolved per call, since the shared client only exists once the
+        # app has started and this service is built once per process.
+        self._http_client = http_client
+
+        self.is_configured = bool(
+            settings.MIDTRANS_SERVER_KEY and settings.MIDTRANS_CLIENT_KEY
+        )
+        if not self.is_configured:
             logger.warning(
                 "midtrans_not_configured", message="Midtrans API keys not set"
             )
-            self.snap = None
-        else:
-            self.snap = midtransclient.Snap(
-                is_production=settings.MIDTRANS_IS_PRODUCTION,
-                server_key=settings.MIDTRANS_SERVER_KEY,
-                client_key=settings.MIDTRANS_CLIENT_KEY,
-            )
+
+        # Snap is called directly over HTTP so checkouts reuse pooled
+        # connections instead of blocking the event loop in the SDK.
+        self._snap_url = (
+            _SNAP_URL_PRODUCTION
+            if settings.MIDTRANS_IS_PRODUCTION
+            else _SNAP_URL_SANDBOX
+        )
+        self._snap_headers = {
+            "Accept": "application/json",
+            "Authorization": "Basic "
+            + base64.b64encode(self._server_key_bytes + b":").decode(),
+        }
 
     def _generate_order_id(self, user_id: str) -> str:
         """Generate unique order ID for a transaction"""
-        timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+        timestamp = datetime.now(_UTC).strftime("%Y%m%d%H%M%S")
         random_suffix = secrets.token_hex(4)
         return f"SUB-{user_id[:8]}-{timestamp}-{random_suffix}"
 
@@ -64,7 +99,7 @@ class PaymentService:
         Raises:
             BusinessException: If Midtrans is not configured or API call fails
         """
-        if not self.snap:
+        if not self.is_configured:
             raise BusinessException(
                 code="PAYMENT_NOT_CONFIGURED",
                 message="Layanan pembayaran tidak tersedia saat ini. Silakan hubungi admin.",
@@ -135,7 +170,12 @@ class PaymentService:
         }
 
         try:
-            response = self.snap.create_transaction(transaction)
+            http_client = self._http_client or get_http_client()
+            if http_client is not None:
+                response = await self._create_snap_transaction(http_client, transaction)
+            else:
+                async with httpx.AsyncClient(timeout=30.0) as client:
+                    response = await self._create_snap_transaction(client, transaction)
 
             logger.info(
                 "checkout_session_created",
@@ -163,6 +203,15 @@ class PaymentService:
                 message="Gagal membuat sesi pembayaran. Silakan coba lagi.",
             )
 
+    async def _create_snap_transaction(
+        self, client: httpx.AsyncClient, transaction: dict
+    ) -> dict:
+        response = await client.post(
+            self._snap_url, headers=self._snap_headers, json=transaction
+        )
+        response.raise_for_status()
+        return response.json()
+
     def verify_signature(
         self,
         order_id: str,
@@ -182,21 +231,28 @@ class PaymentService:
         Returns:
             True if signature is valid, False otherwise
         """
-        if not settings.MIDTRANS_SERVER_KEY:
+        if not runtime_config.MIDTRANS_SERVER_KEY:
             logger.error(
                 "signature_verification_failed", reason="Server key not configured"
             )
             return False
 
         # Create signature string: order_id + status_code + gross_amount + server_key
-        signature_string = (
-            f"{order_id}{status_code}{gross_amount}{settings.MIDTRANS_SERVER_KEY}"
+        signature_bytes = b"".join(
+            (
+                order_id.encode(),
+                status_code.encode(),
+                gross_amount.encode(),
+                self._server_key_bytes,
+            )
         )
 
-        # Generate SHA512 hash
-        calculated_signature = hashlib.sha512(signature_string.encode()).hexdigest()
+        # Generate SHA512 hash and compare in constant time
+        calculated_signature = hashlib.sha512(signature_bytes).hexdigest()
 
-        is_valid = calculated_signature == signature_key
+        is_valid = hmac.compare_digest(
+            calculated_signature.encode(), signature_key.encode()
+        )
 
         if not is_valid:
             logger.warning(
@@ -208,56 +264,25 @@ class PaymentService:
 
         return is_valid
 
-    def parse_payment_notification(self, payload: dict) -> Dict[str, str]:
+    def map_transaction_status(
+        self, transaction_status: str, fraud_status: Optional[str] = "accept"
+    ) -> str:
         """
-        Parse Midtrans payment notification payload.
+        Map Midtrans transaction_status to our PaymentStatus.
 
         Args:
-            payload: Webhook payload from Midtrans
+            transaction_status: Transaction status from the notification
+            fraud_status: Fraud check result from the notification
 
         Returns:
-            Dictionary with parsed payment information
+            Our internal payment status string
 
         Reference:
-            https://docs.midtrans.com/reference/notification-response-body
+            https://docs.midtrans.com/reference/transaction-status
         """
-        order_id = payload.get("order_id", "")
-        transaction_status = payload.get("transaction_status", "")
-        fraud_status = payload.get("fraud_status", "accept")
-        status_code = payload.get("status_code", "")
-        gross_amount = payload.get("gross_amount", "")
-        signature_key = payload.get("signature_key", "")
-        payment_type = payload.get("payment_type", "")
-        transaction_id = payload.get("transaction_id", "")
-        transaction_time = payload.get("transaction_time", "")
-
-        # Map Midtrans transaction_status to our PaymentStatus
-        # https://docs.midtrans.com/reference/transaction-status
-        status_mapping = {
-            "capture": "success" if fraud_status == "accept" else "pending",
-            "settlement": "success",
-            "pending": "pending",
-            "deny": "failed",
-            "expire": "expired",
-            "cancel": "failed",
-            "refund": "refunded",
-            "partial_refund": "refunded",
-        }
-
-        payment_status = status_mapping.get(transaction_status, "pending")
-
-        return {
-            "order_id": order_id,
-            "transaction_id": transaction_id,
-            "transaction_status": transaction_status,
-            "payment_status": payment_status,
-            "payment_type": payment_type,
-            "gross_amount": gross_amount,
-            "status_code": status_code,
-            "signature_key": signature_key,
-            "transaction_time": transaction_time,
-            "fraud_status": fraud_status,
-        }
+        if transaction_status == "capture":
+            return "success" if fraud_status == "accept" else "pending"
+        return _TRANSACTION_STATUS_MAPPING.get(transaction_status, "pending")
 
     def map_midtrans_payment_type(self, midtrans_payment_type: str) -> str:
         """
@@ -284,3 +309,9 @@ class PaymentService:
         }
 
         return mapping.get(midtrans_payment_type, midtrans_payment_type)
+
+
+@lru_cache
+def get_payment_service() -> PaymentService:
+    """One PaymentService per process, injected with Depends."""
+    return PaymentService()
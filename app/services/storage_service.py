@@ -1,18 +1,45 @@
+import asyncio
+import hashlib
+import hmac
 import mimetypes
+import time
 import uuid
-from datetime import timedelta
-from typing import Optional
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterable, Optional
+from urllib.parse import quote
 
 import aioboto3
 import structlog
 from botocore.exceptions import ClientError
 
-from app.core.config import settings
+from app.core.cache import TTLCache
+from app.core.config import runtime_config, settings
 from app.core.exceptions import BusinessException
 
 logger = structlog.get_logger(__name__)
 
 
+# Presigned download URLs, keyed by (storage_key, expires_in, bucket). URLs are
+# signed as of the start of their time bucket, so they are identical across
+# requests and workers within a bucket and always keep at least half of their
+# validity when handed out.
+_download_url_cache: TTLCache[str] = TTLCache(maxsize=100_000, ttl=1800)
+
+
+def download_url_bucket(expires_in_seconds: int = 3600) -> int:
+    return int(time.time()) // (expires_in_seconds // 2)
+
+
+@lru_cache(maxsize=8)
+def _sigv4_signing_key(secret_key: str, datestamp: str, region: str) -> bytes:
+    # The derived key only changes once per day per region, so it is cached.
+    k_date = hmac.new(f"AWS4{secret_key}".encode(), datestamp.encode(), hashlib.sha256).digest()
+    k_region = hmac.new(k_date, region.encode(), hashlib.sha256).digest()
+    k_service = hmac.new(k_region, b"s3", hashlib.sha256).digest()
+    return hmac.new(k_service, b"aws4_request", hashlib.sha256).digest()
+
+
 class StorageService:
     def __init__(self):
         self.session = aioboto3.Session(
@@ -98,6 +125,75 @@ class StorageService:
                 message="Gagal membuat URL download. Coba lagi.",
             )
 
+    async def generate_download_url_fast(
+        self,
+        storage_key: str,
+        expires_in_seconds: int = 3600,
+    ) -> str:
+        # Presigns GET requests in-process with SigV4 instead of spinning up
+        # a boto client per URL. Falls back to boto when static credentials
+        # aren't configured (e.g. instance roles) or the bucket name can't be
+        # used as a virtual host.
+        access_key = runtime_config.AWS_ACCESS_KEY_ID
+        secret_key = runtime_config.AWS_SECRET_ACCESS_KEY
+        if not access_key or not secret_key or "." in self.bucket_name:
+            return await self.generate_download_url(storage_key, expires_in_seconds)
+
+        bucket = download_url_bucket(expires_in_seconds)
+        cache_key = (storage_key, expires_in_seconds, bucket)
+        url = _download_url_cache.get(cache_key)
+        if url is not None:
+            return url
+
+        region = runtime_config.AWS_REGION
+        host = f"{self.bucket_name}.s3.{region}.amazonaws.com"
+        signed_at = datetime.utcfromtimestamp(bucket * (expires_in_seconds // 2))
+        amz_date = signed_at.strftime("%Y%m%dT%H%M%SZ")
+        datestamp = amz_date[:8]
+        credential_scope = f"{datestamp}/{region}/s3/aws4_request"
+
+        canonical_uri = "/" + quote(storage_key, safe="/")
+        canonical_query = (
+            "X-Amz-Algorithm=AWS4-HMAC-SHA256"
+            f"&X-Amz-Credential={quote(f'{access_key}/{credential_scope}', safe='')}"
+            f"&X-Amz-Date={amz_date}"
+            f"&X-Amz-Expires={expires_in_seconds}"
+            "&X-Amz-SignedHeaders=host"
+        )
+        canonical_request = (
+            f"GET\n{canonical_uri}\n{canonical_query}\n"
+            f"host:{host}\n\nhost\nUNSIGNED-PAYLOAD"
+        )
+        string_to_sign = (
+            f"AWS4-HMAC-SHA256\n{amz_date}\n{credential_scope}\n"
+            f"{hashlib.sha256(canonical_request.encode()).hexdigest()}"
+        )
+        signature = hmac.new(
+            _sigv4_signing_key(secret_key, datestamp, region),
+            string_to_sign.encode(),
+            hashlib.sha256,
+        ).hexdigest()
+
+        url = f"https://{host}{canonical_uri}?{canonical_query}&X-Amz-Signature={signature}"
+        _download_url_cache.set(cache_key, url)
+        return url
+
+    async def generate_download_urls(
+        self,
+        storage_keys: Iterable[Optional[str]],
+        expires_in_seconds: int = 3600,
+    ) -> Dict[str, str]:
+        # Signs each distinct key once, concurrently; repeated keys within a
+        # list response (shared thumbnails, audio) reuse the same URL.
+        unique_keys = list(dict.fromkeys(key for key in storage_keys if key))
+        urls = await asyncio.gather(
+            *(
+                self.generate_download_url_fast(key, expires_in_seconds)
+                for key in unique_keys
+            )
+        )
+        return dict(zip(unique_keys, urls))
+
     async def verify_file_exists(self, storage_key: str) -> bool:
         try:
             async with self.session.client("s3") as s3_client:
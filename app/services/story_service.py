@@ -1,27 +1,78 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Optional, Sequence, Tuple
 
 import structlog
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.core.config import settings
 from app.core.exceptions import BusinessException, ForbiddenException, NotFoundException
-from app.db.models import MemberRole, Photo, Story, SubscriptionTier, TranscriptionStatus, User
+from app.db.models import CONTRIBUTOR_ROLE, Photo, Story, SubscriptionTier, TranscriptionStatus, User
 from app.services.circle_service import CircleService
 from app.services.storage_service import StorageService
 
 logger = structlog.get_logger(__name__)
 
+# Every Story handed back to the API layer must have photo loaded up front:
+# StoryResponse.from_orm_fast reads it, and a lazy load there would mean one
+# extra query per story (or a MissingGreenlet error under asyncio). Recorder
+# details come from the denormalized recorded_by_* columns. Any other
+# relationship access raises instead of lazy loading, so new N+1s show up
+# immediately.
+_STORY_LOADERS = (selectinload(Story.photo), raiseload("*"))
+
+_storage = StorageService()
+
+
+def _story_list_statements(filter_by_photo: bool):
+    conditions = [
+        Story.circle_id == bindparam("circle_id"),
+        Story.deleted_at.is_(None),
+    ]
+    if filter_by_photo:
+        conditions.append(Story.photo_id == bindparam("photo_id"))
+
+    # Each item embeds its photo's caption and keys, so the photos' last
+    # change is part of the fingerprint too.
+    summary_query = (
+        select(
+            func.count(Story.id),
+            func.max(Story.updated_at),
+            func.max(Photo.updated_at),
+        )
+        .outerjoin(Photo, Photo.id == Story.photo_id)
+        .where(*conditions)
+    )
+    stories_query = (
+        select(Story)
+        .where(*conditions)
+        .options(*_STORY_LOADERS)
+        .order_by(Story.created_at.desc())
+        .offset(bindparam("skip"))
+        .limit(bindparam("limit"))
+    )
+    return summary_query, stories_query
+
+
+# Built once so list queries only bind parameters per call; keyed on
+# whether the photo_id filter applies.
+_STORY_LIST_STATEMENTS = {
+    False: _story_list_statements(False),
+    True: _story_list_statements(True),
+}
+
 
 class StoryService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.circle_service = CircleService(db)
-        self.storage_service = StorageService()
+        self.storage_service = _storage
+        # (circle_id, user_id) pairs whose membership this request has
+        # already verified, so a summary followed by a page checks it once.
+        self._checked_access: set[Tuple[str, str]] = set()
 
-    async def _check_story_limit(self, user_id: str) -> None:
+    async def _check_story_limit(self, user_id: str) -> User:
         query = select(User).where(User.id == user_id)
         result = await self.db.execute(query)
         user = result.scalar_one_or_none()
@@ -44,7 +95,7 @@ class StoryService:
         elif tier == SubscriptionTier.PLUS.value:
             max_stories = 500
         else:
-            return
+            return user
 
         if current_stories >= max_stories:
             raise BusinessException(
@@ -52,6 +103,8 @@ class StoryService:
                 message=f"Batas cerita tercapai ({max_stories}). Upgrade untuk membuat lebih banyak.",
             )
 
+        return user
+
     async def create_story(
         self,
         user_id: str,
@@ -63,10 +116,10 @@ class StoryService:
         language: str = "id",
     ) -> Story:
         await self.circle_service._check_access(
-            circle_id, user_id, required_role=MemberRole.CONTRIBUTOR.value
+            circle_id, user_id, required_role=CONTRIBUTOR_ROLE
         )
 
-        await self._check_story_limit(user_id)
+        recorder = await self._check_story_limit(user_id)
 
         file_exists = await self.storage_service.verify_file_exists(audio_storage_key)
         if not file_exists:
@@ -83,12 +136,14 @@ class StoryService:
             if not photo:
                 raise NotFoundException("Foto tidak ditemukan dalam lingkaran ini")
 
-        audio_url = await self.storage_service.generate_download_url(audio_storage_key)
+        audio_url = await self.storage_service.generate_download_url_fast(audio_storage_key)
 
         story = Story(
             circle_id=circle_id,
             photo_id=photo_id,
             recorded_by=user_id,
+            recorded_by_display_name=recorder.display_name,
+            recorded_by_avatar_url=recorder.avatar_url,
             audio_url=audio_url,
             audio_storage_key=audio_storage_key,
             audio_duration_seconds=audio_duration_seconds,
@@ -99,7 +154,15 @@ class StoryService:
 
         self.db.add(story)
         await self.db.commit()
-        await self.db.refresh(story)
+
+        query = (
+            select(Story)
+            .where(Story.id == story.id)
+            .options(*_STORY_LOADERS)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(query)
+        story = result.scalar_one()
 
         logger.info(
             "story_created",
@@ -114,7 +177,7 @@ class StoryService:
         query = (
             select(Story)
             .where(Story.id == story_id, Story.deleted_at.is_(None))
-            .options(selectinload(Story.photo), selectinload(Story.recorder))
+            .options(*_STORY_LOADERS)
         )
         result = await self.db.execute(query)
         story = result.scalar_one_or_none()
@@ -126,39 +189,48 @@ class StoryService:
 
         return story
 
-    async def list_stories(
+    async def _check_circle_access(self, circle_id: str, user_id: str) -> None:
+        key = (circle_id, user_id)
+        if key not in self._checked_access:
+            await self.circle_service._check_access(circle_id, user_id)
+            self._checked_access.add(key)
+
+    async def summarize_stories(
         self,
         circle_id: str,
         user_id: str,
-        skip: int = 0,
-        limit: int = 50,
         photo_id: Optional[str] = None,
-    ) -> tuple[List[Story], int]:
-        await self.circle_service._check_access(circle_id, user_id)
-
-        base_query = select(Story).where(
-            Story.circle_id == circle_id,
-            Story.deleted_at.is_(None),
+    ) -> Tuple[int, Optional[datetime], Optional[datetime]]:
+        # Cheap fingerprint of a listing, used for both the total and ETags:
+        # the story count and the latest story and photo updates.
+        await self._check_circle_access(circle_id, user_id)
+
+        summary_query, _ = _STORY_LIST_STATEMENTS[bool(photo_id)]
+        result = await self.db.execute(
+            summary_query, {"circle_id": circle_id, "photo_id": photo_id}
         )
+        total, stories_updated, photos_updated = result.one()
+        return total or 0, stories_updated, photos_updated
 
-        if photo_id:
-            base_query = base_query.where(Story.photo_id == photo_id)
-
-        count_query = select(func.count()).select_from(base_query.subquery())
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar() or 0
-
-        stories_query = (
-            base_query
-            .options(selectinload(Story.photo), selectinload(Story.recorder))
-            .order_by(Story.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-        )
-        stories_result = await self.db.execute(stories_query)
-        stories = list(stories_result.scalars().all())
-
-        return stories, total
+    async def list_story_page(
+        self,
+        circle_id: str,
+        user_id: str,
+        skip: int = 0,
+        limit: int = 50,
+        photo_id: Optional[str] = None,
+    ) -> Sequence[Story]:
+        await self._check_circle_access(circle_id, user_id)
+
+        _, stories_query = _STORY_LIST_STATEMENTS[bool(photo_id)]
+        params = {
+            "circle_id": circle_id,
+            "photo_id": photo_id,
+            "skip": skip,
+            "limit": limit,
+        }
+        result = await self.db.execute(stories_query, params)
+        return result.scalars().all()
 
     async def update_transcript(
         self,
@@ -169,7 +241,7 @@ class StoryService:
         story = await self.get_story_by_id(story_id, user_id)
 
         await self.circle_service._check_access(
-            story.circle_id, user_id, required_role=MemberRole.CONTRIBUTOR.value
+            story.circle_id, user_id, required_role=CONTRIBUTOR_ROLE
         )
 
         story.transcript_edited = transcript_edited
@@ -190,7 +262,7 @@ class StoryService:
         story = await self.get_story_by_id(story_id, user_id)
 
         await self.circle_service._check_access(
-            story.circle_id, user_id, required_role=MemberRole.CONTRIBUTOR.value
+            story.circle_id, user_id, required_role=CONTRIBUTOR_ROLE
         )
 
         story.deleted_at = datetime.utcnow()
@@ -245,4 +317,4 @@ class StoryService:
         return story
 
     async def get_audio_download_url(self, story: Story) -> str:
-        return await self.storage_service.generate_download_url(story.audio_storage_key)
+        return await self.storage_service.generate_download_url_fast(story.audio_storage_key)
@@ -3,21 +3,18 @@ Subscription service for managing user subscriptions and plan access.
 Handles subscription lifecycle, feature access checks, and tier upgrades.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
 import structlog
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, bindparam, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only
 
 from app.core.exceptions import BusinessException, ForbiddenException, NotFoundException
-from app.data.subscription_plans import (
-    SubscriptionPlan,
-    get_all_plans,
-    get_plan,
-    get_purchasable_plans,
-)
+from app.core.payment_history_cache import invalidate_history
+from app.core.user_cache import invalidate_user, invalidate_users
+from app.data.subscription_plans import get_plan
 from app.db.models import SubscriptionTier
 from app.db.models.subscription import (
     Payment,
@@ -31,6 +28,31 @@ from app.db.models.user import User
 
 logger = structlog.get_logger(__name__)
 
+_UTC = timezone.utc
+
+# Only the columns in idx_payments_user_created are loaded, so Postgres can
+# answer the history listing from the index alone.
+_PAYMENT_HISTORY_QUERY = (
+    select(Payment)
+    .options(
+        load_only(
+            Payment.user_id,
+            Payment.subscription_id,
+            Payment.amount_idr,
+            Payment.payment_method,
+            Payment.payment_provider,
+            Payment.payment_provider_transaction_id,
+            Payment.status,
+            Payment.completed_at,
+            Payment.created_at,
+        )
+    )
+    .where(Payment.user_id == bindparam("user_id"))
+    .order_by(Payment.created_at.desc())
+    .limit(bindparam("limit"))
+    .offset(bindparam("offset"))
+)
+
 
 class SubscriptionService:
     """Service for managing subscriptions"""
@@ -38,26 +60,6 @@ class SubscriptionService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_available_plans(
-        self, include_free: bool = False
-    ) -> List[SubscriptionPlan]:
-        """
-        Get list of available subscription plans.
-
-        Args:
-            include_free: Whether to include FREE plan
-
-        Returns:
-            List of subscription plans
-        """
-        if include_free:
-            plans = get_all_plans()
-        else:
-            plans = get_purchasable_plans()
-
-        logger.info("plans_fetched", count=len(plans), include_free=include_free)
-        return plans
-
     async def get_current_subscription(self, user_id: str) -> Optional[Subscription]:
         """
         Get user's current active subscription.
@@ -103,7 +105,8 @@ class SubscriptionService:
         payment_id: str,
     ) -> Subscription:
         """
-        Create a new subscription after successful payment.
+        Create a new subscription after successful payment and link the
+        payment to it in one transaction.
 
         Args:
             user_id: User ID
@@ -148,7 +151,7 @@ class SubscriptionService:
             )
 
         # Calculate period based on billing cycle
-        now = datetime.utcnow()
+        now = datetime.now(_UTC)
         if plan.billing_cycle == "monthly":
             period_end = now + timedelta(days=30)
         elif plan.billing_cycle == "yearly":
@@ -186,8 +189,13 @@ class SubscriptionService:
         new_tier = tier_mapping.get(plan_id, SubscriptionTier.FREE.value)
         user.subscription_tier = new_tier
 
+        # Linked in the same transaction, so a payment can never be left
+        # with an active subscription it does not point at.
+        payment.subscription_id = subscription.id
+
         await self.db.commit()
         await self.db.refresh(subscription)
+        await invalidate_user(user_id)
 
         logger.info(
             "subscription_created",
@@ -200,6 +208,46 @@ class SubscriptionService:
 
         return subscription
 
+    async def activate_from_payment(
+        self,
+        payment_id: str,
+        plan_id: str,
+    ) -> Optional[Subscription]:
+        """
+        Create the subscription for a successful payment and link the two.
+
+        Args:
+            payment_id: Payment ID marked successful by the webhook
+            plan_id: Plan ID resolved from the payment
+
+        Returns:
+            Created subscription, or None if the payment is already linked
+        """
+        # The row lock serializes concurrent activations of one payment; the
+        # loser sees subscription_id set once the winner commits.
+        payment = await self.db.scalar(
+            select(Payment).where(Payment.id == payment_id).with_for_update()
+        )
+        if payment is None or payment.subscription_id is not None:
+            return None
+
+        user_id = payment.user_id
+        subscription = await self.create_subscription(
+            user_id=user_id,
+            plan_id=plan_id,
+            payment_id=payment_id,
+        )
+        await invalidate_history(user_id)
+
+        logger.info(
+            "subscription_activated",
+            payment_id=payment_id,
+            subscription_id=subscription.id,
+            plan_id=plan_id,
+        )
+
+        return subscription
+
     async def cancel_subscription(
         self,
         subscription_id: str,
@@ -238,7 +286,7 @@ class SubscriptionService:
                 message="Subscription tidak aktif. Tidak bisa dibatalkan.",
             )
 
-        now = datetime.utcnow()
+        now = datetime.now(_UTC)
         subscription.cancelled_at = now
 
         if immediate:
@@ -270,6 +318,8 @@ class SubscriptionService:
 
         await self.db.commit()
         await self.db.refresh(subscription)
+        if immediate:
+            await invalidate_user(user_id)
 
         return subscription
 
@@ -290,15 +340,10 @@ class SubscriptionService:
         Returns:
             List of payments
         """
-        query = (
-            select(Payment)
-            .where(Payment.user_id == user_id)
-            .order_by(Payment.created_at.desc())
-            .limit(limit)
-            .offset(offset)
+        result = await self.db.execute(
+            _PAYMENT_HISTORY_QUERY,
+            {"user_id": user_id, "limit": limit, "offset": offset},
         )
-
-        result = await self.db.execute(query)
         payments = result.scalars().all()
 
         return list(payments)
@@ -374,42 +419,43 @@ class SubscriptionService:
         Returns:
             Number of subscriptions expired
         """
-        now = datetime.utcnow()
-
-        # Find active subscriptions that have expired
-        query = (
-            select(Subscription)
+        # Expired by the database clock, flipped set-wise so a large backlog
+        # never materializes as ORM objects; only the ids come back.
+        result = await self.db.execute(
+            update(Subscription)
             .where(
-                and_(
-                    Subscription.status == SubscriptionStatus.ACTIVE.value,
-                    Subscription.current_period_end < now,
-                )
+                Subscription.status == SubscriptionStatus.ACTIVE.value,
+                Subscription.current_period_end < func.now(),
             )
-            .options(selectinload(Subscription.user))
+            .values(status=SubscriptionStatus.EXPIRED.value)
+            .returning(Subscription.id, Subscription.user_id, Subscription.plan_id)
+            .execution_options(synchronize_session=False)
         )
+        expired = result.all()
+        if not expired:
+            return 0
+
+        user_ids = {row.user_id for row in expired}
+
+        # Downgrade users to FREE tier
+        await self.db.execute(
+            update(User)
+            .where(User.id.in_(user_ids))
+            .values(subscription_tier=SubscriptionTier.FREE.value)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+        await invalidate_users(user_ids)
 
-        result = await self.db.execute(query)
-        expired_subscriptions = result.scalars().all()
-
-        count = 0
-        for subscription in expired_subscriptions:
-            subscription.status = SubscriptionStatus.EXPIRED.value
-
-            # Downgrade user to FREE tier
-            if subscription.user:
-                subscription.user.subscription_tier = SubscriptionTier.FREE.value
-
+        for row in expired:
             logger.info(
                 "subscription_expired",
-                subscription_id=subscription.id,
-                user_id=subscription.user_id,
-                plan_id=subscription.plan_id,
+                subscription_id=row.id,
+                user_id=row.user_id,
+                plan_id=row.plan_id,
             )
 
-            count += 1
-
-        if count > 0:
-            await self.db.commit()
-            logger.info("subscriptions_expired_batch", count=count)
+        count = len(expired)
+        logger.info("subscriptions_expired_batch", count=count)
 
         return count
@@ -2,12 +2,14 @@ from datetime import datetime
 from typing import Optional
 
 import structlog
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.exceptions import NotFoundException
 from app.core.logging import mask_phone
+from app.core.user_cache import invalidate_user
+from app.core.user_stats_cache import cache_counts, get_cached_counts
 from app.db.models import (
     Circle,
     CircleMembership,
@@ -19,6 +21,27 @@ from app.db.models import (
 
 logger = structlog.get_logger(__name__)
 
+_user_circle_ids = select(CircleMembership.circle_id).where(
+    CircleMembership.user_id == bindparam("user_id")
+)
+
+# All three /me/stats counts in one round trip.
+_USER_COUNTS_QUERY = select(
+    select(func.count(CircleMembership.id))
+    .join(Circle, Circle.id == CircleMembership.circle_id)
+    .where(
+        CircleMembership.user_id == bindparam("user_id"),
+        Circle.deleted_at.is_(None),
+    )
+    .scalar_subquery(),
+    select(func.count(Photo.id))
+    .where(Photo.circle_id.in_(_user_circle_ids), Photo.deleted_at.is_(None))
+    .scalar_subquery(),
+    select(func.count(Story.id))
+    .where(Story.circle_id.in_(_user_circle_ids), Story.deleted_at.is_(None))
+    .scalar_subquery(),
+)
+
 
 class UserService:
     def __init__(self, db: AsyncSession):
@@ -56,9 +79,22 @@ class UserService:
         if timezone is not None:
             user.timezone = timezone
 
+        if display_name is not None or avatar_url is not None:
+            # Stories keep their own copy of the recorder's name and avatar.
+            await self.db.execute(
+                update(Story)
+                .where(Story.recorded_by == user_id)
+                .values(
+                    recorded_by_display_name=user.display_name,
+                    recorded_by_avatar_url=user.avatar_url,
+                )
+                .execution_options(synchronize_session=False)
+            )
+
         user.updated_at = datetime.utcnow()
         await self.db.commit()
         await self.db.refresh(user)
+        await invalidate_user(user_id)
 
         logger.info(
             "user_profile_updated",
@@ -73,6 +109,7 @@ class UserService:
 
         user.deleted_at = datetime.utcnow()
         await self.db.commit()
+        await invalidate_user(user_id)
 
         logger.info(
             "user_account_deleted",
@@ -80,38 +117,21 @@ class UserService:
             phone=mask_phone(user.phone_number),
         )
 
-    async def get_user_stats(self, user_id: str) -> dict:
-        circles_query = (
-            select(func.count(CircleMembership.id))
-            .where(CircleMembership.user_id == user_id)
-            .join(Circle, Circle.id == CircleMembership.circle_id)
-            .where(Circle.deleted_at.is_(None))
-        )
-        circles_result = await self.db.execute(circles_query)
-        total_circles = circles_result.scalar() or 0
-
-        user_circle_ids_subquery = (
-            select(CircleMembership.circle_id)
-            .where(CircleMembership.user_id == user_id)
-            .subquery()
-        )
-
-        photos_query = select(func.count(Photo.id)).where(
-            Photo.circle_id.in_(select(user_circle_ids_subquery)),
-            Photo.deleted_at.is_(None),
-        )
-        photos_result = await self.db.execute(photos_query)
-        total_photos = photos_result.scalar() or 0
-
-        stories_query = select(func.count(Story.id)).where(
-            Story.circle_id.in_(select(user_circle_ids_subquery)),
-            Story.deleted_at.is_(None),
-        )
-        stories_result = await self.db.execute(stories_query)
-        total_stories = stories_result.scalar() or 0
-
-        user = await self.get_user_by_id(user_id)
-        tier = user.subscription_tier
+    async def get_user_stats(
+        self, user_id: str, subscription_tier: Optional[str] = None
+    ) -> dict:
+        counts = await get_cached_counts(user_id)
+        if counts is None:
+            result = await self.db.execute(_USER_COUNTS_QUERY, {"user_id": user_id})
+            counts = tuple(count or 0 for count in result.one())
+            await cache_counts(user_id, counts)
+        total_circles, total_photos, total_stories = counts
+
+        # Callers holding the user already pass its tier along.
+        tier = subscription_tier
+        if tier is None:
+            user = await self.get_user_by_id(user_id)
+            tier = user.subscription_tier
 
         if tier == SubscriptionTier.FREE.value:
             max_circles = settings.FREE_TIER_MAX_CIRCLES
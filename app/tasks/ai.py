@@ -0,0 +1,74 @@
+from typing import Awaitable, Callable, Optional
+
+import structlog
+from celery import shared_task
+
+from app.core.exceptions import BusinessException
+from app.services.ai_service import AIService
+from app.tasks.transcription import run_async
+
+logger = structlog.get_logger(__name__)
+
+
+async def _run(
+    user_id: str, task_name: str, fn: Callable[[AIService], Awaitable[dict]]
+) -> dict:
+    # run_async gives every task a fresh event loop, so the OpenAI client
+    # can't be shared with other tasks and is created per run.
+    ai_service = AIService()
+
+    try:
+        result = await fn(ai_service)
+    except BusinessException as e:
+        logger.error("ai_task_failed", task=task_name, user_id=user_id, error=e.detail)
+        return {"user_id": user_id, "status": "failed", "error": e.detail}
+
+    return {"user_id": user_id, "status": "success", "result": result}
+
+
+@shared_task
+def enhance_story_task(
+    user_id: str, transcript: str, circle_type: str, context: Optional[str] = None
+) -> dict:
+    async def enhance(ai_service: AIService) -> dict:
+        result = await ai_service.enhance_story_transcript(
+            transcript=transcript,
+            circle_type=circle_type,
+            context=context,
+        )
+        return {
+            "enhanced_text": result["enhanced_text"],
+            "improvements": result.get("improvements", []),
+            "tone": result.get("tone", "netral"),
+            "original_length": len(transcript),
+            "enhanced_length": len(result["enhanced_text"]),
+        }
+
+    return run_async(_run(user_id, "enhance_story", enhance))
+
+
+@shared_task
+def generate_follow_up_task(
+    user_id: str, transcript: str, circle_type: str, count: int = 3
+) -> dict:
+    async def follow_up(ai_service: AIService) -> dict:
+        questions = await ai_service.generate_follow_up_questions(
+            transcript=transcript,
+            circle_type=circle_type,
+            count=count,
+        )
+        return {"questions": questions, "circle_type": circle_type}
+
+    return run_async(_run(user_id, "generate_follow_up", follow_up))
+
+
+@shared_task
+def suggest_title_task(user_id: str, transcript: str, max_length: int = 60) -> dict:
+    async def suggest(ai_service: AIService) -> dict:
+        title = await ai_service.suggest_story_title(
+            transcript=transcript,
+            max_length=max_length,
+        )
+        return {"title": title}
+
+    return run_async(_run(user_id, "suggest_title", suggest))
@@ -9,6 +9,7 @@ celery_app = Celery(
     include=[
         "app.tasks.transcription",
         "app.tasks.notifications",
+        "app.tasks.ai",
     ],
 )
 
@@ -0,0 +1,87 @@
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.api import deps
+from app.api.deps import get_current_active_user, get_current_user, get_optional_user
+from app.core.security import create_access_token
+from app.core.user_cache import _user_cache
+from app.db.models import User
+
+
+@pytest.fixture
+def resolve_calls(monkeypatch):
+    calls = []
+    resolve_user = deps._resolve_user
+
+    async def counting_resolve_user(authorization):
+        calls.append(authorization)
+        return await resolve_user(authorization)
+
+    monkeypatch.setattr(deps, "_resolve_user", counting_resolve_user)
+    return calls
+
+
+@pytest.fixture
+async def client(session_factory):
+    app = FastAPI()
+
+    @app.get("/me")
+    async def me(
+        current_user: User = Depends(get_current_user),
+        active_user: User = Depends(get_current_active_user),
+        optional_user: User | None = Depends(get_optional_user),
+    ) -> dict:
+        return {"ids": [current_user.id, active_user.id, optional_user.id]}
+
+    @app.get("/maybe")
+    async def maybe(
+        first: User | None = Depends(get_optional_user),
+        second: User | None = Depends(get_optional_user),
+    ) -> dict:
+        return {"anonymous": first is None and second is None}
+
+    _user_cache.clear()
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+    _user_cache.clear()
+
+
+@pytest.fixture
+async def user(db_session):
+    user = User(phone_number="+6281400000001")
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+async def test_user_is_resolved_once_per_request(client, user, resolve_calls):
+    token = create_access_token(user.id)
+
+    response = await client.get("/me", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 200
+    assert response.json() == {"ids": [user.id] * 3}
+    assert len(resolve_calls) == 1
+
+    await client.get("/me", headers={"Authorization": f"Bearer {token}"})
+
+    assert len(resolve_calls) == 2
+
+
+async def test_auth_error_is_resolved_once(client, resolve_calls):
+    response = await client.get(
+        "/maybe", headers={"Authorization": "Bearer not-a-token"}
+    )
+
+    assert response.json() == {"anonymous": True}
+    assert len(resolve_calls) == 1
+
+
+async def test_missing_header_skips_resolution(client, resolve_calls):
+    response = await client.get("/me")
+
+    assert response.status_code == 401
+    assert resolve_calls == []
@@ -0,0 +1,107 @@
+import dataclasses
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.api.v1.photos.router import router as photos_router
+from app.api.v1.stories.router import router as stories_router
+from app.core.security import create_access_token
+from app.core.user_cache import _user_cache
+from app.db.models import Circle, CircleMembership, Photo, Story, User
+from app.services import storage_service
+
+
+@pytest.fixture
+async def client(session_factory, monkeypatch):
+    # Static credentials keep URL signing in-process.
+    monkeypatch.setattr(
+        storage_service,
+        "runtime_config",
+        dataclasses.replace(
+            storage_service.runtime_config,
+            AWS_ACCESS_KEY_ID="AKIDEXAMPLE",
+            AWS_SECRET_ACCESS_KEY="secret",
+        ),
+    )
+    app = FastAPI()
+    app.include_router(photos_router, prefix="/photos")
+    app.include_router(stories_router)
+
+    _user_cache.clear()
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+    _user_cache.clear()
+
+
+@pytest.fixture
+async def story(db_session):
+    user = User(phone_number="+6281700000001")
+    circle = Circle(name="Keluarga", type="keluarga")
+    db_session.add_all([user, circle])
+    await db_session.flush()
+
+    photo = Photo(
+        circle_id=circle.id,
+        uploaded_by=user.id,
+        storage_key="photos/a.jpg",
+        caption="Lebaran 1998",
+    )
+    db_session.add_all(
+        [
+            CircleMembership(circle_id=circle.id, user_id=user.id, role="admin"),
+            photo,
+        ]
+    )
+    await db_session.flush()
+
+    story = Story(
+        circle_id=circle.id,
+        photo_id=photo.id,
+        recorded_by=user.id,
+        audio_storage_key="audio/a.m4a",
+    )
+    db_session.add(story)
+    await db_session.commit()
+    return story
+
+
+def _auth(story: Story) -> dict:
+    return {"Authorization": f"Bearer {create_access_token(story.recorded_by)}"}
+
+
+async def test_unchanged_list_returns_304(client, story):
+    params = {"circle_id": story.circle_id}
+    first = await client.get("/stories", params=params, headers=_auth(story))
+
+    second = await client.get(
+        "/stories",
+        params=params,
+        headers={**_auth(story), "If-None-Match": first.headers["etag"]},
+    )
+
+    assert first.status_code == 200
+    assert second.status_code == 304
+
+
+async def test_photo_caption_edit_changes_the_etag(client, story):
+    params = {"circle_id": story.circle_id}
+    before = await client.get("/stories", params=params, headers=_auth(story))
+
+    edit = await client.patch(
+        f"/photos/{story.photo_id}",
+        json={"caption": "Lebaran 1999"},
+        headers=_auth(story),
+    )
+    after = await client.get(
+        "/stories",
+        params=params,
+        headers={**_auth(story), "If-None-Match": before.headers["etag"]},
+    )
+
+    assert edit.status_code == 200
+    assert after.status_code == 200
+    assert after.headers["etag"] != before.headers["etag"]
+    assert after.json()["stories"][0]["photo"]["caption"] == "Lebaran 1999"
@@ -0,0 +1,50 @@
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.api.v1.subscriptions.router import router
+from app.data.subscription_plans import get_all_plans, get_purchasable_plans
+
+
+@pytest.fixture
+async def client():
+    app = FastAPI()
+    app.include_router(router, prefix="/subscriptions")
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+
+
+async def test_plans_are_served_with_an_etag(client):
+    response = await client.get("/subscriptions/plans")
+
+    assert response.status_code == 200
+    assert response.headers["etag"]
+    assert response.headers["cache-control"] == "public, max-age=300"
+    assert [plan["plan_id"] for plan in response.json()] == [
+        plan.plan_id for plan in get_purchasable_plans()
+    ]
+
+
+async def test_matching_etag_returns_304(client):
+    etag = (await client.get("/subscriptions/plans")).headers["etag"]
+
+    response = await client.get("/subscriptions/plans", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+async def test_each_variant_has_its_own_etag(client):
+    purchasable = await client.get("/subscriptions/plans")
+    everything = await client.get(
+        "/subscriptions/plans",
+        params={"include_free": True},
+        headers={"If-None-Match": purchasable.headers["etag"]},
+    )
+
+    assert everything.status_code == 200
+    assert everything.headers["etag"] != purchasable.headers["etag"]
+    assert len(everything.json()) == len(get_all_plans())
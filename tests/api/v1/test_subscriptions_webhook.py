@@ -0,0 +1,111 @@
+import hashlib
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import func, select
+
+from app.api.v1.subscriptions.router import router
+from app.core.config import settings
+from app.db.models import User
+from app.db.models.subscription import Payment, PaymentStatus, PlanId, Subscription
+
+ORDER_ID = "SUB-test-order"
+
+
+def _notification(transaction_status: str = "settlement") -> dict:
+    status_code, gross_amount = "200", "79000.00"
+    signature = hashlib.sha512(
+        (ORDER_ID + status_code + gross_amount + settings.MIDTRANS_SERVER_KEY).encode()
+    ).hexdigest()
+    return {
+        "order_id": ORDER_ID,
+        "transaction_id": "tx-1",
+        "transaction_status": transaction_status,
+        "transaction_time": "2024-01-01 00:00:00",
+        "payment_type": "gopay",
+        "gross_amount": gross_amount,
+        "status_code": status_code,
+        "signature_key": signature,
+    }
+
+
+@pytest.fixture
+async def client(session_factory):
+    app = FastAPI()
+    app.include_router(router, prefix="/subscriptions")
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+
+
+async def _create_payment(session_factory, **values) -> Payment:
+    async with session_factory() as session:
+        user = User(phone_number="+6281300000001")
+        session.add(user)
+        await session.flush()
+        payment = Payment(
+            user_id=user.id,
+            plan_id=PlanId.PLUS.value,
+            amount_idr=79_000,
+            payment_provider_transaction_id=ORDER_ID,
+            **values,
+        )
+        session.add(payment)
+        await session.commit()
+        return payment
+
+
+async def _subscription_count(session_factory) -> int:
+    async with session_factory() as session:
+        return await session.scalar(select(func.count()).select_from(Subscription))
+
+
+async def test_success_notification_activates_once(client, session_factory):
+    payment = await _create_payment(session_factory)
+
+    first = await client.post("/subscriptions/webhooks/midtrans", json=_notification())
+    second = await client.post("/subscriptions/webhooks/midtrans", json=_notification())
+
+    assert first.json()["message"] == "Notifikasi pembayaran berhasil diproses"
+    assert second.json()["message"] == "Pembayaran sudah diproses sebelumnya"
+    assert await _subscription_count(session_factory) == 1
+
+    async with session_factory() as session:
+        stored = await session.get(Payment, payment.id)
+
+    assert stored.status == PaymentStatus.SUCCESS.value
+    assert stored.subscription_id is not None
+
+
+async def test_duplicate_notification_retries_unlinked_payment(client, session_factory):
+    # The payment was marked successful but its activation never landed.
+    payment = await _create_payment(session_factory, status=PaymentStatus.SUCCESS.value)
+
+    response = await client.post(
+        "/subscriptions/webhooks/midtrans", json=_notification()
+    )
+
+    assert response.json()["message"] == "Pembayaran sudah diproses sebelumnya"
+    assert await _subscription_count(session_factory) == 1
+
+    async with session_factory() as session:
+        stored = await session.get(Payment, payment.id)
+
+    assert stored.subscription_id is not None
+
+
+async def test_invalid_signature_leaves_payment_untouched(client, session_factory):
+    payment = await _create_payment(session_factory)
+    body = {**_notification(), "signature_key": "forged"}
+
+    response = await client.post("/subscriptions/webhooks/midtrans", json=body)
+
+    assert response.json()["status"] == "error"
+    assert await _subscription_count(session_factory) == 0
+
+    async with session_factory() as session:
+        stored = await session.get(Payment, payment.id)
+
+    assert stored.status == PaymentStatus.PENDING.value
@@ -0,0 +1,38 @@
+from datetime import datetime, timezone
+
+import pytest
+from starlette.requests import Request
+
+from app.core.responses import is_not_modified, weak_etag
+
+
+def _request(if_none_match=None) -> Request:
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+def test_weak_etag_is_stable_and_sensitive_to_every_part():
+    updated = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    etag = weak_etag("circle", None, 0, 50, 3, updated)
+
+    assert etag.startswith('W/"') and etag.endswith('"')
+    assert weak_etag("circle", None, 0, 50, 3, updated) == etag
+    assert weak_etag("circle", None, 0, 50, 4, updated) != etag
+    assert weak_etag("circle", None, 50, 50, 3, updated) != etag
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, False),
+        ("", False),
+        ('W/"other"', False),
+        ('W/"abc"', True),
+        ('W/"other", W/"abc"', True),
+        ("*", True),
+    ],
+)
+def test_is_not_modified(header, expected):
+    assert is_not_modified(_request(header), 'W/"abc"') is expected
@@ -0,0 +1,73 @@
+import time
+from datetime import timedelta
+
+import jwt
+import pytest
+
+from app.core import security
+from app.core.exceptions import UnauthorizedException
+from app.core.security import (
+    _token_cache,
+    create_access_token,
+    create_refresh_token,
+    decode_token,
+    verify_access_token,
+    verify_refresh_token,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    _token_cache.clear()
+    yield
+    _token_cache.clear()
+
+
+@pytest.fixture
+def jwt_decodes(monkeypatch):
+    calls = []
+    decode = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return decode(*args, **kwargs)
+
+    monkeypatch.setattr(security.jwt, "decode", counting_decode)
+    return calls
+
+
+def test_repeat_tokens_skip_signature_verification(jwt_decodes):
+    token = create_access_token("user-1")
+
+    assert verify_access_token(token) == "user-1"
+    assert verify_access_token(token) == "user-1"
+    assert len(jwt_decodes) == 1
+
+
+def test_token_close_to_expiry_is_verified_again(jwt_decodes):
+    token = create_access_token("user-1", expires_delta=timedelta(seconds=3))
+
+    decode_token(token)
+    decode_token(token)
+
+    assert len(jwt_decodes) == 2
+
+
+def test_cached_payload_still_checks_token_type():
+    token = create_refresh_token("user-1")
+
+    assert verify_refresh_token(token) == "user-1"
+    with pytest.raises(UnauthorizedException):
+        verify_access_token(token)
+
+
+def test_invalid_token_is_not_cached():
+    forged = jwt.encode(
+        {"sub": "user-1", "exp": int(time.time()) + 60, "type": "access"},
+        "some-other-key",
+        algorithm="HS256",
+    )
+
+    with pytest.raises(UnauthorizedException):
+        decode_token(forged)
+    assert len(_token_cache) == 0
@@ -0,0 +1,76 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fakeredis.aioredis import FakeRedis
+
+from app.core import user_cache
+from app.core.user_cache import (
+    _redis_key,
+    _user_cache,
+    get_cached_user,
+    get_shared_user,
+    invalidate_user,
+    share_user,
+)
+from app.db.models import User
+
+
+@pytest.fixture
+async def redis(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(user_cache, "get_redis", lambda: client)
+    _user_cache.clear()
+    yield client
+    _user_cache.clear()
+    await client.aclose()
+
+
+def _user() -> User:
+    return User(
+        id=str(uuid.uuid4()),
+        phone_number="+6281500000001",
+        display_name="Nenek",
+        subscription_tier="plus",
+        created_at=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    )
+
+
+async def test_share_user_fills_both_tiers(redis):
+    user = _user()
+
+    await share_user(user)
+
+    assert get_cached_user(user.id) is user
+    assert await redis.exists(_redis_key(user.id))
+
+
+async def test_shared_user_is_loaded_from_redis_on_a_local_miss(redis):
+    user = _user()
+    await share_user(user)
+    _user_cache.clear()
+
+    loaded = await get_shared_user(user.id)
+
+    assert loaded is not user
+    assert loaded.id == user.id
+    assert loaded.display_name == "Nenek"
+    assert loaded.created_at == user.created_at
+    # The Redis hit is promoted into the per-process cache.
+    assert get_cached_user(user.id) is loaded
+
+
+async def test_invalidate_user_evicts_both_tiers(redis):
+    user = _user()
+    await share_user(user)
+
+    await invalidate_user(user.id)
+
+    assert get_cached_user(user.id) is None
+    assert await get_shared_user(user.id) is None
+
+
+async def test_no_redis_client_is_a_miss(monkeypatch):
+    monkeypatch.setattr(user_cache, "get_redis", lambda: None)
+
+    assert await get_shared_user(str(uuid.uuid4())) is None
@@ -0,0 +1,46 @@
+import uuid
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import DBAPIError
+
+from app.core.exceptions import _is_invalid_uuid
+from app.db.models import Payment, User
+
+
+async def test_flushing_several_new_rows_of_one_table(db_session):
+    users = [User(phone_number="+6281100000001"), User(phone_number="+6281100000002")]
+    db_session.add_all(users)
+    await db_session.commit()
+
+    payments = [Payment(user_id=user.id, amount_idr=49000) for user in users]
+    db_session.add_all(payments)
+    await db_session.commit()
+
+    result = await db_session.execute(select(Payment.id, Payment.user_id))
+    rows = result.all()
+    assert len(rows) == 2
+    for payment_id, user_id in rows:
+        assert isinstance(payment_id, str)
+        assert isinstance(user_id, str)
+        uuid.UUID(payment_id)
+    assert {user_id for _, user_id in rows} == {user.id for user in users}
+
+
+async def test_ids_are_str_and_compare_with_str_parameters(db_session):
+    user = User(phone_number="+6281100000003")
+    db_session.add(user)
+    await db_session.commit()
+
+    found = await db_session.scalar(select(User.id).where(User.id == user.id))
+
+    assert found == user.id
+    assert isinstance(found, str)
+
+
+async def test_malformed_id_still_raises_dbapi_error(db_session):
+    # invalid_id_handler relies on this to answer 404 instead of 500.
+    with pytest.raises(DBAPIError) as exc_info:
+        await db_session.execute(select(User).where(User.id == "not-a-uuid"))
+
+    assert _is_invalid_uuid(exc_info.value)
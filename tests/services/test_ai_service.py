@@ -0,0 +1,17 @@
+import httpx
+from openai import DEFAULT_TIMEOUT
+
+from app.core.config import settings
+from app.services.ai_service import AIService
+
+
+async def test_openai_client_keeps_sdk_timeout_with_shared_http_client(monkeypatch):
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "sk-test")
+    shared = httpx.AsyncClient(timeout=httpx.Timeout(10.0, connect=2.0))
+    try:
+        service = AIService(http_client=shared)
+
+        assert service.client.timeout == DEFAULT_TIMEOUT
+        assert service.client.timeout.read >= 600
+    finally:
+        await shared.aclose()
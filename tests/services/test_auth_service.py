@@ -0,0 +1,90 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fakeredis.aioredis import FakeRedis
+from sqlalchemy import func, select, update
+
+from app.core import user_cache
+from app.core.exceptions import UnauthorizedException
+from app.core.security import create_refresh_token
+from app.db.models import User
+from app.services.auth_service import AuthService
+
+PHONE = "+6281600000001"
+
+
+@pytest.fixture(autouse=True)
+async def redis(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(user_cache, "get_redis", lambda: client)
+    yield client
+    await client.aclose()
+
+
+async def _user_count(session) -> int:
+    return await session.scalar(select(func.count()).select_from(User))
+
+
+async def test_first_login_registers_the_user(db_session):
+    user, is_new_user = await AuthService(db_session).create_or_get_user(PHONE)
+
+    assert is_new_user is True
+    assert user.phone_verified is True
+    assert user.last_active_at is not None
+    assert await _user_count(db_session) == 1
+
+
+async def test_repeat_login_returns_the_existing_user(session_factory):
+    async with session_factory() as session:
+        first, _ = await AuthService(session).create_or_get_user(PHONE)
+
+    async with session_factory() as session:
+        second, is_new_user = await AuthService(session).create_or_get_user(PHONE)
+        count = await _user_count(session)
+
+    assert is_new_user is False
+    assert second.id == first.id
+    assert count == 1
+
+
+async def test_soft_deleted_number_cannot_log_in(db_session):
+    db_session.add(User(phone_number=PHONE, deleted_at=datetime.now(timezone.utc)))
+    await db_session.commit()
+
+    with pytest.raises(UnauthorizedException):
+        await AuthService(db_session).create_or_get_user(PHONE)
+
+
+async def test_last_active_is_written_at_most_once_per_window(db_session):
+    user = User(phone_number=PHONE)
+    db_session.add(user)
+    await db_session.commit()
+    service = AuthService(db_session)
+
+    assert await service._touch_last_active(user.id) is True
+    assert await service._touch_last_active(user.id) is False
+
+    await db_session.execute(
+        update(User)
+        .where(User.id == user.id)
+        .values(last_active_at=func.now() - timedelta(minutes=6))
+    )
+    await db_session.commit()
+
+    assert await service._touch_last_active(user.id) is True
+
+
+async def test_refresh_within_the_window_still_checks_the_user(db_session):
+    user = User(phone_number=PHONE, last_active_at=datetime.now(timezone.utc))
+    db_session.add(user)
+    await db_session.commit()
+    service = AuthService(db_session)
+
+    access_token, _, _ = await service.refresh_access_token(
+        create_refresh_token(user.id)
+    )
+    assert access_token
+
+    with pytest.raises(UnauthorizedException):
+        await service.refresh_access_token(create_refresh_token(str(uuid.uuid4())))
@@ -0,0 +1,90 @@
+import dataclasses
+import datetime as _datetime
+import types
+from urllib.parse import parse_qs, quote, urlsplit
+
+import botocore.auth
+import pytest
+from botocore.auth import S3SigV4QueryAuth
+from botocore.awsrequest import AWSRequest
+from botocore.credentials import Credentials
+
+from app.services import storage_service
+from app.services.storage_service import StorageService, _download_url_cache
+
+ACCESS_KEY = "AKIDEXAMPLE"
+SECRET_KEY = "wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY"
+REGION = "ap-southeast-3"
+BUCKET = "kenang-test"
+# Start of a signing bucket, so the fast path signs at exactly this instant.
+NOW = 1_704_067_200
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(
+        storage_service,
+        "runtime_config",
+        dataclasses.replace(
+            storage_service.runtime_config,
+            AWS_ACCESS_KEY_ID=ACCESS_KEY,
+            AWS_SECRET_ACCESS_KEY=SECRET_KEY,
+            AWS_REGION=REGION,
+        ),
+    )
+    monkeypatch.setattr(storage_service.time, "time", lambda: NOW)
+    _download_url_cache.clear()
+
+    service = StorageService()
+    service.bucket_name = BUCKET
+    yield service
+    _download_url_cache.clear()
+
+
+def _botocore_url(monkeypatch, storage_key: str, expires_in: int) -> str:
+    signed_at = _datetime.datetime.utcfromtimestamp(NOW)
+    frozen = types.SimpleNamespace(
+        datetime=types.SimpleNamespace(utcnow=lambda: signed_at)
+    )
+    monkeypatch.setattr(botocore.auth, "datetime", frozen)
+
+    host = f"{BUCKET}.s3.{REGION}.amazonaws.com"
+    request = AWSRequest(method="GET", url=f"https://{host}/{quote(storage_key)}")
+    auth = S3SigV4QueryAuth(
+        Credentials(ACCESS_KEY, SECRET_KEY), "s3", REGION, expires=expires_in
+    )
+    auth.add_auth(request)
+    return request.url
+
+
+@pytest.mark.parametrize(
+    "storage_key",
+    ["photos/abc.jpg", "audio/2024/cerita nenek (1).m4a"],
+)
+async def test_fast_presign_matches_botocore(service, monkeypatch, storage_key):
+    url = await service.generate_download_url_fast(storage_key, 3600)
+    expected = _botocore_url(monkeypatch, storage_key, 3600)
+
+    ours, theirs = urlsplit(url), urlsplit(expected)
+    assert (ours.scheme, ours.netloc, ours.path) == (
+        theirs.scheme,
+        theirs.netloc,
+        theirs.path,
+    )
+    assert parse_qs(ours.query) == parse_qs(theirs.query)
+
+
+async def test_urls_are_reused_within_a_bucket(service):
+    first = await service.generate_download_url_fast("photos/abc.jpg")
+    second = await service.generate_download_url_fast("photos/abc.jpg")
+
+    assert first is second
+
+
+async def test_batch_signs_each_distinct_key_once(service):
+    urls = await service.generate_download_urls(
+        ["photos/a.jpg", None, "photos/b.jpg", "photos/a.jpg"]
+    )
+
+    assert list(urls) == ["photos/a.jpg", "photos/b.jpg"]
+    assert urls["photos/a.jpg"] != urls["photos/b.jpg"]
@@ -0,0 +1,46 @@
+import pytest
+
+from app.core.exceptions import ForbiddenException
+from app.db.models import Circle, CircleMembership, Story, User
+from app.services.story_service import StoryService
+
+
+@pytest.fixture
+async def circle(db_session):
+    member = User(phone_number="+6281800000001")
+    circle = Circle(name="Keluarga", type="keluarga")
+    db_session.add_all([member, circle])
+    await db_session.flush()
+
+    db_session.add_all(
+        [
+            CircleMembership(circle_id=circle.id, user_id=member.id),
+            Story(circle_id=circle.id, recorded_by=member.id),
+        ]
+    )
+    await db_session.commit()
+    return circle, member
+
+
+async def test_story_page_checks_membership(db_session, circle):
+    circle, _ = circle
+    outsider = User(phone_number="+6281800000002")
+    db_session.add(outsider)
+    await db_session.commit()
+
+    with pytest.raises(ForbiddenException):
+        await StoryService(db_session).list_story_page(circle.id, outsider.id)
+
+
+async def test_summary_and_page_for_a_member(db_session, circle):
+    circle, member = circle
+    service = StoryService(db_session)
+
+    total, stories_updated, photos_updated = await service.summarize_stories(
+        circle.id, member.id
+    )
+    stories = await service.list_story_page(circle.id, member.id)
+
+    assert total == len(stories) == 1
+    assert stories_updated is not None
+    assert photos_updated is None
@@ -0,0 +1,72 @@
+import asyncio
+
+from sqlalchemy import func, select
+
+from app.db.models import SubscriptionTier, User
+from app.db.models.subscription import (
+    Payment,
+    PaymentStatus,
+    PlanId,
+    Subscription,
+    SubscriptionStatus,
+)
+from app.services.subscription_service import SubscriptionService
+
+
+async def _paid_payment(session) -> Payment:
+    user = User(phone_number="+6281200000001")
+    session.add(user)
+    await session.flush()
+
+    payment = Payment(
+        user_id=user.id,
+        plan_id=PlanId.PLUS.value,
+        amount_idr=79_000,
+        status=PaymentStatus.SUCCESS.value,
+    )
+    session.add(payment)
+    await session.commit()
+    return payment
+
+
+async def test_activation_links_payment_in_the_same_commit(session_factory):
+    async with session_factory() as session:
+        payment = await _paid_payment(session)
+
+    async with session_factory() as session:
+        subscription = await SubscriptionService(session).activate_from_payment(
+            payment.id, PlanId.PLUS.value
+        )
+
+    assert subscription is not None
+    assert subscription.status == SubscriptionStatus.ACTIVE.value
+
+    async with session_factory() as session:
+        stored = await session.get(Payment, payment.id)
+        user = await session.get(User, payment.user_id)
+
+    assert stored.subscription_id == subscription.id
+    assert user.subscription_tier == SubscriptionTier.PLUS.value
+
+
+async def test_activation_is_a_no_op_once_linked(session_factory):
+    async with session_factory() as session:
+        payment = await _paid_payment(session)
+
+    async def activate():
+        async with session_factory() as session:
+            return await SubscriptionService(session).activate_from_payment(
+                payment.id, PlanId.PLUS.value
+            )
+
+    # Concurrent deliveries serialize on the payment row lock.
+    results = await asyncio.gather(activate(), activate())
+    again = await activate()
+
+    assert sum(result is not None for result in results) == 1
+    assert again is None
+
+    async with session_factory() as session:
+        count = await session.scalar(select(func.count()).select_from(Subscription))
+
+    assert count == 1